@@ -16,6 +16,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Préchargement en arrière-plan des modules des pages (une fois par processus)
+from src.warmup import start_warmup, warmup_status
+start_warmup(ROOT)
+
 # Titre principal
 st.title("📈 Application de Prévision des Séries Temporelles")
 st.markdown("---")
@@ -66,6 +70,13 @@ with st.expander("🔍 Vérification du système", expanded=False):
     else:
         st.warning("⚠️ Dossier 'src' non trouvé")
 
+    # Préchauffage des modules
+    status = warmup_status()
+    st.write(f"- Préchargement des modules : {status['etat']} "
+             f"({status['modules']} modules" + (f", {status['duree_s']} s)" if status['duree_s'] else ")"))
+    for module, error in status["erreurs"].items():
+        st.write(f"  • ⚠️ {module} : {error}")
+
 # Message de navigation
 st.sidebar.success("⬅️ Sélectionnez une page dans la sidebar pour commencer l'analyse.")
 
@@ -0,0 +1,344 @@
+import importlib
+import inspect
+import io
+import os
+import pkgutil
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import DEFAULT_PERIOD, generate_panel
+
+# Cas de benchmark : une entrée par fonction (ou méthode) publique de
+# src/data, src/exploration et src/models. Chaque cas construit, hors
+# chronométrage, un appel sans argument à partir de la série générée.
+# max_n borne la taille pour les calculs quadratiques ou les boucles Python ;
+# complete=True : les trous sont interpolés (statsmodels, récurrences :
+# l'index reste régulier, comme après le nettoyage de la page 1).
+
+PACKAGES = ("src.data", "src.exploration", "src.models")
+
+P = DEFAULT_PERIOD
+SMALL_GRID = (0.2, 0.5, 0.8)
+HW_PARAMS = {"model": "HW Additif", "alpha": 0.3, "beta": 0.1, "gamma": 0.2, "seasonal_periods": P}
+
+
+class Case:
+    def __init__(self, name, build, max_n=10**7, complete=False):
+        self.name = name
+        self.build = build
+        self.max_n = max_n
+        self.complete = complete
+
+    def prepare(self, series, fixtures):
+        """
+        Appel à chronométrer pour cette série (préparation non chronométrée).
+        """
+        if self.complete:
+            series = fixtures.complete()
+        return self.build(series, fixtures)
+
+
+class Fixtures:
+    """
+    Données dérivées d'une série (fichier CSV, colonnes texte, état ajusté...),
+    construites à la demande et partagées par les cas d'une même série.
+    """
+
+    def __init__(self, series, workdir):
+        self.series = series
+        self.workdir = workdir
+        self._items = {}
+
+    def _get(self, key, make):
+        if key not in self._items:
+            self._items[key] = make()
+        return self._items[key]
+
+    def raw_frame(self):
+        """
+        Colonnes texte comme à l'import (dates jj/mm/aaaa, virgules décimales).
+        """
+        def make():
+            s = self.series
+            values = pd.Series(s.to_numpy()).map(lambda v: "" if np.isnan(v) else f"{v:.4f}".replace(".", ","))
+            return pd.DataFrame({"date": s.index.strftime("%d/%m/%Y %H:%M"), "valeur": values})
+        return self._get("raw", make)
+
+    def csv(self):
+        def make():
+            path = os.path.join(self.workdir, f"{self.series.name}_{len(self.series)}.csv")
+            pd.DataFrame({"date": self.series.index, "valeur": self.series.to_numpy()}).to_csv(path, index=False)
+            return path
+        return self._get("csv", make)
+
+    def complete(self):
+        return self._get("complete", lambda: self.series.interpolate(limit_direction="both"))
+
+    def state(self):
+        from src.models.model_state import SmoothingState
+        return self._get("state", lambda: SmoothingState.fit(self.complete(), **HW_PARAMS))
+
+    def statsmodels_fit(self):
+        from src.models.smoothing_manual import fit_smoothing
+        return self._get("fit", lambda: fit_smoothing(self.complete(), **HW_PARAMS))
+
+    def panel(self):
+        return self._get("panel", lambda: generate_panel(self.series.name, len(self.series)))
+
+
+def _render(fig):
+    fig.savefig(io.BytesIO(), format="png")
+
+
+def _graph(series):
+    from src.exploration.graph import AnalysisGraph
+    # Empreinte fixée : on mesure le nœud, pas le hachage de la série
+    return AnalysisGraph(series, fingerprint="benchmark")
+
+
+def _sketch(series):
+    from src.exploration.streaming import QuantileSketch
+    return QuantileSketch().update(series.dropna().to_numpy())
+
+
+def _stats(series):
+    from src.exploration.streaming import StreamingStats
+    return StreamingStats().update(series.to_numpy())
+
+
+def _halves(series, make):
+    half = len(series) // 2
+    return make(series.iloc[:half]), make(series.iloc[half:])
+
+
+def _cases():
+    from src.data import fingerprint, loader
+    from src.exploration import (analysis, decomposition, graph, rolling, spectral, stationarity,
+                                 streaming, test_saison)
+    from src.models import (bootstrap, evaluation, grid_search, model_state, moving_average,
+                            simple_models, smoothing_manual, smoothing_native)
+
+    SmoothingState = model_state.SmoothingState
+    holt = partial(smoothing_manual.smoothing_fit_forecast, model="Holt")
+
+    return [
+        # ---------------- src/data
+        Case("fingerprint.series_fingerprint", lambda s, f: partial(fingerprint.series_fingerprint, s)),
+        Case("fingerprint.params_fingerprint",
+             lambda s, f: partial(fingerprint.params_fingerprint, "HW Additif", 0.3, 0.1, 0.2, P), max_n=10**2),
+        Case("loader.read_table", lambda s, f: partial(loader.read_table, f.csv()), max_n=10**6),
+        Case("loader.clean_numeric_column",
+             lambda s, f: partial(loader.clean_numeric_column, f.raw_frame()["valeur"]), max_n=10**6),
+        Case("loader.parse_dates", lambda s, f: partial(loader.parse_dates, f.raw_frame()["date"]), max_n=10**6),
+        Case("loader.clean_series",
+             lambda s, f: partial(loader.clean_series, f.raw_frame(), "date", "valeur"), max_n=10**6),
+        Case("loader.load_time_series", lambda s, f: partial(loader.load_time_series, f.csv()), max_n=10**6),
+
+        # ---------------- src/exploration
+        Case("analysis.describe_series", lambda s, f: partial(analysis.describe_series, s)),
+        Case("analysis.plot_series", lambda s, f: lambda: _render(analysis.plot_series(s)), max_n=10**6),
+        Case("decomposition.decomposition_additive",
+             lambda s, f: partial(decomposition.decomposition_additive, s, P)),
+        Case("decomposition.decomposition_multiplicative",
+             lambda s, f: partial(decomposition.decomposition_multiplicative, s, P)),
+        Case("decomposition.plot_decomposition",
+             lambda s, f: lambda: _render(decomposition.plot_decomposition(
+                 s, *decomposition.decomposition_additive(s, P))), max_n=10**5),
+
+        Case("graph.AnalysisGraph.cached_nodes", lambda s, f: _graph(s).cached_nodes, max_n=10**2),
+        Case("graph.AnalysisGraph.describe", lambda s, f: lambda: _graph(s).describe()),
+        Case("graph.AnalysisGraph.stationarity", lambda s, f: lambda: _graph(s).stationarity(),
+             max_n=10**5, complete=True),
+        Case("graph.AnalysisGraph.trend", lambda s, f: lambda: _graph(s).trend(P)),
+        Case("graph.AnalysisGraph.seasonal", lambda s, f: lambda: _graph(s).seasonal(P)),
+        Case("graph.AnalysisGraph.seasonal_index", lambda s, f: lambda: _graph(s).seasonal_index(P)),
+        Case("graph.AnalysisGraph.residuals", lambda s, f: lambda: _graph(s).residuals(P)),
+        Case("graph.AnalysisGraph.decomposition", lambda s, f: lambda: _graph(s).decomposition(P)),
+        Case("graph.AnalysisGraph.group_stats", lambda s, f: lambda: _graph(s).group_stats(P)),
+        Case("graph.AnalysisGraph.seasonal_test", lambda s, f: lambda: _graph(s).seasonal_test(P)),
+        Case("graph.AnalysisGraph.acf", lambda s, f: lambda: _graph(s).acf(4 * P)),
+        Case("graph.AnalysisGraph.pacf", lambda s, f: lambda: _graph(s).pacf(4 * P)),
+        Case("graph.AnalysisGraph.periods", lambda s, f: lambda: _graph(s).periods(), max_n=10**6),
+        Case("graph.AnalysisGraph.period", lambda s, f: lambda: _graph(s).period(), max_n=10**6),
+        Case("graph.get_analysis_graph", lambda s, f: lambda: graph.get_analysis_graph(s, {})),
+
+        Case("rolling.rolling_statistics", lambda s, f: partial(rolling.rolling_statistics, s)),
+        Case("rolling.hampel_filter", lambda s, f: partial(rolling.hampel_filter, s), max_n=10**6),
+        Case("rolling.outlier_flags", lambda s, f: partial(rolling.outlier_flags, s), max_n=10**6),
+
+        Case("spectral.acf_fft", lambda s, f: partial(spectral.acf_fft, s, 4 * P)),
+        Case("spectral.pacf_levinson", lambda s, f: partial(spectral.pacf_levinson, s, 4 * P)),
+        Case("spectral.periodogram", lambda s, f: partial(spectral.periodogram, s)),
+        Case("spectral.detect_periods", lambda s, f: partial(spectral.detect_periods, s), max_n=10**6),
+        Case("spectral.detect_seasonal_period",
+             lambda s, f: partial(spectral.detect_seasonal_period, s), max_n=10**6),
+
+        Case("stationarity.adf_test", lambda s, f: partial(stationarity.adf_test, s), max_n=10**5, complete=True),
+        Case("stationarity.kpss_test", lambda s, f: partial(stationarity.kpss_test, s), max_n=10**5, complete=True),
+
+        Case("streaming.QuantileSketch.update", lambda s, f: lambda: _sketch(s)),
+        Case("streaming.QuantileSketch.merge",
+             lambda s, f: partial(lambda a, b: a.merge(b), *_halves(s, _sketch))),
+        Case("streaming.QuantileSketch.quantile", lambda s, f: partial(_sketch(s).quantile, 0.95)),
+        Case("streaming.StreamingStats.update", lambda s, f: lambda: _stats(s)),
+        Case("streaming.StreamingStats.merge",
+             lambda s, f: partial(lambda a, b: a.merge(b), *_halves(s, _stats))),
+        Case("streaming.StreamingStats.variance", lambda s, f: partial(getattr, _stats(s), "variance"), max_n=10**2),
+        Case("streaming.StreamingStats.std", lambda s, f: partial(getattr, _stats(s), "std"), max_n=10**2),
+        Case("streaming.StreamingStats.skewness", lambda s, f: partial(getattr, _stats(s), "skewness"), max_n=10**2),
+        Case("streaming.StreamingStats.kurtosis", lambda s, f: partial(getattr, _stats(s), "kurtosis"), max_n=10**2),
+        Case("streaming.StreamingStats.quantile", lambda s, f: partial(_stats(s).quantile, 0.95)),
+        Case("streaming.StreamingStats.describe", lambda s, f: _stats(s).describe),
+        Case("streaming.stream_csv_stats",
+             lambda s, f: partial(streaming.stream_csv_stats, f.csv(), "valeur"), max_n=10**6),
+        Case("streaming.panel_stats", lambda s, f: partial(streaming.panel_stats, f.panel()), max_n=10**6),
+        Case("streaming.describe_panel", lambda s, f: partial(streaming.describe_panel, f.panel()), max_n=10**6),
+
+        Case("test_saison.seasonal_group_stats",
+             lambda s, f: partial(test_saison.seasonal_group_stats, s.to_numpy(), P)),
+        Case("test_saison.test_additive_vs_multiplicative",
+             lambda s, f: partial(test_saison.test_additive_vs_multiplicative, s, P)),
+        Case("test_saison.additive_vs_multiplicative_panel",
+             lambda s, f: partial(test_saison.additive_vs_multiplicative_panel, f.panel(), P), max_n=10**6),
+
+        # ---------------- src/models
+        Case("bootstrap.bootstrap_forecast",
+             lambda s, f: partial(bootstrap.bootstrap_forecast, s,
+                                  partial(smoothing_manual.smoothing_fit_forecast, **HW_PARAMS), P, B=300),
+             max_n=10**5, complete=True),
+
+        Case("evaluation.time_series_train_test_split",
+             lambda s, f: partial(evaluation.time_series_train_test_split, s, P)),
+        Case("evaluation.compute_aicc", lambda s, f: partial(evaluation.compute_aicc, 120.0, len(s), 3), max_n=10**2),
+        Case("evaluation.compute_metrics",
+             lambda s, f: partial(evaluation.compute_metrics, s.iloc[1:], s.shift(1).iloc[1:]), complete=True),
+        Case("evaluation.time_series_split", lambda s, f: partial(evaluation.time_series_split, s)),
+        Case("evaluation.rolling_origin_validation",
+             lambda s, f: partial(evaluation.rolling_origin_validation, s), max_n=10**4),
+
+        Case("grid_search.grid_search_holt",
+             lambda s, f: partial(grid_search.grid_search_holt, s, SMALL_GRID, SMALL_GRID, P,
+                                  lambda train, a, b, h: holt(train, h, alpha=a, beta=b)),
+             max_n=10**3, complete=True),
+        Case("grid_search.grid_search_smoothing",
+             lambda s, f: partial(grid_search.grid_search_smoothing, s, P,
+                                  alphas=SMALL_GRID, betas=SMALL_GRID, gammas=SMALL_GRID),
+             max_n=10**3, complete=True),
+
+        Case("model_state.SmoothingState.fit",
+             lambda s, f: partial(SmoothingState.fit, s, **HW_PARAMS), max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.from_statsmodels",
+             lambda s, f: partial(SmoothingState.from_statsmodels, f.statsmodels_fit(), "HW Additif", s),
+             max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.fitted_values",
+             lambda s, f: partial(f.state().fitted_values, s), max_n=10**6, complete=True),
+        Case("model_state.SmoothingState.residuals",
+             lambda s, f: partial(f.state().residuals, s), max_n=10**6, complete=True),
+        Case("model_state.SmoothingState.update",
+             lambda s, f: lambda: SmoothingState.from_bytes(f.state().to_bytes()).update(s.iloc[-P:]),
+             max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.forecast",
+             lambda s, f: partial(f.state().forecast, P), max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.n_params", lambda s, f: lambda: f.state().n_params,
+             max_n=10**2, complete=True),
+        Case("model_state.SmoothingState.mse", lambda s, f: lambda: f.state().mse, max_n=10**2, complete=True),
+        Case("model_state.SmoothingState.to_bytes", lambda s, f: f.state().to_bytes, max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.from_bytes",
+             lambda s, f: partial(SmoothingState.from_bytes, f.state().to_bytes()), max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.save",
+             lambda s, f: partial(f.state().save, os.path.join(f.workdir, "etat.bin")), max_n=10**5, complete=True),
+        Case("model_state.SmoothingState.load",
+             lambda s, f: partial(SmoothingState.load, _saved_state(f)), max_n=10**5, complete=True),
+
+        Case("moving_average.moving_average_odd", lambda s, f: partial(moving_average.moving_average_odd, s, 5)),
+        Case("moving_average.moving_average_even", lambda s, f: partial(moving_average.moving_average_even, s, P)),
+        Case("moving_average.moving_average_p", lambda s, f: partial(moving_average.moving_average_p, s, P)),
+        Case("moving_average.extract_trend", lambda s, f: partial(moving_average.extract_trend, s, P)),
+        Case("moving_average.seasonal_indices",
+             lambda s, f: partial(moving_average.seasonal_indices, s - moving_average.extract_trend(s, P), P)),
+        Case("moving_average.extract_seasonality_additive",
+             lambda s, f: partial(moving_average.extract_seasonality_additive, s,
+                                  moving_average.extract_trend(s, P), P)),
+        Case("moving_average.extract_seasonality_multiplicative",
+             lambda s, f: partial(moving_average.extract_seasonality_multiplicative, s,
+                                  moving_average.extract_trend(s, P), P)),
+
+        Case("simple_models.moving_average", lambda s, f: partial(simple_models.moving_average, s)),
+        Case("simple_models.linear_regression_forecast",
+             lambda s, f: partial(simple_models.linear_regression_forecast, s), complete=True),
+
+        Case("smoothing_manual.ses_forecast",
+             lambda s, f: partial(smoothing_manual.ses_forecast, s, 0.3, P), max_n=10**5, complete=True),
+        Case("smoothing_manual.holt_forecast",
+             lambda s, f: partial(smoothing_manual.holt_forecast, s, 0.3, 0.1, P), max_n=10**5, complete=True),
+        Case("smoothing_manual.holt_winters_additive_forecast",
+             lambda s, f: partial(smoothing_manual.holt_winters_additive_forecast, s, 0.3, 0.1, 0.2, P, P),
+             max_n=10**5, complete=True),
+        Case("smoothing_manual.holt_winters_multiplicative_forecast",
+             lambda s, f: partial(smoothing_manual.holt_winters_multiplicative_forecast, s, 0.3, 0.1, 0.2, P, P),
+             max_n=10**5, complete=True),
+        Case("smoothing_manual.fit_smoothing",
+             lambda s, f: partial(smoothing_manual.fit_smoothing, s, **HW_PARAMS), max_n=10**5, complete=True),
+        Case("smoothing_manual.smoothing_fit_forecast",
+             lambda s, f: partial(smoothing_manual.smoothing_fit_forecast, s, P, **HW_PARAMS),
+             max_n=10**5, complete=True),
+
+        Case("smoothing_native.initial_values",
+             lambda s, f: partial(smoothing_native.initial_values, s.to_numpy(), "HW Additif", P), complete=True),
+        Case("smoothing_native.fit_native",
+             lambda s, f: partial(smoothing_native.fit_native, s, **HW_PARAMS), max_n=10**6, complete=True),
+        Case("smoothing_native.NativeFit.resid",
+             lambda s, f: partial(getattr, smoothing_native.fit_native(s, **HW_PARAMS), "resid"),
+             max_n=10**6, complete=True),
+        Case("smoothing_native.NativeFit.n_params",
+             lambda s, f: partial(getattr, smoothing_native.fit_native(s, **HW_PARAMS), "n_params"),
+             max_n=10**2, complete=True),
+        Case("smoothing_native.NativeFit.forecast",
+             lambda s, f: partial(smoothing_native.fit_native(s, **HW_PARAMS).forecast, P),
+             max_n=10**5, complete=True),
+    ]
+
+
+def _saved_state(fixtures):
+    path = os.path.join(fixtures.workdir, "etat_lu.bin")
+    fixtures.state().save(path)
+    return path
+
+
+def all_cases():
+    return _cases()
+
+
+# --------------------------------------------------------
+# Couverture de l'API publique
+# --------------------------------------------------------
+
+def public_api(packages=PACKAGES):
+    """
+    Fonctions et méthodes publiques définies dans les paquets
+    (« module.fonction » ou « module.Classe.méthode »).
+    """
+    names = []
+    for package in packages:
+        pkg = importlib.import_module(package)
+        for info in pkgutil.iter_modules(pkg.__path__):
+            module = importlib.import_module(f"{package}.{info.name}")
+            for name, obj in vars(module).items():
+                if name.startswith("_") or getattr(obj, "__module__", None) != module.__name__:
+                    continue
+                if inspect.isfunction(obj):
+                    names.append(f"{info.name}.{name}")
+                elif inspect.isclass(obj):
+                    names.extend(
+                        f"{info.name}.{name}.{attr}" for attr, member in vars(obj).items()
+                        if not attr.startswith("_")
+                        and (inspect.isfunction(member) or isinstance(member, (classmethod, staticmethod, property)))
+                    )
+    return sorted(names)
+
+
+def uncovered(cases=None):
+    covered = {case.name for case in cases or all_cases()}
+    return [name for name in public_api() if name not in covered]
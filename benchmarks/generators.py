@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+# Séries synthétiques reproductibles pour les benchmarks.
+# Même (type, taille, graine) → même série, quelle que soit la machine.
+
+KINDS = ("trend", "seasonal", "multiplicative", "noisy", "gappy")
+
+DEFAULT_PERIOD = 12
+DEFAULT_SIZES = (10**2, 10**3, 10**4, 10**5)
+ALL_SIZES = tuple(10**k for k in range(2, 8))
+
+
+def _index(n):
+    """
+    Index de dates compatible avec la taille (les bornes de Timestamp
+    interdisent 10⁷ mois ou jours).
+    """
+    freq = "MS" if n <= 1_000 else "D" if n <= 100_000 else "min"
+    return pd.date_range("2000-01-01", periods=n, freq=freq)
+
+
+def generate(kind, n, seed=0, period=DEFAULT_PERIOD):
+    """
+    Série de n points :
+    trend          : niveau + pente + bruit gaussien
+    seasonal       : tendance + saison additive (sinus de période period)
+    multiplicative : saison dont l'amplitude suit le niveau (strictement positive)
+    noisy          : saison additive + bruit de Student (ddl 3) et 1 % de pics
+    gappy          : saison additive avec ~10 % de valeurs manquantes par plages
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Type de série inconnu : {kind}")
+
+    rng = np.random.default_rng([seed, KINDS.index(kind), n])
+    t = np.arange(n, dtype=float)
+    season = np.sin(2 * np.pi * t / period)
+    level = 100 + 10 * t / max(n, 1)
+
+    if kind == "trend":
+        y = level + rng.normal(0, 1, n)
+    elif kind == "seasonal":
+        y = level + 5 * season + rng.normal(0, 1, n)
+    elif kind == "multiplicative":
+        y = level * (1 + 0.2 * season) * np.exp(rng.normal(0, 0.02, n))
+    elif kind == "noisy":
+        y = level + 5 * season + 2 * rng.standard_t(3, n)
+        spikes = rng.random(n) < 0.01
+        y[spikes] += rng.choice([-1, 1], spikes.sum()) * 30
+    else:
+        y = level + 5 * season + rng.normal(0, 1, n)
+        # Plages manquantes (longueur 1 à 2 périodes) jusqu'à ~10 % de la série
+        n_gaps = max(n // (10 * period), 1)
+        starts = rng.integers(0, n, n_gaps)
+        lengths = rng.integers(1, 2 * period + 1, n_gaps)
+        for s, length in zip(starts, lengths):
+            y[s:s + length] = np.nan
+
+    return pd.Series(y, index=_index(n), name=kind)
+
+
+def generate_panel(kind, n, k=10, seed=0, period=DEFAULT_PERIOD):
+    """
+    Panel de k séries du même type (une par colonne, graines successives).
+    """
+    return pd.DataFrame({f"{kind}_{i}": generate(kind, n, seed + i, period).to_numpy() for i in range(k)},
+                        index=_index(n))
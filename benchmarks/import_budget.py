@@ -0,0 +1,117 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+# Contrôle du temps d'import au démarrage (python -X importtime).
+# Pour chaque script (accueil + pages), les imports de premier niveau sont
+# rejoués dans un interpréteur neuf ; le temps cumulé doit rester sous le
+# budget et aucun module lourd ne doit être chargé à l'ouverture.
+#
+#   python benchmarks/import_budget.py            (code de sortie 1 si dépassement)
+#   python benchmarks/import_budget.py --budget-ms 1500 --verbose
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# streamlit est déjà chargé par le serveur : seul le coût propre aux pages compte
+IGNORED = ("streamlit",)
+
+# Modules dont le chargement doit être différé jusqu'au calcul qui en a besoin
+HEAVY_MODULES = ("statsmodels", "sklearn", "scipy.stats", "seaborn", "plotly", "webview")
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def startup_scripts(root=ROOT):
+    pages = os.path.join(root, "pages")
+    scripts = [os.path.join(root, "app.py")]
+    scripts += sorted(os.path.join(pages, f) for f in os.listdir(pages) if f.endswith(".py"))
+    return scripts
+
+
+def top_level_imports(path):
+    """
+    Instructions import exécutées à l'ouverture du script (niveau module,
+    hors fonctions et branches), sauf les modules ignorés.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    lines = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [a for a in node.names if a.name.split(".")[0] not in IGNORED]
+            if names:
+                lines.append(ast.unparse(ast.Import(names=names)))
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            if node.module.split(".")[0] not in IGNORED:
+                lines.append(ast.unparse(node))
+    return lines
+
+
+def measure(lines, root=ROOT):
+    """
+    Rejoue les imports avec -X importtime.
+    Retourne (temps cumulé en ms, {module : ms}) pour les imports de premier niveau.
+    """
+    code = f"import sys; sys.path.insert(0, {root!r})\n" + "\n".join(lines)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    modules = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative) / 1000
+        if not name[1:].startswith(" "):    # niveau 0 : pas d'indentation
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def check(scripts=None, budget_ms=DEFAULT_BUDGET_MS, verbose=False):
+    """
+    Liste des problèmes (budget dépassé, module lourd chargé au démarrage).
+    """
+    problems = []
+    for path in scripts or startup_scripts():
+        name = os.path.relpath(path, ROOT)
+        total_ms, modules = measure(top_level_imports(path))
+        heavy = sorted(m for m in modules if m.startswith(HEAVY_MODULES))
+
+        print(f"{name:45s} {total_ms:8.0f} ms")
+        if verbose:
+            slowest = sorted(modules.items(), key=lambda kv: -kv[1])[:5]
+            for module, ms in slowest:
+                print(f"    {module:40s} {ms:8.0f} ms")
+
+        if total_ms > budget_ms:
+            problems.append(f"{name} : {total_ms:.0f} ms > budget {budget_ms} ms")
+        if heavy:
+            problems.append(f"{name} : importé au démarrage : {', '.join(heavy[:5])}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Budget de temps d'import des pages Streamlit.")
+    parser.add_argument("scripts", nargs="*", help="Scripts à contrôler (défaut : app.py + pages/)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--verbose", action="store_true", help="Modules les plus lents par script")
+    args = parser.parse_args(argv)
+
+    problems = check(args.scripts or None, args.budget_ms, args.verbose)
+    for p in problems:
+        print(f"❌ {p}")
+    if not problems:
+        print("✅ Imports de démarrage dans le budget")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import KINDS, generate
+
+# Parité du moteur natif (src/models/smoothing_native.py) avec statsmodels :
+# mêmes séries, mêmes paramètres, écarts maximaux sur les valeurs ajustées,
+# la SSE, l'AIC / AICc / BIC et les prévisions, et accélération obtenue.
+# Code de sortie 1 si un écart dépasse la tolérance (ou si un seul des deux
+# moteurs échoue) : le moteur natif ne doit être activé que si tout passe.
+#
+#   python benchmarks/parity.py          (ou python -m benchmarks.parity)
+#   python benchmarks/parity.py --grid 0.05 0.3 0.6 0.95 --json output/parite.json
+
+DEFAULT_GRID = (0.1, 0.5, 0.9)
+DEFAULT_RTOL = 1e-9
+DEFAULT_ATOL = 1e-9
+MODELS = ("SES", "Holt", "HW Additif", "HW Multiplicatif")
+
+
+# --------------------------------------------------------
+# 1. Corpus
+# --------------------------------------------------------
+
+def _real_shaped():
+    """
+    Séries de forme réaliste : (nom, série, période).
+    """
+    rng = np.random.default_rng(42)
+    months = pd.date_range("1949-01-01", periods=144, freq="MS")
+    t = np.arange(144)
+    # Trafic aérien : croissance exponentielle, saison multiplicative
+    airline = 110 * np.exp(0.01 * t) * (1 + 0.2 * np.sin(2 * np.pi * (t - 3) / 12)) * rng.lognormal(0, 0.03, 144)
+
+    quarters = pd.date_range("2015-01-01", periods=20, freq="QS")
+    sales = 50 + 1.5 * np.arange(20) + np.tile([8, -3, -9, 4], 5) + rng.normal(0, 2, 20)
+
+    weeks = pd.date_range("2019-01-06", periods=260, freq="W")
+    k = np.arange(260)
+    demand = 1000 + 150 * np.cos(2 * np.pi * k / 52) + rng.normal(0, 40, 260)
+
+    days = pd.date_range("2024-03-01", periods=21, freq="D")
+    visits = 200 + np.tile([30, 10, 5, 0, 15, -40, -20], 3) + rng.normal(0, 5, 21)
+
+    return [
+        ("airline_mensuel", pd.Series(airline, index=months), 12),
+        ("ventes_trimestrielles", pd.Series(sales, index=quarters), 4),
+        ("demande_hebdomadaire", pd.Series(demand, index=weeks), 52),
+        ("visites_journalieres_courtes", pd.Series(visits, index=days), 7),
+    ]
+
+
+def corpus(sizes=(24, 60, 144, 1000), seed=0, period=12):
+    """
+    Séries synthétiques (trous interpolés, index régulier) + séries de forme réaliste.
+    """
+    items = []
+    for kind in KINDS:
+        for n in sizes:
+            series = generate(kind, n, seed, period).interpolate(limit_direction="both")
+            items.append((f"{kind}_{n}", series, period))
+    return items + _real_shaped()
+
+
+def parameter_grid(model, grid):
+    from src.models.smoothing_manual import MODEL_SPECS
+
+    spec = MODEL_SPECS[model]
+    betas = grid if spec["trend"] else [None]
+    gammas = grid if spec["seasonal"] else [None]
+    return list(itertools.product(grid, betas, gammas))
+
+
+# --------------------------------------------------------
+# 2. Comparaison
+# --------------------------------------------------------
+
+def _max_abs(a, b):
+    return float(np.max(np.abs(np.asarray(a, dtype=float) - np.asarray(b, dtype=float)), initial=0.0))
+
+
+def _max_rel(a, b):
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    scale = np.maximum(np.abs(a), np.finfo(float).tiny)
+    return float(np.max(np.abs(a - b) / scale, initial=0.0))
+
+
+def _timed_fit(engine, series, model, params, period, horizon):
+    from src.models.smoothing_manual import fit_smoothing
+
+    start = time.perf_counter()
+    try:
+        fit = fit_smoothing(series, model, *params, seasonal_periods=period, engine=engine)
+        forecast = fit.forecast(horizon)
+    except Exception as e:
+        return None, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return fit, forecast, time.perf_counter() - start, None
+
+
+def compare_series(name, series, period, models=MODELS, grid=DEFAULT_GRID, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL):
+    """
+    Une ligne par modèle : écarts maximaux sur la grille de paramètres,
+    temps cumulés des deux moteurs et accélération.
+    """
+    horizon = 2 * period
+    rows = []
+
+    for model in models:
+        row = {"serie": name, "n": len(series), "periode": period, "modele": model,
+               "ajustements": 0, "echecs_communs": 0, "divergences": 0,
+               "fitted_abs": 0.0, "fitted_rel": 0.0, "sse_rel": 0.0,
+               "aic_abs": 0.0, "aicc_abs": 0.0, "bic_abs": 0.0,
+               "prevision_abs": 0.0, "prevision_rel": 0.0, "index_identique": True,
+               "statsmodels_s": 0.0, "native_s": 0.0}
+
+        for params in parameter_grid(model, grid):
+            ref, ref_fc, t_ref, err_ref = _timed_fit("statsmodels", series, model, params, period, horizon)
+            nat, nat_fc, t_nat, err_nat = _timed_fit("native", series, model, params, period, horizon)
+            row["statsmodels_s"] += t_ref
+            row["native_s"] += t_nat
+
+            if err_ref and err_nat:
+                row["echecs_communs"] += 1
+                continue
+            if err_ref or err_nat:
+                row["divergences"] += 1
+                row["erreur"] = f"statsmodels : {err_ref or 'ok'} / natif : {err_nat or 'ok'}"
+                continue
+
+            row["ajustements"] += 1
+            row["fitted_abs"] = max(row["fitted_abs"], _max_abs(ref.fittedvalues, nat.fittedvalues))
+            row["fitted_rel"] = max(row["fitted_rel"], _max_rel(ref.fittedvalues, nat.fittedvalues))
+            row["sse_rel"] = max(row["sse_rel"], _max_rel([ref.sse], [nat.sse]))
+            for crit in ("aic", "aicc", "bic"):
+                a, b = getattr(ref, crit), getattr(nat, crit)
+                gap = 0.0 if a == b else _max_abs([a], [b])     # AICc infini des deux côtés
+                row[f"{crit}_abs"] = max(row[f"{crit}_abs"], gap)
+            row["prevision_abs"] = max(row["prevision_abs"], _max_abs(ref_fc, nat_fc))
+            row["prevision_rel"] = max(row["prevision_rel"], _max_rel(ref_fc, nat_fc))
+            row["index_identique"] &= bool(ref_fc.index.equals(nat_fc.index))
+
+        row["acceleration"] = row["statsmodels_s"] / row["native_s"] if row["native_s"] else np.nan
+        # AIC = n·log(SSE / n) + 2k : un écart relatif ε sur la SSE donne ≈ n·ε
+        criterion_tol = atol + rtol * len(series)
+        row["conforme"] = bool(
+            row["divergences"] == 0 and row["index_identique"]
+            and (row["fitted_abs"] <= atol or row["fitted_rel"] <= rtol)
+            and (row["prevision_abs"] <= atol or row["prevision_rel"] <= rtol)
+            and row["sse_rel"] <= rtol
+            and all(row[f"{c}_abs"] <= criterion_tol for c in ("aic", "aicc", "bic"))
+        )
+        rows.append(row)
+    return rows
+
+
+def run_parity(items, models=MODELS, grid=DEFAULT_GRID, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, progress=print):
+    rows = []
+    with warnings.catch_warnings():
+        for name, series, period in items:
+            warnings.simplefilter("ignore")
+            series_rows = compare_series(name, series, period, models, grid, rtol, atol)
+            rows.extend(series_rows)
+            if progress:
+                for r in series_rows:
+                    progress(f"{'✅' if r['conforme'] else '❌'} {r['serie']:30s} {r['modele']:17s} "
+                             f"ajusté {r['fitted_rel']:.1e}  prévision {r['prevision_rel']:.1e}  "
+                             f"×{r['acceleration']:.1f}")
+    return pd.DataFrame(rows)
+
+
+def summary(df):
+    """
+    Par modèle : écarts maximaux sur tout le corpus et accélération (temps cumulés).
+    """
+    agg = df.groupby("modele", sort=False).agg(
+        ajustements=("ajustements", "sum"),
+        divergences=("divergences", "sum"),
+        fitted_abs=("fitted_abs", "max"),
+        fitted_rel=("fitted_rel", "max"),
+        sse_rel=("sse_rel", "max"),
+        aic_abs=("aic_abs", "max"),
+        prevision_abs=("prevision_abs", "max"),
+        prevision_rel=("prevision_rel", "max"),
+        statsmodels_s=("statsmodels_s", "sum"),
+        native_s=("native_s", "sum"),
+        conforme=("conforme", "all")
+    )
+    agg["acceleration"] = agg["statsmodels_s"] / agg["native_s"]
+    return agg
+
+
+# --------------------------------------------------------
+# 3. Ligne de commande
+# --------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parité moteur natif / statsmodels (lissage exponentiel).")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[24, 60, 144, 1000],
+                        help="Tailles des séries synthétiques")
+    parser.add_argument("--grid", nargs="+", type=float, default=list(DEFAULT_GRID),
+                        help="Valeurs de α, β, γ testées")
+    parser.add_argument("--models", nargs="+", choices=MODELS, default=list(MODELS))
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--atol", type=float, default=DEFAULT_ATOL)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Écrit le détail par série et modèle")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    df = run_parity(corpus(args.sizes, args.seed), args.models, args.grid, args.rtol, args.atol,
+                    progress=None if args.quiet else print)
+
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(summary(df).to_string(float_format=lambda x: f"{x:.3g}"))
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(df.to_dict(orient="records"), f, indent=1, ensure_ascii=False, default=str)
+
+    failures = df[~df["conforme"]]
+    for _, r in failures.iterrows():
+        print(f"❌ {r['serie']} / {r['modele']} : {r.get('erreur') or 'écart au-delà de la tolérance'}")
+    if failures.empty:
+        print(f"✅ Moteur natif conforme (rtol {args.rtol:g}, atol {args.atol:g}) : "
+              f"accélération ×{df['statsmodels_s'].sum() / df['native_s'].sum():.1f}")
+    return 1 if len(failures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.cases import all_cases, uncovered
+from benchmarks.generators import ALL_SIZES, DEFAULT_SIZES, KINDS, generate
+
+# Suite de benchmarks des fonctions publiques (src/data, src/exploration, src/models).
+# Résultats en JSON (benchmarks/results/), comparés à une référence enregistrée :
+# une régression au-delà du seuil donne le code de sortie 1.
+#
+#   python benchmarks/run.py                               (10² à 10⁵ points, 5 types de séries)
+#   python benchmarks/run.py --sizes all --kinds seasonal  (jusqu'à 10⁷ points)
+#   python benchmarks/run.py -k "grid_search.*" --save-baseline
+#   python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 1.3
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.25    # 25 % plus lent que la référence
+DEFAULT_MIN_DELTA_MS = 1.0  # écarts absolus plus petits ignorés (bruit de mesure)
+DEFAULT_MAX_SECONDS = 10.0  # au-delà, les tailles supérieures du cas sont sautées
+DEFAULT_SEED = 0
+
+
+# --------------------------------------------------------
+# 1. Mesure
+# --------------------------------------------------------
+
+def time_call(func, repeat=DEFAULT_REPEAT, budget=DEFAULT_MAX_SECONDS):
+    """
+    Temps (s) de repeat appels, sans dépasser budget : un appel lent n'est
+    pas répété. Retourne la liste des durées.
+    """
+    timings = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+        if time.perf_counter() - start > budget:
+            break
+    return timings
+
+
+def run_suite(cases, kinds, sizes, repeat=DEFAULT_REPEAT, seed=DEFAULT_SEED,
+              max_seconds=DEFAULT_MAX_SECONDS, progress=print):
+    """
+    Chronomètre chaque cas sur chaque (type, taille). Un cas trop lent à une
+    taille n'est pas mesuré aux tailles supérieures (pour ce type de série).
+    """
+    from benchmarks.cases import Fixtures
+
+    results = []
+    too_slow = set()
+
+    with tempfile.TemporaryDirectory(prefix="bench_") as workdir, warnings.catch_warnings():
+        for kind in kinds:
+            for n in sorted(sizes):
+                series = generate(kind, n, seed)
+                fixtures = Fixtures(series, workdir)
+
+                for case in cases:
+                    if n > case.max_n or (case.name, kind) in too_slow:
+                        continue
+                    row = {"cas": case.name, "type": kind, "n": n}
+                    # Réappliqué : certains modules (statsmodels) ajoutent leurs filtres à l'import
+                    warnings.simplefilter("ignore")
+                    try:
+                        func = case.prepare(series, fixtures)
+                        timings = time_call(func, repeat, max_seconds)
+                        row.update({
+                            "min_s": min(timings),
+                            "mediane_s": float(np.median(timings)),
+                            "repetitions": len(timings)
+                        })
+                        if min(timings) > max_seconds:
+                            too_slow.add((case.name, kind))
+                    except Exception as e:
+                        row["erreur"] = f"{type(e).__name__}: {e}"
+                    results.append(row)
+                    if progress:
+                        progress(_format_row(row))
+    return results
+
+
+def _format_row(row):
+    label = f"{row['cas']:55s} {row['type']:15s} {row['n']:>9d}"
+    if "erreur" in row:
+        return f"{label}   erreur ({row['erreur'][:60]})"
+    return f"{label} {row['min_s'] * 1000:12.3f} ms"
+
+
+# --------------------------------------------------------
+# 2. Résultats et référence
+# --------------------------------------------------------
+
+def environment():
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plateforme": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__
+    }
+
+
+def save_results(results, path, meta):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environnement": meta, "resultats": results}, f, indent=1, ensure_ascii=False)
+    return path
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["resultats"]
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """
+    Compare les temps minimaux aux mesures de référence (même cas, type, taille).
+    Retourne un DataFrame : cas, type, n, reference_ms, actuel_ms, ratio, statut
+    (regression, amelioration, stable, nouveau, erreur).
+    """
+    ref = {(r["cas"], r["type"], r["n"]): r for r in baseline if "min_s" in r}
+    rows = []
+    for r in results:
+        key = (r["cas"], r["type"], r["n"])
+        base = ref.get(key)
+        row = {"cas": r["cas"], "type": r["type"], "n": r["n"],
+               "reference_ms": base["min_s"] * 1000 if base else np.nan,
+               "actuel_ms": r["min_s"] * 1000 if "min_s" in r else np.nan}
+        if "min_s" not in r:
+            row["statut"] = "erreur"
+        elif base is None:
+            row["statut"] = "nouveau"
+        else:
+            ratio = row["actuel_ms"] / row["reference_ms"] if row["reference_ms"] > 0 else np.inf
+            delta = row["actuel_ms"] - row["reference_ms"]
+            row["ratio"] = ratio
+            if ratio > threshold and delta > min_delta_ms:
+                row["statut"] = "regression"
+            elif ratio < 1 / threshold and -delta > min_delta_ms:
+                row["statut"] = "amelioration"
+            else:
+                row["statut"] = "stable"
+        rows.append(row)
+    return pd.DataFrame(rows, columns=["cas", "type", "n", "reference_ms", "actuel_ms", "ratio", "statut"])
+
+
+# --------------------------------------------------------
+# 3. Ligne de commande
+# --------------------------------------------------------
+
+def _sizes(values):
+    if values == ["all"]:
+        return list(ALL_SIZES)
+    return [int(float(v)) for v in values]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks des fonctions publiques de src/.")
+    parser.add_argument("-k", "--filter", action="append",
+                        help="Motif des cas à mesurer (ex : 'grid_search.*'), répétable")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--sizes", nargs="+", default=[str(n) for n in DEFAULT_SIZES],
+                        help="Tailles (ex : 100 1e4) ou 'all' (10² à 10⁷)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="Un cas plus lent n'est pas mesuré aux tailles supérieures")
+    parser.add_argument("-o", "--output", help="Fichier JSON des résultats (défaut : benchmarks/results/<date>.json)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Référence à comparer")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Enregistre les résultats comme référence (fusionnés avec l'existante)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Ratio actuel / référence au-delà duquel un cas régresse")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases = all_cases()
+    missing = uncovered(cases)
+    if missing:
+        print("⚠️ Fonctions publiques sans benchmark : " + ", ".join(missing))
+    if args.filter:
+        cases = [c for c in cases if any(fnmatch.fnmatch(c.name, p) for p in args.filter)]
+
+    results = run_suite(cases, args.kinds, _sizes(args.sizes), args.repeat, args.seed,
+                        args.max_seconds, progress=None if args.quiet else print)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}.json")
+    save_results(results, output, dict(environment(), seed=args.seed))
+    print(f"📄 Résultats : {output}")
+
+    if args.save_baseline:
+        previous = load_results(args.baseline) if os.path.exists(args.baseline) else []
+        measured = {(r["cas"], r["type"], r["n"]) for r in results}
+        merged = [r for r in previous if (r["cas"], r["type"], r["n"]) not in measured] + results
+        save_results(merged, args.baseline, dict(environment(), seed=args.seed))
+        print(f"📌 Référence mise à jour : {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️ Pas de référence : relancer avec --save-baseline pour en créer une.")
+        return 0
+
+    df = compare(results, load_results(args.baseline), args.threshold, args.min_delta_ms)
+    regressions = df[df["statut"] == "regression"]
+    counts = df["statut"].value_counts().to_dict()
+    print("Comparaison : " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+
+    for _, r in regressions.iterrows():
+        print(f"❌ {r['cas']} [{r['type']}, n={r['n']}] : "
+              f"{r['reference_ms']:.2f} → {r['actuel_ms']:.2f} ms (×{r['ratio']:.2f})")
+    if regressions.empty:
+        print(f"✅ Aucune régression (seuil ×{args.threshold})")
+    return 1 if len(regressions) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,121 @@
 # desktop_launcher.py - NOUVEAU FICHIER
-import webview
+import argparse
+import importlib.util
+import logging
+import logging.handlers
 import threading
 import time
 import subprocess
 import sys
 import os
+import urllib.error
+import urllib.request
 import webbrowser
+from collections import deque
 from datetime import datetime
 
+APP_URL = "http://localhost:8501"
+# /_stcore/health (Streamlit >= 1.18), /healthz pour les versions plus anciennes
+HEALTH_PATHS = ("/_stcore/health", "/healthz")
+
+
+class LogBuffer:
+    """Dernières lignes de stdout / stderr du serveur (mémoire bornée), avec
+    copie optionnelle dans un fichier journal à rotation."""
+    
+    def __init__(self, max_lines=2000, log_file=None, max_bytes=5 * 1024 * 1024, backups=3, echo=True):
+        self.lines = deque(maxlen=max_lines)
+        self.echo = echo
+        self._lock = threading.Lock()
+        self._logger = None
+        
+        if log_file:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._logger = logging.getLogger(f"streamlit_server.{id(self)}")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            self._logger.addHandler(handler)
+    
+    def add(self, stream, line):
+        line = line.rstrip()
+        with self._lock:
+            self.lines.append((datetime.now().strftime("%H:%M:%S"), stream, line))
+        if self._logger is not None:
+            self._logger.info("[%s] %s", stream, line)
+        if self.echo:
+            print(f"[Streamlit{'' if stream == 'out' else ' ' + stream}] {line}")
+    
+    def drain(self, pipe, stream):
+        """Lit un flux jusqu'à sa fermeture (un thread par flux : aucun tube ne se remplit)"""
+        try:
+            for line in pipe:
+                self.add(stream, line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            pipe.close()
+    
+    def tail(self, n=50):
+        with self._lock:
+            return list(self.lines)[-n:]
+    
+    def close(self):
+        if self._logger is not None:
+            for handler in list(self._logger.handlers):
+                handler.close()
+                self._logger.removeHandler(handler)
+
+
+def process_memory_mb(pid):
+    """Mémoire résidente (Mo) d'un processus : psutil si disponible, sinon /proc (Linux)"""
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / 2**20
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
 class DesktopApp:
-    def __init__(self):
+    def __init__(self, log_file=None, memory_limit_mb=4096, check_interval=15.0,
+                 max_failures=3, max_restarts=5, echo_logs=True):
         self.streamlit_process = None
         self.is_running = False
         
+        # Journal du serveur et supervision (réactivité + mémoire)
+        self.logs = LogBuffer(log_file=log_file, echo=echo_logs)
+        self.memory_limit_mb = memory_limit_mb
+        self.check_interval = check_interval
+        self.max_failures = max_failures
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self._stop = threading.Event()
+        self._restart_lock = threading.Lock()
+        
     def check_dependencies(self):
-        """Vérifie que toutes les dépendances sont installées"""
+        """Vérifie que toutes les dépendances sont installées (sans les importer)"""
         required_modules = [
             'streamlit', 'pandas', 'numpy', 'matplotlib',
             'statsmodels', 'scipy', 'sklearn'
         ]
         
-        missing = []
-        for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
-                missing.append(module)
+        # find_spec localise le paquet sans l'exécuter : quelques ms au lieu de
+        # plusieurs secondes d'imports (statsmodels, scipy, sklearn...)
+        missing = [m for m in required_modules if importlib.util.find_spec(m) is None]
         
         if missing:
             print(f"❌ Modules manquants: {', '.join(missing)}")
@@ -56,18 +146,18 @@ class DesktopApp:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             )
             
             self.is_running = True
             print("✅ Serveur Streamlit démarré sur http://localhost:8501")
             
-            # Afficher les logs en temps réel
-            def log_output():
-                for line in self.streamlit_process.stdout:
-                    print(f"[Streamlit] {line.strip()}")
-            
-            threading.Thread(target=log_output, daemon=True).start()
+            # Vider stdout ET stderr en continu (un tube plein bloquerait le serveur)
+            for pipe, stream in ((self.streamlit_process.stdout, "out"), (self.streamlit_process.stderr, "err")):
+                threading.Thread(target=self.logs.drain, args=(pipe, stream), daemon=True).start()
             
             return True
             
@@ -75,23 +165,107 @@ class DesktopApp:
             print(f"❌ Erreur lors du démarrage de Streamlit: {e}")
             return False
     
+    def probe_health(self, timeout=1.0):
+        """True si le serveur répond sur son endpoint de santé"""
+        for path in HEALTH_PATHS:
+            try:
+                with urllib.request.urlopen(APP_URL + path, timeout=timeout) as response:
+                    if response.status == 200:
+                        return True
+            except (urllib.error.URLError, OSError):
+                pass
+        return False
+    
+    def wait_until_ready(self, timeout=60.0, initial_delay=0.05, max_delay=1.0):
+        """Interroge l'endpoint de santé avec un délai croissant jusqu'à ce que le serveur réponde"""
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        
+        while time.monotonic() < deadline:
+            if self.streamlit_process is not None and self.streamlit_process.poll() is not None:
+                print(f"❌ Le serveur Streamlit s'est arrêté (code {self.streamlit_process.returncode})")
+                return False
+            
+            if self.probe_health():
+                return True
+            
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
+        
+        print(f"❌ Serveur Streamlit non disponible après {timeout:.0f} s")
+        return False
+    
     def open_browser(self):
-        """Ouvre le navigateur après un délai"""
-        time.sleep(3)  # Attendre que le serveur démarre
+        """Ouvre le navigateur (appelé une fois le serveur prêt)"""
         try:
-            webbrowser.open("http://localhost:8501")
+            webbrowser.open(APP_URL)
             print("🌐 Navigateur ouvert automatiquement")
         except:
             print("⚠️ Impossible d'ouvrir le navigateur automatiquement")
             print("➡️ Ouvrez manuellement: http://localhost:8501")
     
+    def stop_streamlit(self, timeout=10):
+        """Arrête le serveur (terminate, puis kill s'il ne répond plus)"""
+        process = self.streamlit_process
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
+    def restart_streamlit(self, reason):
+        """Redémarre le serveur ; la page se reconnecte d'elle-même"""
+        with self._restart_lock:
+            if self._stop.is_set():
+                return False
+            if self.restarts >= self.max_restarts:
+                print(f"❌ Redémarrage abandonné ({reason}) : {self.max_restarts} redémarrages déjà effectués")
+                return False
+            self.restarts += 1
+            print(f"🔄 Redémarrage du serveur Streamlit ({reason}) [{self.restarts}/{self.max_restarts}]")
+            for _, stream, line in self.logs.tail(10):
+                print(f"   [{stream}] {line}")
+            
+            self.stop_streamlit()
+            return self.start_streamlit() and self.wait_until_ready()
+    
+    def supervise(self):
+        """Boucle de surveillance : réactivité (endpoint de santé) et mémoire du serveur"""
+        failures = 0
+        while not self._stop.wait(self.check_interval):
+            process = self.streamlit_process
+            if process is None:
+                continue
+            
+            if process.poll() is not None:
+                reason = f"processus arrêté (code {process.returncode})"
+            elif not self.probe_health(timeout=5.0):
+                failures += 1
+                if failures < self.max_failures:
+                    continue
+                reason = f"aucune réponse depuis {failures} vérifications"
+            else:
+                failures = 0
+                memory = process_memory_mb(process.pid)
+                if not (self.memory_limit_mb and memory is not None and memory > self.memory_limit_mb):
+                    continue
+                reason = f"mémoire {memory:.0f} Mo > {self.memory_limit_mb} Mo"
+            
+            failures = 0
+            if not self.restart_streamlit(reason):
+                break
+    
     def cleanup(self):
         """Nettoyage à la fermeture"""
         print("\n🛑 Fermeture de l'application...")
+        self._stop.set()
         if self.streamlit_process:
-            self.streamlit_process.terminate()
-            self.streamlit_process.wait()
+            self.stop_streamlit()
             print("✅ Serveur Streamlit arrêté")
+        self.logs.close()
     
     def run(self):
         """Méthode principale pour exécuter l'application"""
@@ -119,14 +293,28 @@ class DesktopApp:
             input("\nAppuyez sur Entrée pour quitter...")
             return
         
+        # Attendre que le serveur réponde (au lieu d'un délai fixe)
+        started = time.monotonic()
+        if not self.wait_until_ready():
+            self.cleanup()
+            input("\nAppuyez sur Entrée pour quitter...")
+            return
+        print(f"✅ Serveur prêt en {time.monotonic() - started:.1f} s")
+        
+        # Surveillance du serveur (blocage, mémoire) avec redémarrage automatique
+        if self.check_interval:
+            threading.Thread(target=self.supervise, daemon=True).start()
+        
         # Ouvrir le navigateur
         threading.Thread(target=self.open_browser, daemon=True).start()
         
         # Créer la fenêtre desktop avec WebView
         try:
+            import webview
+
             window = webview.create_window(
                 "📈 Application d'Analyse Statistique",
-                "http://localhost:8501",
+                APP_URL,
                 width=1400,
                 height=900,
                 resizable=True,
@@ -164,7 +352,21 @@ class DesktopApp:
 
 def main():
     """Point d'entrée principal"""
-    app = DesktopApp()
+    parser = argparse.ArgumentParser(description="Application d'analyse statistique (fenêtre desktop)")
+    parser.add_argument("--log-file", help="Journal du serveur Streamlit (rotation à 5 Mo, 3 archives)")
+    parser.add_argument("--memory-limit-mb", type=float, default=4096,
+                        help="Redémarre le serveur au-delà de cette mémoire (0 : désactivé)")
+    parser.add_argument("--check-interval", type=float, default=15.0,
+                        help="Secondes entre deux vérifications du serveur (0 : pas de surveillance)")
+    parser.add_argument("--quiet", action="store_true", help="Ne pas recopier les logs du serveur dans la console")
+    args = parser.parse_args()
+    
+    app = DesktopApp(
+        log_file=args.log_file,
+        memory_limit_mb=args.memory_limit_mb,
+        check_interval=args.check_interval,
+        echo_logs=not args.quiet
+    )
     
     # Gestion propre de la fermeture
     try:
@@ -1,7 +1,6 @@
 # pages/1_Importation.py - VERSION CORRIGÉE
 import streamlit as st
 import pandas as pd
-import numpy as np
 import sys
 import os
 
@@ -10,6 +9,12 @@ ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.append(ROOT)
 
+from src.data.loader import clean_numeric_column, parse_dates
+from src.data.session_store import get_session_store
+from src.jobs.precompute import start_precompute
+from src.monitoring.memory import track
+from src.visualization.downsample import downsample_series
+
 st.title("📂 Importation des Données")
 st.write("Importez votre fichier CSV contenant la série temporelle.")
 
@@ -36,9 +41,6 @@ if uploaded_file is not None:
         else:
             df_raw = pd.read_excel(uploaded_file)
         
-        # Stocker temporairement
-        st.session_state["df_raw"] = df_raw
-        
         # Afficher un aperçu
         st.write("### 📊 Aperçu des données importées :")
         st.dataframe(df_raw.head())
@@ -118,62 +120,35 @@ if uploaded_file is not None:
             with col2:
                 sort_dates = st.checkbox("Trier par date", value=True)
         
+        precompute = st.checkbox(
+            "⚡ Précalculer les analyses en arrière-plan",
+            value=True,
+            help="Stationnarité, décomposition, ACF, grid search et validation lancés dès le chargement : "
+                 "les pages 2 à 6 s'ouvrent sans recalcul."
+        )
+        
         # ================================
         # 5. Bouton de chargement
         # ================================
         if st.button("📥 Charger la série", type="primary"):
             try:
-                with st.spinner("Chargement et nettoyage en cours..."):
+                with st.spinner("Chargement et nettoyage en cours..."), track("page1.chargement"):
                     df = df_raw.copy()
                     
                     # 1. Nettoyer la colonne valeur
                     st.write("**Étape 1 :** Nettoyage des valeurs numériques...")
                     
-                    # Fonction de nettoyage robuste
-                    def clean_numeric_value(x):
-                        if pd.isna(x):
-                            return np.nan
-                        try:
-                            # Convertir en chaîne
-                            x_str = str(x)
-                            # Supprimer les espaces
-                            x_str = x_str.strip()
-                            # Remplacer les virgules par des points
-                            x_str = x_str.replace(',', '.')
-                            # Supprimer les caractères non numériques (sauf . et -)
-                            x_str = ''.join(char for char in x_str if char.isdigit() or char in ['.', '-'])
-                            # Convertir en float
-                            return float(x_str) if x_str not in ['', '.', '-'] else np.nan
-                        except:
-                            return np.nan
-                    
-                    # Appliquer le nettoyage
-                    df[value_col] = df[value_col].apply(clean_numeric_value)
+                    # Nettoyage robuste (virgules, espaces, caractères parasites)
+                    df[value_col] = clean_numeric_column(df[value_col])
                     
                     # 2. Nettoyer la colonne date
                     st.write("**Étape 2 :** Conversion des dates...")
                     
-                    # Essayer différents formats de date
-                    date_formats = [
-                        '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y',
-                        '%Y.%m.%d', '%d.%m.%Y', '%m.%d.%Y',
-                        '%Y %m %d', '%d %m %Y', '%m %d %Y',
-                        '%Y-%m', '%Y/%m', '%m-%Y', '%m/%Y'
-                    ]
-                    
-                    date_converted = False
-                    for date_format in date_formats:
-                        try:
-                            df[date_col] = pd.to_datetime(df[date_col], format=date_format, errors='raise')
-                            date_converted = True
-                            st.write(f"✅ Format détecté: {date_format}")
-                            break
-                        except:
-                            continue
-                    
-                    # Si aucun format spécifique ne fonctionne, utiliser l'inférence
-                    if not date_converted:
-                        df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+                    # Essayer différents formats de date, sinon inférence
+                    df[date_col], date_format = parse_dates(df[date_col])
+                    if date_format:
+                        st.write(f"✅ Format détecté: {date_format}")
+                    else:
                         st.write("ℹ️ Format de date inféré automatiquement")
                     
                     # 3. Nettoyage supplémentaire
@@ -190,14 +165,23 @@ if uploaded_file is not None:
                     
                     # 5. Définir l'index et créer la série
                     df = df.set_index(date_col)
-                    series = df[value_col]
                     
-                    # 6. Stocker dans session_state
+                    # 6. Stocker dans session_state : une seule copie des valeurs,
+                    # partagée par toutes les pages (ni tableau brut ni tableau nettoyé)
+                    data_store = get_session_store(st.session_state)
+                    series = data_store.put(df[value_col])
                     st.session_state["series"] = series
-                    st.session_state["df_loaded"] = df
                     st.session_state["date_col"] = date_col
                     st.session_state["value_col"] = value_col
                     
+                    # Résultats d'une série précédente : plus valables
+                    for key in ("grid_results", "best_models", "best_fitted_model", "forecast_manual",
+                                "grid_job", "rolling_origin_job"):
+                        st.session_state.pop(key, None)
+                    if precompute:
+                        start_precompute(data_store, st.session_state)
+                        st.caption("⚡ Analyses des pages 2 à 6 en cours de précalcul (arrière-plan).")
+                    
                     # 7. Afficher les résultats
                     st.success("✅ Série chargée avec succès !")
                     
@@ -213,7 +197,7 @@ if uploaded_file is not None:
                     
                     # Graphique
                     st.write("### 📈 Visualisation de la série :")
-                    st.line_chart(series)
+                    st.line_chart(downsample_series(series))
                     
                     # Aperçu des données
                     with st.expander("📋 Voir les données brutes"):
@@ -303,7 +287,7 @@ else:
 # 6. Réinitialisation
 # ================================
 if st.button("🔄 Réinitialiser les données"):
-    keys_to_remove = ['series', 'df_raw', 'df_loaded', 'date_col', 'value_col']
+    keys_to_remove = ['series', 'data_store', 'df_raw', 'df_loaded', 'date_col', 'value_col']
     for key in keys_to_remove:
         if key in st.session_state:
             del st.session_state[key]
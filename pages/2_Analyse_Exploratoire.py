@@ -7,16 +7,21 @@ ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.append(ROOT)
 
-from src.exploration.analysis import describe_series, plot_series
+from src.data.session_store import get_session_store
+from src.exploration.analysis import describe_series
+from src.visualization.downsample import fill_between_series, plot_series
+from src.visualization.figure_cache import subplots
+from src.exploration.rolling import rolling_statistics, hampel_filter
 
 st.title("📊 Analyse Exploratoire de la Série Temporelle")
 
 # Vérifier qu'une série a été chargée
-if "series" not in st.session_state:
+store = get_session_store(st.session_state)
+if "series" not in store:
     st.warning("Veuillez d'abord importer une série dans l'onglet **1. Importation**.")
     st.stop()
 
-series = st.session_state["series"]
+series = store.series()
 
 # ---------------------
 # 1. Statistiques
@@ -32,12 +37,19 @@ st.table(df_stats)
 # ---------------------
 st.subheader("📉 Visualisation de la Série")
 
-import matplotlib.pyplot as plt
+# Série longue : réduite à la largeur du graphique, pleine résolution dans la fenêtre zoomée
+xlim = None
+if isinstance(series.index, pd.DatetimeIndex) and len(series) > 2000:
+    start, end = series.index[0].to_pydatetime(), series.index[-1].to_pydatetime()
+    window = st.slider("Fenêtre affichée", min_value=start, max_value=end, value=(start, end),
+                       format="YYYY-MM-DD")
+    if window != (start, end):
+        xlim = window
 
-fig, ax = plt.subplots(figsize=(10, 4))
-ax.plot(series.index, series.values, label="Série")
+fig, ax = subplots(figsize=(10, 4))
+plot_series(ax, series, label="Série", xlim=xlim)
 ax.grid(True)
-plt.tight_layout()
+fig.tight_layout()
 
 st.pyplot(fig)
 
@@ -52,3 +64,43 @@ kurt_val = float(series.kurt())
 col1, col2 = st.columns(2)
 col1.metric("Skewness (Asymétrie)", f"{skew_val:.3f}")
 col2.metric("Kurtosis (Aplatissement)", f"{kurt_val:.3f}")
+
+# ---------------------
+# 4. Statistiques glissantes & valeurs aberrantes
+# ---------------------
+st.subheader("🪟 Statistiques glissantes & valeurs aberrantes")
+
+windows = st.multiselect("Fenêtres glissantes", [3, 7, 12, 30, 90], default=[7, 30])
+
+if windows:
+    rolling = rolling_statistics(series, windows)
+    w_plot = st.selectbox("Fenêtre affichée", windows)
+
+    fig_roll, ax_roll = subplots(figsize=(10, 4))
+    plot_series(ax_roll, series, label="Série", alpha=0.5)
+    plot_series(ax_roll, series.index, rolling[f"mean_{w_plot}"], label=f"Moyenne ({w_plot})")
+    fill_between_series(
+        ax_roll,
+        series.index,
+        rolling[f"mean_{w_plot}"] - 2 * rolling[f"std_{w_plot}"],
+        rolling[f"mean_{w_plot}"] + 2 * rolling[f"std_{w_plot}"],
+        color="gray", alpha=0.2, label="± 2 écarts-types"
+    )
+    ax_roll.grid(True)
+    ax_roll.legend()
+    fig_roll.tight_layout()
+    st.pyplot(fig_roll)
+
+    with st.expander("📋 Tableau des statistiques glissantes"):
+        st.dataframe(rolling)
+
+col1, col2 = st.columns(2)
+hampel_window = col1.number_input("Fenêtre du filtre de Hampel", min_value=3, max_value=101, value=7, step=2)
+n_sigmas = col2.number_input("Seuil (nombre d'écarts-types robustes)", min_value=1.0, max_value=10.0, value=3.0)
+
+flags, _, _ = hampel_filter(series, int(hampel_window), n_sigmas)
+outliers = series[flags]
+
+st.metric("Valeurs aberrantes détectées (Hampel)", int(flags.sum()))
+if len(outliers) > 0:
+    st.dataframe(outliers.to_frame("Valeur"))
@@ -2,26 +2,29 @@ import streamlit as st
 import pandas as pd
 import sys, os
 import numpy as np
-import matplotlib.pyplot as plt
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 
 # === Fix import src ===
 ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.append(ROOT)
 
-from src.exploration.stationarity import adf_test, kpss_test
-from src.exploration.decomposition import decomposition_additive
-from src.exploration.test_saison import test_additive_vs_multiplicative
+from src.data.session_store import get_session_store
+from src.exploration.graph import get_analysis_graph
+from src.visualization.downsample import plot_series
+from src.visualization.figure_cache import cached_figure, subplots
 
 st.title("📐 Tests de Stationnarité & Décomposition")
 
 # Vérifier qu'une série est chargée
-if "series" not in st.session_state:
+store = get_session_store(st.session_state)
+if "series" not in store:
     st.warning("Veuillez d'abord importer une série dans l'onglet **1. Importation**.")
     st.stop()
 
-series = st.session_state["series"]
+series = store.series()
+
+# Graphe d'analyses partagé : tendance, saisonnalité, ACF... calculées une seule fois
+graph = get_analysis_graph(series, st.session_state, fingerprint=store.fingerprint())
 
 # ================================================================
 # 1. Tests ADF & KPSS
@@ -29,8 +32,7 @@ series = st.session_state["series"]
 st.subheader("📌 Tests de Stationnarité (ADF & KPSS)")
 
 try:
-    adf = adf_test(series)
-    kpss = kpss_test(series)
+    adf, kpss = graph.stationarity()
 
     col1, col2 = st.columns(2)
 
@@ -54,21 +56,26 @@ st.subheader("📉 Décomposition Additive")
 
 p = st.number_input("Période saisonnière (p)", min_value=2, max_value=24, value=4)
 
-try:
-    trend, season, resid = decomposition_additive(series, p)
+# Figures rendues une fois par (série, type, paramètres) puis servies depuis le cache
+def draw_decomposition():
+    trend, season, resid = graph.decomposition(p, "add")
 
-    fig, axs = plt.subplots(4, 1, figsize=(10, 8))
+    fig, axs = subplots(4, 1, figsize=(10, 8))
 
-    axs[0].plot(series); axs[0].set_title("Série Originale")
-    axs[1].plot(trend); axs[1].set_title("Tendance")
-    axs[2].plot(season); axs[2].set_title("Saisonnalité")
-    axs[3].plot(resid); axs[3].set_title("Résidus")
+    plot_series(axs[0], series); axs[0].set_title("Série Originale")
+    plot_series(axs[1], trend); axs[1].set_title("Tendance")
+    plot_series(axs[2], season); axs[2].set_title("Saisonnalité")
+    plot_series(axs[3], resid); axs[3].set_title("Résidus")
 
     for ax in axs:
         ax.grid(True)
 
     fig.tight_layout()
-    st.pyplot(fig)
+    return fig
+
+try:
+    st.image(cached_figure(graph.fingerprint, "decomposition", draw_decomposition,
+                           {"p": int(p), "model": "add"}))
 
 except Exception as e:
     st.error(f"Erreur lors de la décomposition : {e}")
@@ -79,12 +86,13 @@ except Exception as e:
 st.subheader("📊 Nature de la saisonnalité")
 
 try:
-    test_s = test_additive_vs_multiplicative(series, p)
+    test_s = graph.seasonal_test(p)
 
     st.write("**Moyennes saisonnières :**", test_s["moyennes"])
     st.write("**Écarts-types :**", test_s["ecarts_type"])
     st.write(f"**Coefficient a :** {test_s['a']:.4f}")
     st.write(f"**Coefficient b :** {test_s['b']:.4f}")
+    st.write(f"**p-value (H0 : a = 0) :** {test_s['p_value']:.4f}")
     st.success(f"Conclusion : **{test_s['nature']}**")
 
 except Exception as e:
@@ -100,15 +108,23 @@ st.header("📊 Détection de la Saisonnalité")
 # -------------------------------------------------------------
 st.subheader("1️⃣ Analyse Graphique : ACF & PACF")
 
-fig_acf, ax_acf = plt.subplots(figsize=(8, 3))
-plot_acf(series, ax=ax_acf)
-ax_acf.set_title("ACF de la série")
-st.pyplot(fig_acf)
+n_obs = len(series.dropna())
+nlags = int(min(max(40, 2 * p), n_obs // 2 - 1))
+conf = 1.96 / np.sqrt(n_obs)
+
+def draw_correlogram(values, title):
+    fig, ax = subplots(figsize=(8, 3))
+    ax.stem(np.arange(nlags + 1), values)
+    ax.axhspan(-conf, conf, color="blue", alpha=0.1)
+    ax.set_title(title)
+    return fig
 
-fig_pacf, ax_pacf = plt.subplots(figsize=(8, 3))
-plot_pacf(series, ax=ax_pacf)
-ax_pacf.set_title("PACF de la série")
-st.pyplot(fig_pacf)
+st.image(cached_figure(graph.fingerprint, "acf",
+                       lambda: draw_correlogram(graph.acf(nlags), "ACF de la série"),
+                       {"nlags": nlags}))
+st.image(cached_figure(graph.fingerprint, "pacf",
+                       lambda: draw_correlogram(graph.pacf(nlags), "PACF de la série"),
+                       {"nlags": nlags}))
 
 st.info(
     "👉 **Une saisonnalité apparaît lorsque l’ACF montre des pics réguliers "
@@ -120,22 +136,27 @@ st.info(
 # -------------------------------------------------------------
 st.subheader("2️⃣ Détection automatique de la période")
 
-autocorr_values = np.correlate(series - np.mean(series), series - np.mean(series), mode="full")
-autocorr_values = autocorr_values[len(autocorr_values)//2:]
-autocorr_values = autocorr_values / autocorr_values[0]
+# Périodogramme (FFT) + validation par l'ACF : O(n log n)
+candidates = graph.periods(max_periods=3)
+detected_period = candidates[0]["periode"] if candidates else None
+
+def draw_autocorrelation():
+    autocorr_values = graph.acf(n_obs // 2)
+    lags = np.arange(len(autocorr_values))
 
-lags = np.arange(len(autocorr_values))
-threshold = 0.4
+    fig_auto, ax_auto = subplots(figsize=(8, 3))
+    plot_series(ax_auto, lags, autocorr_values)
+    for c in candidates:
+        ax_auto.axvline(c["periode"], color='red', linestyle='--', alpha=0.6)
+    ax_auto.set_title("Autocorrélation pour détection de saisonnalité")
+    return fig_auto
 
-candidate_lags = lags[(autocorr_values > threshold) & (lags > 1)]
-detected_period = candidate_lags[0] if len(candidate_lags) > 0 else None
+st.image(cached_figure(graph.fingerprint, "autocorrelation", draw_autocorrelation,
+                       {"nlags": n_obs // 2, "periodes": [c["periode"] for c in candidates]}))
 
-fig_auto, ax_auto = plt.subplots(figsize=(8, 3))
-ax_auto.plot(lags, autocorr_values)
-ax_auto.axhline(threshold, color='red', linestyle='--', label="Seuil")
-ax_auto.set_title("Autocorrélation pour détection de saisonnalité")
-ax_auto.legend()
-st.pyplot(fig_auto)
+if candidates:
+    st.write("**Périodes candidates (classées par puissance spectrale) :**")
+    st.dataframe(pd.DataFrame(candidates))
 
 if detected_period:
     st.success(f"📌 **Période saisonnière détectée : {detected_period}**")
@@ -148,9 +169,7 @@ else:
 st.subheader("3️⃣ Analyse Analytique (Variance entre périodes)")
 
 if detected_period and detected_period < len(series) // 2:
-    groups = [series[i::detected_period] for i in range(detected_period)]
-    stds = [g.std() for g in groups]
-    means = [g.mean() for g in groups]
+    means, stds = graph.group_stats(detected_period)
 
     df_season = pd.DataFrame({
         "Période": np.arange(1, detected_period+1),
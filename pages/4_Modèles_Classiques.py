@@ -1,49 +1,42 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from statsmodels.graphics.tsaplots import plot_acf
+import sys, os
+
+# === Fix import src ===
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from src.data.session_store import get_session_store
+from src.exploration.graph import get_analysis_graph
+from src.visualization.downsample import plot_series
 
 st.set_page_config(page_title="Modèles Classiques", page_icon="📐")
 def mape(y_true, y_pred):
-    y_true = np.array(y_true)
-    y_pred = np.array(y_pred)
+    y_true = np.array(y_true, dtype=float)
+    y_pred = np.array(y_pred, dtype=float)
 
-    mask = y_true != 0
+    mask = (y_true != 0) & ~np.isnan(y_pred)
     return np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100
 
 
 # =========================================================
-# 📌 Chargement du dataset (robuste)
+# 📌 Chargement de la série (magasin de session, sans copie)
 # =========================================================
-possible_keys = ["df", "df_raw", "df_loaded", "dataframe"]
-df = next((st.session_state.get(k) for k in possible_keys if k in st.session_state), None)
+store = get_session_store(st.session_state)
 
-if df is None:
+if "series" not in store:
     st.error("❌ Aucune série chargée. Veuillez importer les données d’abord.")
     st.stop()
 
-# =========================================================
-# 📌 Conversion de la colonne Date → datetime
-# =========================================================
-date_col = df.columns[0]
-df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-
-df = df.dropna(subset=[date_col]).reset_index(drop=True)
-dates = df[date_col]
-
-# =========================================================
-# 📌 Conversion valeurs : '96,1' → 96.1
-# =========================================================
-val_col = df.columns[1]
-df[val_col] = (
-    df[val_col]
-    .astype(str)
-    .str.replace(",", ".", regex=False)
-    .astype(float)
-)
+# Dates et valeurs déjà converties et nettoyées à l'import (page 1) ;
+# index positionnel : vue sur les mêmes valeurs
+dates = store.series().index
+series = store.positional()
 
-series = df[val_col]
+# Graphe d'analyses partagé (la MM centrée d'ordre k = nœud trend(k))
+graph = get_analysis_graph(series, st.session_state, fingerprint=store.fingerprint(form="positional"))
 
 # =========================================================
 # TITRE
@@ -70,46 +63,28 @@ if modele == "Moyenne Mobile":
     k = st.number_input("Choisissez la fenêtre (k)", min_value=2, max_value=20, value=3)
 
     # ---------------------------------------------------------
-    # 📌 Fonction correcte de Moyenne Mobile (cours USTHB)
+    # 📌 Moyenne Mobile centrée (cours USTHB)
+    # k impair : MA centrée ; k pair : centrage double
     # ---------------------------------------------------------
-    def moyenne_mobile_exacte(series, k):
-        n = len(series)
-        mm = [None] * n
-        m = k // 2
-
-        if k % 2 == 1:
-            # ---- k impair : MA centrée ----
-            for t in range(m, n - m):
-                mm[t] = np.mean(series[t-m : t+m+1])
-
-        else:
-            # ---- k pair : centrage double ----
-            mm_inter = [None] * n
-            for t in range(k-1, n):
-                mm_inter[t] = np.mean(series[t-k+1 : t+1])
-
-            for t in range(k, n):
-                if mm_inter[t] is not None and mm_inter[t-1] is not None:
-                    mm[t-1] = (mm_inter[t] + mm_inter[t-1]) / 2
-
-        return mm
-
     if st.button("🧮 Calculer la Moyenne Mobile"):
+        # Imports coûteux chargés au calcul, pas à l'ouverture de la page
+        import matplotlib.pyplot as plt
+        from statsmodels.graphics.tsaplots import plot_acf
+
         try:
-            mm_values = moyenne_mobile_exacte(series.values, k)
-            df_mm = df.copy()
-            df_mm[f"MM({k})"] = mm_values
+            mm_series = graph.trend(k)
+            mm_values = mm_series.to_numpy()
+            df_mm = pd.DataFrame({"Date": dates, f"MM({k})": mm_values})
 
             # ======================
             # 🧾 TABLEAU EXACT
             # ======================
             st.subheader(f"📋 Tableau de la Moyenne Mobile (k = {k})")
-            st.dataframe(df_mm[[date_col, f"MM({k})"]])
+            st.dataframe(df_mm)
 
             # ======================
             # Résidus + indicateurs
             # ======================
-            mm_series = pd.Series(mm_values)
             resid = series - mm_series
             resid = resid.dropna()
 
@@ -131,7 +106,7 @@ if modele == "Moyenne Mobile":
             # Résidus
             st.subheader("📉 Résidus")
             fig_res, ax_res = plt.subplots(figsize=(8, 3))
-            ax_res.plot(resid.values, marker="o")
+            plot_series(ax_res, resid.values, marker="o")
             ax_res.axhline(0, color="red", linestyle="--")
             st.pyplot(fig_res)
 
@@ -153,6 +128,9 @@ if modele == "Régression Linéaire":
     h = st.number_input("Nombre de périodes à prévoir :", 1, 24, 4)
 
     if st.button("📉 Calculer la Régression Linéaire"):
+        import matplotlib.pyplot as plt
+        from statsmodels.graphics.tsaplots import plot_acf
+
         try:
             # Encodage du temps
             t = np.arange(len(series))
@@ -178,10 +156,10 @@ if modele == "Régression Linéaire":
 
             # ===== Graphique =====
             fig, ax = plt.subplots(figsize=(10, 4))
-            ax.plot(dates, series, label="Série originale")
-            ax.plot(dates, trend, label="Tendance linéaire", linewidth=2)
+            plot_series(ax, dates, series, label="Série originale")
+            plot_series(ax, dates, trend, label="Tendance linéaire", linewidth=2)
 
-            future_dates = pd.date_range(start=dates.iloc[-1], periods=h+1, freq="MS")[1:]
+            future_dates = pd.date_range(start=dates[-1], periods=h+1, freq="MS")[1:]
 
             ax.plot(
                 future_dates,
@@ -210,7 +188,7 @@ if modele == "Régression Linéaire":
             # ===== Résidus =====
             st.subheader("📉 Résidus")
             fig_res, ax_res = plt.subplots(figsize=(8, 3))
-            ax_res.plot(resid, marker="o")
+            plot_series(ax_res, resid, marker="o")
             ax_res.axhline(0, color="red", linestyle="--")
             st.pyplot(fig_res)
 
@@ -2,10 +2,9 @@ import streamlit as st
 import sys, os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
-from statsmodels.tsa.holtwinters import SimpleExpSmoothing, ExponentialSmoothing, Holt
-from statsmodels.graphics.tsaplots import plot_acf
+# statsmodels / scipy sont importés là où ils servent (boutons, expanders) :
+# l'ouverture de la page n'attend pas leur chargement.
 
 # === Fix import src ===
 ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -18,6 +17,13 @@ from src.models.smoothing_manual import (
     holt_winters_additive_forecast,
     holt_winters_multiplicative_forecast
 )
+from src.data.session_store import get_session_store
+from src.jobs.manager import CANCELLED, DONE, get_job_manager
+from src.jobs.tasks import grid_search_job, grid_search_key
+from src.models.model_state import SmoothingState
+from src.output.run_store import get_run_store
+from src.visualization.downsample import plot_series
+from src.visualization.figure_cache import cached_figure, subplots
 def mape(y_true, y_pred):
     return np.mean(np.abs((y_true - y_pred) / y_true)) * 100
 
@@ -25,11 +31,15 @@ def mape(y_true, y_pred):
 # ----------------------------------------------------------
 # Vérification que la série existe
 # ----------------------------------------------------------
-if "series" not in st.session_state:
+store = get_session_store(st.session_state)
+if "series" not in store:
     st.warning("Veuillez d'abord importer une série dans l'onglet 1.")
     st.stop()
 
-series = st.session_state["series"].sort_index()
+# Triée une fois par session (vue canonique si elle l'est déjà)
+series = store.sorted()
+# Clé des figures mises en cache (série, type de graphique, paramètres)
+fingerprint = store.fingerprint(form="sorted")
 
 st.title("🔧 Modélisation & Prévisions")
 st.markdown("---")
@@ -81,6 +91,7 @@ with st.expander("Paramètres du modèle", expanded=True):
 # 3. BOUTON POUR LANCER LA PRÉVISION
 # -------------------------------------------------------------
 if st.button("📉 Lancer la prévision manuelle", type="primary"):
+    from statsmodels.tsa.holtwinters import SimpleExpSmoothing, ExponentialSmoothing
 
     try:
 
@@ -113,16 +124,22 @@ if st.button("📉 Lancer la prévision manuelle", type="primary"):
             "Prévision manuelle": forecast
         }).set_index("Date")
 
+        manual_params = {"modele": model_name, "alpha": alpha, "beta": beta, "gamma": gamma,
+                         "horizon": int(horizon)}
+
         # ---------------------- AFFICHAGE PREVISION ----------------------
         with st.expander("📈 Visualisation : Historique + Prévision manuelle", expanded=True):
 
-            fig, ax = plt.subplots(figsize=(10, 4))
-            ax.plot(series.index, series.values, label="Historique", linewidth=2)
-            ax.plot(future_dates, forecast, label="Prévision manuelle", linestyle="--", marker="o")
+            def draw_manual_forecast():
+                fig, ax = subplots(figsize=(10, 4))
+                plot_series(ax, series, label="Historique", linewidth=2)
+                ax.plot(future_dates, forecast, label="Prévision manuelle", linestyle="--", marker="o")
+
+                ax.grid(True)
+                ax.legend()
+                return fig
 
-            ax.grid(True)
-            ax.legend()
-            st.pyplot(fig)
+            st.image(cached_figure(fingerprint, "prevision_manuelle", draw_manual_forecast, manual_params))
 
             st.write("### 📄 Tableau des prévisions")
             st.dataframe(df_forecast_manual)
@@ -153,22 +170,33 @@ if st.button("📉 Lancer la prévision manuelle", type="primary"):
 
             residuals = fit_model.resid
 
+            def draw_residuals():
+                fig_r, ax_r = subplots(figsize=(10, 3))
+                plot_series(ax_r, residuals, marker="o")
+                ax_r.axhline(0, color="red", linestyle="--")
+                ax_r.grid(True)
+                return fig_r
+
+            def draw_histogram():
+                fig_h, ax_h = subplots(figsize=(10, 3))
+                ax_h.hist(residuals, bins=10, edgecolor="black")
+                return fig_h
+
+            def draw_acf():
+                from statsmodels.graphics.tsaplots import plot_acf
+
+                fig_acf, ax_acf = subplots(figsize=(10, 3))
+                plot_acf(residuals.dropna(), ax=ax_acf)
+                return fig_acf
+
             st.write("### 📌 Résidus dans le temps")
-            fig_r, ax_r = plt.subplots(figsize=(10, 3))
-            ax_r.plot(residuals.index, residuals.values, marker="o")
-            ax_r.axhline(0, color="red", linestyle="--")
-            ax_r.grid(True)
-            st.pyplot(fig_r)
+            st.image(cached_figure(fingerprint, "residus_manuel", draw_residuals, manual_params))
 
             st.write("### 📊 Histogramme des résidus")
-            fig_h, ax_h = plt.subplots(figsize=(10, 3))
-            ax_h.hist(residuals, bins=10, edgecolor="black")
-            st.pyplot(fig_h)
+            st.image(cached_figure(fingerprint, "histogramme_manuel", draw_histogram, manual_params))
 
             st.write("### 🔄 Autocorrélation (ACF)")
-            fig_acf, ax_acf = plt.subplots(figsize=(10, 3))
-            plot_acf(residuals.dropna(), ax=ax_acf)
-            st.pyplot(fig_acf)
+            st.image(cached_figure(fingerprint, "acf_manuel", draw_acf, manual_params))
 
         # ============================================================
         # — MÉTRIQUES
@@ -216,118 +244,87 @@ def compute_aicc(aic, n, k):
         return np.nan
     return aic + (2 * k * (k + 1)) / (n - k - 1)
 
-def grid_search(series):
-    alphas = np.linspace(0.1, 0.9, 9)
-    betas = np.linspace(0.1, 0.9, 9)
-    gammas = np.linspace(0.1, 0.9, 9)
-
-    results = []
-
-    # ========== SES ==========
-    best_ses = None
-    best_ses_mse = float("inf")
-    for a in alphas:
-        try:
-            m = SimpleExpSmoothing(series).fit(smoothing_level=a, optimized=False)
-            mse = np.mean((series - m.fittedvalues) ** 2)
-            if mse < best_ses_mse:
-                best_ses_mse = mse
-                best_ses = m
-        except:
-            pass
-
-    if best_ses:
-        n = len(series)
-        k = 1
-        results.append(["SES", best_ses_mse, best_ses.aic,
-                        compute_aicc(best_ses.aic, n, k), best_ses.bic])
-
-    # ========== HOLT ==========
-    best_holt = None
-    best_holt_mse = float("inf")
-    for a in alphas:
-        for b in betas:
-            try:
-                m = ExponentialSmoothing(series, trend="add").fit(
-                    smoothing_level=a, smoothing_trend=b, optimized=False
-                )
-                mse = np.mean((series - m.fittedvalues) ** 2)
-                if mse < best_holt_mse:
-                    best_holt_mse = mse
-                    best_holt = m
-            except:
-                pass
-
-    if best_holt:
-        n = len(series)
-        k = 2
-        results.append(["Holt", best_holt_mse, best_holt.aic,
-                        compute_aicc(best_holt.aic, n, k), best_holt.bic])
-
-    # ========== HW ADDITIF ==========
-    best_add = None
-    best_add_mse = float("inf")
-    for a in alphas:
-        for b in betas:
-            for g in gammas:
-                try:
-                    m = ExponentialSmoothing(series, trend="add", seasonal="add", seasonal_periods=4).fit(
-                        smoothing_level=a, smoothing_trend=b,
-                        smoothing_seasonal=g, optimized=False
-                    )
-                    mse = np.mean((series - m.fittedvalues) ** 2)
-                    if mse < best_add_mse:
-                        best_add_mse = mse
-                        best_add = m
-                except:
-                    pass
-
-    if best_add:
-        n = len(series); k = 3
-        results.append(["HW Additif", best_add_mse, best_add.aic,
-                        compute_aicc(best_add.aic, n, k), best_add.bic])
-
-    # ========== HW MULTIPLICATIF ==========
-    best_mul = None
-    best_mul_mse = float("inf")
-    for a in alphas:
-        for b in betas:
-            for g in gammas:
-                try:
-                    m = ExponentialSmoothing(series, trend="add", seasonal="mul", seasonal_periods=4).fit(
-                        smoothing_level=a, smoothing_trend=b,
-                        smoothing_seasonal=g, optimized=False
-                    )
-                    mse = np.mean((series - m.fittedvalues) ** 2)
-                    if mse < best_mul_mse:
-                        best_mul_mse = mse
-                        best_mul = m
-                except:
-                    pass
-
-    if best_mul:
-        n = len(series); k = 3
-        results.append(["HW Multiplicatif", best_mul_mse, best_mul.aic,
-                        compute_aicc(best_mul.aic, n, k), best_mul.bic])
-
-    return pd.DataFrame(results, columns=["Modèle", "MSE", "AIC", "AICc", "BIC"]), \
-           best_ses, best_holt, best_add, best_mul
+def save_grid_results(df_params, record=True):
+    """
+    Grid search terminé → session (tableau, états des meilleurs modèles)
+    et, si record (grid search lancé par l'utilisateur), historique des runs.
+    """
+    st.session_state["grid_results"] = df_params[["Modèle", "MSE", "AIC", "AICc", "BIC"]]
+    # États compacts (paramètres + niveau / tendance / saisons) : seuls les
+    # meilleurs modèles sont réajustés ici, les workers ne renvoient que les scores
+    best = {name: None for name in ("SES", "Holt", "HW Additif", "HW Multiplicatif")}
+    for _, row in df_params.iterrows():
+        best[row["Modèle"]] = SmoothingState.fit(series, row["Modèle"], row["alpha"], row["beta"], row["gamma"],
+                                                 seasonal_periods=4)
+    st.session_state["best_models"] = best
+
+    if not record or df_params.empty:
+        return
+
+    # === Historique (output/runs.sqlite) : paramètres retenus, métriques et
+    # prévision du meilleur modèle (AICc, comme le tableau ci-dessous) ===
+    best_name = df_params.sort_values("AICc").iloc[0]["Modèle"]
+    try:
+        store = get_run_store()
+        store.add_results(
+            store.start_run("app"),
+            st.session_state.get("value_col") or "serie",
+            grid=df_params,
+            forecast=best[best_name].forecast(int(horizon)),
+            model=best_name,
+            fingerprint=fingerprint,
+            n_obs=len(series),
+            seasonal_periods=4
+        )
+    except Exception as e:
+        st.warning(f"Historique non enregistré : {e}")
 
 
 # ------------------------------
-# Bouton GRID SEARCH
+# Bouton GRID SEARCH (tâche en arrière-plan, src/jobs/manager.py)
 # ------------------------------
-if st.button("🚀 Lancer Grid Search Automatique"):
-
-    df_gs, m_ses, m_holt, m_add, m_mul = grid_search(series)
-    st.session_state["grid_results"] = df_gs
-    st.session_state["best_models"] = {
-        "SES": m_ses,
-        "Holt": m_holt,
-        "HW Additif": m_add,
-        "HW Multiplicatif": m_mul
-    }
-    st.success("Grid Search terminé !")
+manager = get_job_manager()
+job = manager.get(st.session_state.get("grid_job"))
+
+col_run, col_cancel = st.columns(2)
+with col_run:
+    launch = st.button("🚀 Lancer Grid Search Automatique", disabled=job is not None and job.running)
+with col_cancel:
+    if job is not None and job.running and st.button("⏹️ Annuler le Grid Search"):
+        # Calcul partagé avec une autre session : il continue pour elle
+        if not job.release() and job.running:
+            st.session_state.pop("grid_job", None)
+            job = None
+
+if launch:
+    # Résultat déjà calculé pour ces données (toute session, cache partagé) : immédiat
+    job = manager.submit_cached("Grid Search (page 5)", grid_search_key(fingerprint, 4),
+                                lambda: grid_search_job(series, seasonal_periods=4))
+    st.session_state["grid_job"] = job.id
+    # Seuls les grid search lancés ici vont dans l'historique (pas le précalcul)
+    st.session_state["grid_job_user"] = job.id
+
+if job is not None and job.running:
+    st.info("⏳ Calcul en arrière-plan : les autres pages restent utilisables, "
+            "le résultat sera récupéré au retour sur cette page.")
+    bar = st.progress(0.0)
+    partial = st.empty()
+    while job.running:
+        bar.progress(job.progress(), text=f"{job.done}/{job.total} lots · {job.elapsed():.0f} s")
+        partial.dataframe(job.partial())
+        job.wait(0.5)
+    st.rerun()
+
+if job is not None and st.session_state.get("grid_job_collected") != job.id:
+    st.session_state["grid_job_collected"] = job.id
+    if job.status == DONE:
+        save_grid_results(job.result(), record=st.session_state.get("grid_job_user") == job.id)
+        st.success(f"Grid Search terminé ! ({job.elapsed():.1f} s)")
+    elif job.status == CANCELLED:
+        st.warning(f"Grid Search annulé ({job.done}/{job.total} lots). Meilleurs résultats partiels :")
+        st.dataframe(job.partial())
+    else:
+        st.error(f"Erreur lors du Grid Search : {job.error}")
 
 # ------------------------------
 # Affichage tableau Grid Search
@@ -377,8 +374,7 @@ else:
         # ---------------------------------------------------------
         # IC via RMSE
         # ---------------------------------------------------------
-        resid = model_opt.resid
-        rmse = np.sqrt(np.mean(resid**2))
+        rmse = np.sqrt(model_opt.mse)
         z = 1.96
 
         lower = forecast_ci - z * rmse
@@ -400,16 +396,20 @@ else:
         #  EXPANDER 2 : Graphique IC
         # ---------------------------------------------------------
         with st.expander("📈 Prévisions avec intervalles de confiance"):
-            fig, ax = plt.subplots(figsize=(10,4))
-            ax.plot(series.index, series.values, label="Historique")
-            ax.plot(forecast_ci.index, forecast_ci.values, marker="o", label="Prévision")
+            def draw_ci():
+                fig, ax = subplots(figsize=(10,4))
+                plot_series(ax, series, label="Historique")
+                ax.plot(forecast_ci.index, forecast_ci.values, marker="o", label="Prévision")
 
-            ax.fill_between(forecast_ci.index, lower, upper,
-                            color="gray", alpha=0.3, label="IC 95%")
+                ax.fill_between(forecast_ci.index, lower, upper,
+                                color="gray", alpha=0.3, label="IC 95%")
 
-            ax.grid(True)
-            ax.legend()
-            st.pyplot(fig)
+                ax.grid(True)
+                ax.legend()
+                return fig
+
+            st.image(cached_figure(fingerprint, "prevision_ic", draw_ci,
+                                   {"etat": model_opt.to_bytes().hex(), "horizon": int(horizon_ci)}))
 
     except Exception as e:
         st.error(f"Erreur lors du calcul : {e}")
@@ -420,6 +420,7 @@ else:
 st.header("4️⃣ Comparaison finale (Manuel vs Optimal)")
 
 if "forecast_manual" in st.session_state and "grid_results" in st.session_state:
+    from statsmodels.tsa.holtwinters import SimpleExpSmoothing, ExponentialSmoothing
 
     st.subheader("📌 Tableau comparatif AICc")
 
@@ -485,48 +486,62 @@ else:
 
     # Récupération des fitted values
     try:
-        fitted_vals = model_opt.fittedvalues
+        fitted_vals = model_opt.fitted_values(series)
     except:
         st.error("Impossible de récupérer les valeurs ajustées du modèle optimal.")
         fitted_vals = None
 
     if fitted_vals is not None:
         residuals = series - fitted_vals
+        optimal_params = {"etat": model_opt.to_bytes().hex()}
 
         # -----------------------------
         # Résidus dans le temps
         # -----------------------------
         with st.expander("📌 Résidus dans le temps", expanded=False):
-            fig_rt, ax_rt = plt.subplots(figsize=(10, 4))
-            ax_rt.plot(residuals.index, residuals.values, marker="o", linewidth=1.5)
-            ax_rt.axhline(0, color="red", linestyle="--", linewidth=1)
-            ax_rt.set_title("Résidus du modèle optimal")
-            ax_rt.grid(True)
-            st.pyplot(fig_rt)
+            def draw_residuals_opt():
+                fig_rt, ax_rt = subplots(figsize=(10, 4))
+                plot_series(ax_rt, residuals, marker="o", linewidth=1.5)
+                ax_rt.axhline(0, color="red", linestyle="--", linewidth=1)
+                ax_rt.set_title("Résidus du modèle optimal")
+                ax_rt.grid(True)
+                return fig_rt
+
+            st.image(cached_figure(fingerprint, "residus_optimal", draw_residuals_opt, optimal_params))
 
         # -----------------------------
         # Histogramme
         # -----------------------------
         with st.expander("📊 Histogramme des résidus"):
-            fig_res, ax_res = plt.subplots(figsize=(10, 4))
-            ax_res.hist(residuals.dropna(), bins=10, edgecolor="black")
-            ax_res.set_title("Distribution des résidus")
-            ax_res.grid(True)
-            st.pyplot(fig_res)
+            def draw_histogram_opt():
+                fig_res, ax_res = subplots(figsize=(10, 4))
+                ax_res.hist(residuals.dropna(), bins=10, edgecolor="black")
+                ax_res.set_title("Distribution des résidus")
+                ax_res.grid(True)
+                return fig_res
+
+            st.image(cached_figure(fingerprint, "histogramme_optimal", draw_histogram_opt, optimal_params))
 
         # -----------------------------
         # Autocorrélation (ACF)
         # -----------------------------
         with st.expander("🔄 Autocorrélation des résidus (ACF)"):
-            fig_acf, ax_acf = plt.subplots(figsize=(10, 4))
-            plot_acf(residuals.dropna(), ax=ax_acf)
-            ax_acf.set_title("ACF des résidus")
-            st.pyplot(fig_acf)
+            def draw_acf_opt():
+                from statsmodels.graphics.tsaplots import plot_acf
+
+                fig_acf, ax_acf = subplots(figsize=(10, 4))
+                plot_acf(residuals.dropna(), ax=ax_acf)
+                ax_acf.set_title("ACF des résidus")
+                return fig_acf
+
+            st.image(cached_figure(fingerprint, "acf_optimal", draw_acf_opt, optimal_params))
 
         # -----------------------------
         # Tests statistiques
         # -----------------------------
         with st.expander("🧪 Tests statistiques"):
+            from scipy.stats import shapiro
+            from statsmodels.stats.diagnostic import acorr_ljungbox
 
             choix_test = st.multiselect(
                 "Sélectionnez les tests à exécuter :",
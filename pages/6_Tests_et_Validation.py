@@ -1,12 +1,16 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import sys, os
 
-from statsmodels.graphics.tsaplots import plot_acf
-from statsmodels.stats.diagnostic import acorr_ljungbox
-from scipy.stats import shapiro
-from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+# === Fix import src ===
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from src.data.session_store import get_session_store
+from src.jobs.manager import DONE, PENDING, get_job_manager
+from src.jobs.tasks import rolling_origin_job, rolling_origin_key
 
 st.set_page_config(page_title="Tests & Validation", layout="wide")
 
@@ -16,17 +20,16 @@ st.set_page_config(page_title="Tests & Validation", layout="wide")
 # ======================================================
 st.title("🧪 Tests & Validation avancée")
 
-if "series" not in st.session_state:
+store = get_session_store(st.session_state)
+if "series" not in store:
     st.error("Aucune série chargée. Veuillez importer les données dans la page 1.")
     st.stop()
 
-series = st.session_state["series"]
-
-if series is None or len(series) < 5:
+if len(store.series()) < 5:
     st.error("La série est vide ou trop courte.")
     st.stop()
 
-series = series.dropna()   # *** CORRECTION ***
+series = store.dropna()   # sans valeurs manquantes, calculée une fois par session
 st.success("Série chargée avec succès !")
 
 
@@ -47,6 +50,8 @@ def mape(y_true, y_pred):
 #               Split 70/30 – 80/20
 # ======================================================
 def split_eval(series, ratio):
+    from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+
     n = len(series)
     train_size = int(n * ratio)
 
@@ -71,31 +76,6 @@ def split_eval(series, ratio):
     return m, rm
 
 
-# ======================================================
-#               Rolling-Origin robuste
-# ======================================================
-def rolling_origin(series):
-    m_list = []
-
-    for i in range(3, len(series) - 1):
-        train = series[:i]
-        true  = series[i]
-
-        try:
-            model = SimpleExpSmoothing(train).fit()
-            pred = model.forecast(1)[0]
-        except:
-            continue
-
-        if true != 0:
-            m_list.append(abs((true - pred) / true) * 100)
-
-    if len(m_list) == 0:
-        return np.nan
-
-    return np.mean(m_list)
-
-
 # ======================================================
 #               Affichage Validation Croisée
 # ======================================================
@@ -118,7 +98,24 @@ with col2:
 # Rolling Origin
 st.subheader("📍 Validation Rolling-Origin")
 
-m_ro = rolling_origin(series)
+# SES réajusté à chaque origine : calculé en arrière-plan (une tâche par série)
+manager = get_job_manager()
+job = manager.get(st.session_state.get("rolling_origin_job"))
+ro_key = rolling_origin_key(store.fingerprint(form="dropna"))
+if job is None or job.key != ro_key or job.status not in (DONE, PENDING):
+    job = manager.submit_cached("Rolling-Origin (page 6)", ro_key, lambda: rolling_origin_job(series))
+    st.session_state["rolling_origin_job"] = job.id
+
+if job.running:
+    bar = st.progress(0.0)
+    partial = st.empty()
+    while job.running:
+        bar.progress(job.progress(), text=f"{job.done}/{job.total} lots · {job.elapsed():.0f} s")
+        partial.write(f"• MAPE partiel : {np.nan_to_num(job.partial(), nan=0):.2f}%")
+        job.wait(0.5)
+    st.rerun()
+
+m_ro = job.result() if job.status == DONE else np.nan
 st.write(f"• **MAPE Rolling-Origin moyen :** {np.nan_to_num(m_ro, nan=0):.2f}%")
 
 if not np.isnan(m_ro) and m_ro < 5:
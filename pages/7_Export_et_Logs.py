@@ -0,0 +1,269 @@
+import os
+import sys
+
+import pandas as pd
+import streamlit as st
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.output.archive_export import build_results_archive, create_results_zip
+from src.output.columnar_export import available_formats
+from src.output.run_store import METRICS, get_run_store
+
+st.set_page_config(page_title="Export & Logs", layout="wide")
+
+st.title("📦 Export & Logs")
+
+# ======================================================
+#        1. Résultats disponibles en session
+# ======================================================
+st.header("1️⃣ Export des résultats")
+
+table_format = st.selectbox(
+    "Format des tables",
+    available_formats(),
+    help="Parquet / Feather : colonnes typées, fichiers plus petits et plus rapides à relire (nécessite pyarrow)."
+)
+
+tables = {
+    "serie": st.session_state.get("series"),
+    "prevision_manuelle": st.session_state.get("forecast_manual"),
+    "grid_search": st.session_state.get("grid_results")
+}
+members = {f"{name}.{table_format}": table for name, table in tables.items() if table is not None}
+
+if not members:
+    st.info("Aucun résultat en mémoire : importez une série (page 1) et lancez les modèles (page 5).")
+else:
+    st.write("Contenu de l'archive : " + ", ".join(f"`{name}`" for name in members))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        compression = st.selectbox(
+            "Compression",
+            ["auto", "deflate", "zstd", "store"],
+            help="auto : deflate, formats déjà compacts stockés sans compression ; zstd nécessite le paquet zstandard."
+        )
+    with col2:
+        incremental = st.checkbox(
+            "Ignorer les membres inchangés depuis la dernière archive",
+            value=False
+        )
+
+    col_a, col_b = st.columns(2)
+
+    # Archive en mémoire, téléchargée directement (aucun fichier temporaire)
+    with col_a:
+        if st.button("🗜️ Préparer l'archive à télécharger"):
+            try:
+                data, manifest = build_results_archive(
+                    members,
+                    compression=compression,
+                    previous=st.session_state.get("last_archive_manifest") if incremental else None,
+                    archive_name="resultats_prevision.zip"
+                )
+                st.session_state["archive_bytes"] = data
+                st.session_state["last_archive_manifest"] = manifest
+            except ImportError as e:
+                st.error(str(e))
+
+        if st.session_state.get("archive_bytes"):
+            st.download_button(
+                label="💾 Télécharger l'archive (ZIP)",
+                data=st.session_state["archive_bytes"],
+                file_name="resultats_prevision.zip",
+                mime="application/zip"
+            )
+
+    # Archive horodatée dans output/archives/ (+ CSV/JSON du dossier de travail)
+    with col_b:
+        if st.button("📁 Enregistrer dans output/archives/"):
+            try:
+                zip_path = create_results_zip(".", members=members, compression=compression,
+                                              incremental=incremental)
+                st.success(f"Archive créée : {zip_path}")
+            except ImportError as e:
+                st.error(str(e))
+
+# ======================================================
+#        2. Historique des runs (output/runs.sqlite)
+# ======================================================
+st.markdown("---")
+st.header("2️⃣ Historique des runs")
+
+store = get_run_store()
+df_runs = store.runs(limit=30)
+
+if df_runs.empty:
+    st.info("Aucun run enregistré (grid search de la page 5 ou `python -m src ... --store output/runs.sqlite`).")
+else:
+    col1, col2 = st.columns(2)
+    with col1:
+        metric = st.selectbox("Critère", METRICS, index=METRICS.index("AICc"))
+    with col2:
+        last_runs = st.number_input("Derniers runs", min_value=1, max_value=1000, value=30)
+
+    st.subheader("🥇 Meilleur modèle par série")
+    df_best = store.best_model_per_series(metric, int(last_runs))
+    st.dataframe(df_best)
+
+    if not df_best.empty:
+        # Même nom possible pour plusieurs fichiers : choix par ligne (nom + empreinte)
+        i = st.selectbox("Prévisions enregistrées de la série", df_best.index,
+                         format_func=lambda i: f"{df_best.at[i, 'serie']} ({df_best.at[i, 'empreinte'][:8]})")
+        st.dataframe(store.forecasts(df_best.at[i, "serie"], fingerprint=df_best.at[i, "empreinte"]))
+
+    with st.expander("📋 Derniers runs"):
+        st.dataframe(df_runs)
+
+# ======================================================
+#        3. Performances (sections chronométrées)
+# ======================================================
+st.markdown("---")
+st.header("3️⃣ Performances")
+
+from src.monitoring import timing
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    enabled = st.checkbox(
+        "Chronométrer les calculs",
+        value=timing.is_enabled(),
+        help="Import, grid search, bootstrap, décomposition, tests et tracés. Désactivé : aucun surcoût."
+    )
+with col2:
+    with_memory = st.checkbox(
+        "Mesurer le pic mémoire (tracemalloc)",
+        value=timing.memory_enabled(),
+        disabled=not enabled,
+        help="Ralentit nettement les calculs : à activer le temps d'un diagnostic."
+    )
+with col3:
+    if st.button("🧹 Remettre les compteurs à zéro"):
+        timing.reset()
+
+if enabled and (not timing.is_enabled() or with_memory != timing.memory_enabled()):
+    timing.enable(memory=with_memory)
+elif not enabled and timing.is_enabled():
+    timing.disable()
+
+df_timing = timing.stats()
+
+if df_timing.empty:
+    st.info("Aucune mesure : activez le chronométrage puis utilisez les autres pages.")
+else:
+    st.subheader("⏱️ Temps par section")
+    st.dataframe(df_timing.style.format({
+        "mur_s": "{:.3f}", "cpu_s": "{:.3f}", "moyenne_ms": "{:.1f}", "max_s": "{:.3f}", "pic_mo": "{:.1f}"
+    }, na_rep="—"))
+
+    st.subheader("🔥 Arbre d'appel (temps inclusif)")
+    df_flame = timing.flame_summary()
+    total = df_flame.loc[df_flame["profondeur"] == 0, "inclusif_s"].sum()
+    df_flame["part"] = df_flame["inclusif_s"] / total if total else 0.0
+    df_flame["section"] = ["    " * d + s for d, s in zip(df_flame["profondeur"], df_flame["section"])]
+    st.dataframe(df_flame[["section", "inclusif_s", "propre_s", "part"]].style.format({
+        "inclusif_s": "{:.3f}", "propre_s": "{:.3f}", "part": "{:.0%}"
+    }).bar(subset=["part"], color="#f4a261", vmin=0, vmax=1))
+
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        st.download_button("💾 Sections (CSV)", df_timing.to_csv(index=False).encode("utf-8"),
+                           file_name="performances.csv", mime="text/csv")
+    with col_b:
+        st.download_button("💾 Piles repliées (flamegraph)", timing.folded_stacks().encode("utf-8"),
+                           file_name="performances.folded", mime="text/plain",
+                           help="Format « a;b;c µs » : flamegraph.pl, speedscope.app, inferno.")
+    with col_c:
+        st.download_button("💾 Instantané (JSON)", timing.export_json().encode("utf-8"),
+                           file_name="performances.json", mime="application/json")
+
+# ======================================================
+#        4. Mémoire (dimensionnement du serveur)
+# ======================================================
+st.markdown("---")
+st.header("4️⃣ Mémoire")
+
+from src.monitoring import memory
+
+session = {k: st.session_state[k] for k in list(st.session_state.keys())}
+session_bytes = memory.session_total(session)
+rss = memory.process_memory_mb()
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Session courante", f"{session_bytes / 2**20:.1f} Mo")
+col2.metric("Processus (RSS)", f"{rss:.0f} Mo" if rss is not None else "—")
+with col3:
+    users = st.number_input("Utilisateurs simultanés", min_value=1, value=10, step=1)
+if rss is not None:
+    # Sessions indépendantes : une copie de l'état par utilisateur, le reste (modules, caches) partagé
+    estimate = rss + (users - 1) * session_bytes / 2**20
+    st.caption(f"Estimation pour {users} utilisateurs : ≈ {estimate:.0f} Mo "
+               f"(processus actuel + {users - 1} × session courante, hors pics de calcul ci-dessous).")
+
+st.subheader("🧮 Objets de la session")
+df_sizes = memory.session_sizes(session)
+if df_sizes.empty:
+    st.info("Session vide.")
+else:
+    st.dataframe(df_sizes.style.format({"taille_mo": "{:.3f}", "supplementaire_mo": "{:.3f}"}))
+    st.caption("« supplementaire_mo » : mémoire propre à la clé, les tampons déjà comptés pour une autre clé exclus.")
+
+st.subheader("👯 Tampons en double")
+df_dup = memory.duplicate_buffers(session)
+if df_dup.empty:
+    st.success("Aucun tableau recopié à l'identique dans la session.")
+else:
+    wasted = df_dup["gaspillage_mo"].sum()
+    if wasted > 0:
+        st.warning(f"{wasted:.2f} Mo occupés par des copies identiques (« copie ») ; "
+                   "les lignes « partagé » sont des vues sur un même tampon, sans surcoût.")
+    st.dataframe(df_dup.style.format({"taille_mo": "{:.3f}", "gaspillage_mo": "{:.3f}"}))
+
+st.subheader("📸 Allocations des calculs lourds (tracemalloc)")
+col1, col2 = st.columns(2)
+with col1:
+    track_allocations = st.checkbox(
+        "Enregistrer les allocations",
+        value=memory.is_enabled(),
+        help="Instantanés avant / après le chargement (page 1). "
+             "Ralentit ces calculs : à activer le temps d'un diagnostic."
+    )
+with col2:
+    if st.button("🧹 Effacer les instantanés"):
+        memory.clear_reports()
+
+if track_allocations and not memory.is_enabled():
+    memory.enable()
+elif not track_allocations and memory.is_enabled():
+    memory.disable()
+
+reports = memory.reports()
+if not reports:
+    st.info("Aucun instantané : activez l'enregistrement puis relancez un chargement ou un grid search.")
+else:
+    st.dataframe(memory.reports_table().style.format({
+        "duree_s": "{:.2f}", "conserve_mo": "{:.2f}", "pic_mo": "{:.2f}"
+    }))
+    labels = [f"{r['date']} · {r['operation']}" for r in reports]
+    choice = st.selectbox("Principales lignes allocatrices", range(len(reports)), format_func=labels.__getitem__)
+    st.dataframe(memory.top_allocators(reports[choice]).style.format({"ecart_ko": "{:.1f}", "taille_ko": "{:.1f}"}))
+
+st.subheader("🤝 Cache partagé entre sessions")
+from src.cache.shared import get_shared_cache
+from src.jobs.manager import get_job_manager
+
+cache_stats = get_shared_cache().stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Entrées", cache_stats["entrees"])
+col2.metric("Mémoire", f"{cache_stats['octets'] / 2**20:.1f} / {cache_stats['max_octets'] / 2**20:.0f} Mo")
+col3.metric("Hits / misses", f"{cache_stats['hits']} / {cache_stats['misses']}")
+col4.metric("Calculs partagés", cache_stats["attentes"],
+            help="Demandes servies en attendant le calcul d'une autre session.")
+st.caption(f"Copie disque : {cache_stats['disque'] or 'désactivée (ANAL_CACHE_DIR)'} · "
+           f"hits disque {cache_stats['hits_disque']} · évictions {cache_stats['evictions']}")
+
+jobs = get_job_manager().jobs()
+if jobs:
+    with st.expander("⚙️ Tâches en arrière-plan"):
+        st.dataframe(pd.DataFrame([job.summary() for job in jobs]))
@@ -0,0 +1,61 @@
+import argparse
+import sys
+
+from src.pipeline.batch import check_output_format, load_config, run_batch
+
+
+def main(argv=None):
+    """
+    Ligne de commande : python -m src <fichiers ou dossiers> [options]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Prévision par lot : import → nettoyage → période → grid search → prévision → export."
+    )
+    parser.add_argument("inputs", nargs="+", help="Fichiers CSV/Excel ou dossiers à traiter")
+    parser.add_argument("--config", help="Fichier de configuration JSON")
+    parser.add_argument("--output", dest="output_dir", help="Dossier de sortie")
+    parser.add_argument("--workers", type=int, default=1, help="Nombre de processus (défaut : 1)")
+    parser.add_argument("--horizon", type=int, help="Horizon de prévision")
+    parser.add_argument("--period", type=int, help="Période saisonnière (défaut : détection automatique)")
+    parser.add_argument("--date-col", dest="date_col", help="Colonne des dates")
+    parser.add_argument("--value-col", dest="value_col", help="Colonne des valeurs")
+    parser.add_argument("--format", dest="output_format", choices=["csv", "parquet", "feather"],
+                        help="csv : un dossier par série ; parquet / feather : tables panel")
+    parser.add_argument("--float32", action="store_true", default=None, help="Tables panel en float32")
+    parser.add_argument("--store", dest="run_store", help="Base SQLite où enregistrer l'historique du lot")
+    parser.add_argument("--engine", choices=["statsmodels", "native"],
+                        help="Moteur de lissage (native : sans statsmodels, voir benchmarks/parity.py)")
+    args = parser.parse_args(argv)
+
+    config = load_config(
+        args.config,
+        output_dir=args.output_dir,
+        horizon=args.horizon,
+        period=args.period,
+        date_col=args.date_col,
+        value_col=args.value_col,
+        output_format=args.output_format,
+        float32=args.float32,
+        run_store=args.run_store,
+        engine=args.engine
+    )
+    try:
+        check_output_format(config["output_format"])
+    except ValueError as e:
+        parser.error(str(e))
+
+    def progress(i, total, summary):
+        status = summary["statut"]
+        detail = summary.get("modele") if status == "ok" else summary.get("erreur")
+        print(f"[{i}/{total}] {summary['serie']} : {status} ({detail})")
+
+    df_summary = run_batch(args.inputs, config, workers=args.workers, progress=progress)
+
+    n_ok = int((df_summary["statut"] == "ok").sum()) if len(df_summary) else 0
+    print(f"✅ {n_ok}/{len(df_summary)} séries traitées → {config['output_dir']}")
+    return 0 if n_ok == len(df_summary) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from src.data.fingerprint import params_fingerprint
+from src.monitoring.memory import available_memory_mb, deep_sizeof
+
+# Cache de résultats partagé par toutes les sessions du processus Streamlit.
+# Clé : contenu (empreinte de la série + analyse + paramètres), donc deux
+# utilisateurs qui chargent le même fichier partagent les mêmes résultats.
+# - un seul calcul par clé : les demandes concurrentes attendent le premier ;
+# - mémoire bornée (octets) et éviction LRU quand la machine manque de mémoire ;
+# - copie optionnelle sur disque (pickle) qui survit aux redémarrages.
+# Les valeurs sont partagées entre sessions : ne pas les modifier en place.
+#
+#   ANAL_CACHE_DIR=output/cache ANAL_CACHE_MAX_MB=1024 streamlit run app.py
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MIN_FREE_MB = 512           # sous ce seuil de mémoire libre, le cache se vide
+DEFAULT_DISK_MAX_BYTES = 2 * 1024**3
+
+
+# --------------------------------------------------------
+# 1. Copie sur disque
+# --------------------------------------------------------
+
+class DiskStore:
+    """
+    Valeurs picklées dans directory (un fichier par clé, écriture atomique),
+    les moins récemment utilisées supprimées au-delà de max_bytes.
+    Répertoire local de confiance uniquement (pickle).
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_DISK_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, params_fingerprint(key) + ".pkl")
+
+    def load(self, key):
+        """
+        (trouvé, valeur). Un fichier illisible est supprimé.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            self._remove(path)
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def save(self, key, value):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            self._remove(tmp)
+            return
+        self._prune()
+
+    def _prune(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                try:
+                    st = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# --------------------------------------------------------
+# 2. Cache partagé (un calcul par clé)
+# --------------------------------------------------------
+
+class SharedCache:
+    """
+    Cache thread-safe clé → valeur, borné en octets (taille profonde des
+    valeurs), avec calcul unique par clé (get_or_compute) et copie disque
+    optionnelle (DiskStore).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, min_free_mb=DEFAULT_MIN_FREE_MB, disk=None):
+        self.max_bytes = max_bytes
+        self.min_free_mb = min_free_mb
+        self.disk = disk
+        self._items = OrderedDict()         # clé → (valeur, octets)
+        self._inflight = {}                 # clé → Future du calcul en cours
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0                      # calculs évités en attendant une autre session
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Valeur en mémoire, sinon sur disque (remise en mémoire), sinon default.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+        if self.disk is not None:
+            found, value = self.disk.load(key)
+            if found:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, value)
+                return value
+        return default
+
+    def put(self, key, value, persist=True):
+        self._store(key, value)
+        if persist and self.disk is not None:
+            self.disk.save(key, value)
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Valeur de la clé ; compute() n'est appelé que par la première
+        demande, les demandes concurrentes (autres sessions) attendent son
+        résultat. Les erreurs ne sont pas mises en cache.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.waits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            found, value = self.disk.load(key) if self.disk is not None else (False, None)
+            if found:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, value)
+            else:
+                value = self.put(key, compute())
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _store(self, key, value):
+        size = deep_sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._items[key] = (value, size)
+            self._size += size
+            self._evict(self._size - self.max_bytes)
+        self.relieve_pressure()
+
+    def _evict(self, n_bytes):
+        """
+        Évince les entrées les moins récemment servies jusqu'à libérer n_bytes
+        (verrou déjà pris).
+        """
+        freed = 0
+        while self._items and freed < n_bytes:
+            _, (_, size) = self._items.popitem(last=False)
+            self._size -= size
+            freed += size
+            self.evictions += 1
+        return freed
+
+    def relieve_pressure(self):
+        """
+        Mémoire libre de la machine sous min_free_mb : évince de quoi
+        revenir au seuil (tout le cache au besoin). Les valeurs évincées
+        restent sur disque si la copie disque est active.
+        """
+        free_mb = available_memory_mb()
+        if free_mb is None or free_mb >= self.min_free_mb:
+            return 0
+        with self._lock:
+            return self._evict((self.min_free_mb - free_mb) * 2**20)
+
+    def invalidate(self, fingerprint=None):
+        """
+        Supprime de la mémoire les entrées dont la clé contient fingerprint
+        (tout le cache si fingerprint est None).
+        """
+        with self._lock:
+            keys = [k for k in self._items if fingerprint is None or fingerprint in k]
+            for k in keys:
+                self._size -= self._items.pop(k)[1]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entrees": len(self._items),
+                "octets": self._size,
+                "max_octets": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "attentes": self.waits,
+                "hits_disque": self.disk_hits,
+                "evictions": self.evictions,
+                "en_cours": len(self._inflight),
+                "disque": self.disk.directory if self.disk is not None else None
+            }
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_cache():
+    """
+    Instance partagée par processus. Réglages par variables d'environnement :
+    ANAL_CACHE_MAX_MB (mémoire), ANAL_CACHE_MIN_FREE_MB (seuil de mémoire
+    libre), ANAL_CACHE_DIR (copie disque, désactivée si absente),
+    ANAL_CACHE_DISK_MAX_MB.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            env = os.environ
+            directory = env.get("ANAL_CACHE_DIR")
+            disk = None
+            if directory:
+                disk = DiskStore(directory, int(float(env.get("ANAL_CACHE_DISK_MAX_MB", DEFAULT_DISK_MAX_BYTES / 2**20)) * 2**20))
+            _CACHE = SharedCache(
+                max_bytes=int(float(env.get("ANAL_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 2**20)) * 2**20),
+                min_free_mb=float(env.get("ANAL_CACHE_MIN_FREE_MB", DEFAULT_MIN_FREE_MB)),
+                disk=disk
+            )
+        return _CACHE
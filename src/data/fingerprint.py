@@ -0,0 +1,38 @@
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+
+
+def series_fingerprint(series):
+    """
+    Empreinte (hash hexadécimal) des valeurs et de l'index d'une série.
+    Deux séries identiques ont la même empreinte ; toute modification
+    des données en change l'empreinte.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    values = np.ascontiguousarray(np.asarray(series, dtype=float))
+    h.update(values.view(np.uint8))
+
+    if isinstance(series, (pd.Series, pd.DataFrame)):
+        index_hash = pd.util.hash_pandas_object(series.index, index=False)
+        h.update(np.ascontiguousarray(index_hash.to_numpy()).view(np.uint8))
+
+    return h.hexdigest()
+
+
+def params_fingerprint(*parts):
+    """
+    Empreinte stable d'un ensemble de paramètres (types JSON, tuples, numpy).
+    """
+    payload = json.dumps(parts, sort_keys=True, default=_json_default)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
@@ -1,11 +1,99 @@
 import pandas as pd
 
-def load_time_series(path, date_col, value_col):
-    df = df_raw.copy()
+from src.monitoring.timing import timed
 
+# Formats de date essayés dans l'ordre (comme la page d'importation)
+DATE_FORMATS = [
+    '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y',
+    '%Y.%m.%d', '%d.%m.%Y', '%m.%d.%Y',
+    '%Y %m %d', '%d %m %Y', '%m %d %Y',
+    '%Y-%m', '%Y/%m', '%m-%Y', '%m/%Y'
+]
 
-    df[value_col] = df[value_col].astype(str).str.replace(',', '.').astype(float)
-    df[date_col] = pd.to_datetime(df[date_col], dayfirst=True)
-    df = df.set_index(date_col)
 
-    return df[value_col]
+@timed("import.lecture")
+def read_table(path):
+    """
+    Lit un fichier CSV (séparateur , ; ou tabulation) ou Excel.
+    """
+    path = str(path)
+    if path.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(path)
+
+    for sep in [',', ';', '\t']:
+        try:
+            df = pd.read_csv(path, sep=sep)
+        except Exception:
+            continue
+        if df.shape[1] > 1:
+            return df
+
+    return pd.read_csv(path, sep=None, engine="python")
+
+
+@timed("import.valeurs")
+def clean_numeric_column(col):
+    """
+    Nettoie une colonne numérique : espaces, virgule décimale,
+    caractères parasites. Les valeurs inexploitables deviennent NaN.
+    """
+    if pd.api.types.is_numeric_dtype(col):
+        return col.astype(float)
+
+    cleaned = (
+        col.astype(str)
+        .str.strip()
+        .str.replace(',', '.', regex=False)
+        .str.replace(r'[^0-9.\-]', '', regex=True)
+    )
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+@timed("import.dates")
+def parse_dates(col):
+    """
+    Convertit une colonne en dates en essayant les formats usuels.
+    Renvoie (dates, format détecté ou None si inféré).
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return pd.to_datetime(col, format=date_format, errors='raise'), date_format
+        except Exception:
+            continue
+
+    return pd.to_datetime(col, errors='coerce'), None
+
+
+@timed("import.nettoyage")
+def clean_series(df, date_col, value_col, remove_na=True, sort_dates=True):
+    """
+    Nettoyage automatique (valeurs, dates, NaN, tri) → série indexée par date.
+    """
+    df = df[[date_col, value_col]].copy()
+
+    df[value_col] = clean_numeric_column(df[value_col])
+    df[date_col], _ = parse_dates(df[date_col])
+
+    if remove_na:
+        df = df.dropna(subset=[date_col, value_col])
+
+    if sort_dates:
+        df = df.sort_values(date_col)
+
+    return df.set_index(date_col)[value_col]
+
+
+@timed("import.chargement")
+def load_time_series(path, date_col=None, value_col=None):
+    """
+    Charge et nettoie une série depuis un fichier.
+    Par défaut : première colonne = dates, deuxième = valeurs.
+    """
+    df_raw = read_table(path)
+
+    if date_col is None:
+        date_col = df_raw.columns[0]
+    if value_col is None:
+        value_col = [c for c in df_raw.columns if c != date_col][0]
+
+    return clean_series(df_raw, date_col, value_col)
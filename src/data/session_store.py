@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from src.data.fingerprint import series_fingerprint
+
+# Données de la session Streamlit : une seule copie par série.
+# Les valeurs sont stockées une fois (tableau float64 en lecture seule) ;
+# les pages reçoivent des vues sans copie et des formes dérivées (triée,
+# sans valeurs manquantes, différenciée, index positionnel) calculées au
+# premier appel puis réutilisées à chaque rerun.
+
+
+# --------------------------------------------------------
+# 1. Série canonique et formes dérivées
+# --------------------------------------------------------
+
+class _Entry:
+    __slots__ = ("values", "index", "name", "view", "cache")
+
+    def __init__(self, series, name):
+        values = np.array(series, dtype=float)      # seule copie des données
+        values.flags.writeable = False
+        self.values = values
+        self.index = series.index
+        self.name = name
+        self.view = pd.Series(values, index=self.index, name=name, copy=False)
+        self.cache = {}
+
+
+class SessionDataStore:
+    """
+    Séries de la session, chacune conservée une seule fois.
+    Les formes dérivées partagent la mémoire de la série canonique quand
+    c'est possible : une série déjà triée ou sans valeur manquante est
+    renvoyée telle quelle, l'index positionnel est une vue.
+    Les tableaux sont en lecture seule : une page qui veut modifier les
+    données travaille sur sa propre copie (.copy()).
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def put(self, series, name="series"):
+        """
+        Enregistre (ou remplace) une série et renvoie sa vue canonique.
+        """
+        entry = _Entry(series, getattr(series, "name", None))
+        self._entries[name] = entry
+        return entry.view
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def names(self):
+        return list(self._entries)
+
+    def remove(self, name="series"):
+        self._entries.pop(name, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _entry(self, name):
+        if name not in self._entries:
+            raise KeyError(f"Aucune série « {name} » dans la session.")
+        return self._entries[name]
+
+    def _derived(self, name, key, compute):
+        cache = self._entry(name).cache
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    # --- Vues ---
+    def series(self, name="series"):
+        """
+        Série canonique (valeurs float64 en lecture seule, aucune copie).
+        """
+        return self._entry(name).view
+
+    def values(self, name="series"):
+        """
+        Tableau float64 sous-jacent (lecture seule).
+        """
+        return self._entry(name).values
+
+    def positional(self, name="series"):
+        """
+        Mêmes valeurs avec un index 0..n-1 (vue, aucune copie).
+        """
+        def compute():
+            entry = self._entry(name)
+            return pd.Series(entry.values, index=pd.RangeIndex(len(entry.values)), name=entry.name, copy=False)
+        return self._derived(name, ("positional",), compute)
+
+    # --- Formes dérivées ---
+    def sorted(self, name="series"):
+        """
+        Série triée par index (la vue canonique si elle l'est déjà).
+        """
+        def compute():
+            view = self._entry(name).view
+            return view if view.index.is_monotonic_increasing else _read_only(view.sort_index())
+        return self._derived(name, ("sorted",), compute)
+
+    def dropna(self, name="series"):
+        """
+        Série sans valeurs manquantes (la vue canonique s'il n'y en a pas).
+        """
+        def compute():
+            view = self._entry(name).view
+            return view if not np.isnan(self._entry(name).values).any() else _read_only(view.dropna())
+        return self._derived(name, ("dropna",), compute)
+
+    def diff(self, name="series", lag=1, dropna=True):
+        """
+        Série différenciée à l'ordre lag (calculée sur la série triée).
+        """
+        def compute():
+            d = self.sorted(name).diff(lag)
+            return _read_only(d.dropna() if dropna else d)
+        return self._derived(name, ("diff", lag, dropna), compute)
+
+    def fingerprint(self, name="series", form="series"):
+        """
+        Empreinte d'une forme (series, sorted, dropna, positional), calculée une fois.
+        """
+        return self._derived(name, ("fingerprint", form), lambda: series_fingerprint(getattr(self, form)(name)))
+
+
+def _read_only(series):
+    values = series.to_numpy()
+    if isinstance(values, np.ndarray) and values.flags.owndata:
+        values.flags.writeable = False
+    return series
+
+
+# --------------------------------------------------------
+# 2. Accès depuis les pages
+# --------------------------------------------------------
+
+def get_session_store(state, key="data_store"):
+    """
+    Magasin de données de la session (ex : st.session_state), créé au
+    premier appel. Une série déjà présente sous "series" (ancienne session)
+    y est reprise.
+    """
+    if key not in state:
+        state[key] = SessionDataStore()
+        if state.get("series") is not None:
+            state["series"] = state[key].put(state["series"])
+    return state[key]
@@ -1,19 +1,28 @@
-import matplotlib.pyplot as plt
+from src.exploration.streaming import StreamingStats
+from src.monitoring.timing import timed
 
 def describe_series(series):
-    stats = {
-        "count": series.count(),
-        "mean": series.mean(),
-        "std": series.std(),
-        "min": series.min(),
-        "max": series.max()
-    }
-    return stats
+    """
+    count, mean, std, min, max en une seule passe (accumulateur en flux).
+    """
+    acc = StreamingStats(sketch_size=None).update(series)
+    return acc.describe()
 
-def plot_series(series):
-    plt.plot(series)
-    plt.title("Série temporelle")
-    plt.xlabel("Date")
-    plt.ylabel("Valeurs")
-    plt.grid(True)
-    plt.show()
+@timed("trace.serie")
+def plot_series(series, ax=None):
+    """
+    Trace la série sur ax (ou une nouvelle Figure) et retourne la Figure.
+    """
+    from matplotlib.figure import Figure
+
+    from src.visualization.downsample import plot_series as plot_downsampled
+
+    fig = ax.figure if ax is not None else Figure(figsize=(10, 4))
+    ax = ax if ax is not None else fig.subplots()
+
+    plot_downsampled(ax, series)
+    ax.set_title("Série temporelle")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Valeurs")
+    ax.grid(True)
+    return fig
@@ -1,21 +1,25 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 from src.models.moving_average import (
     extract_trend,
-    extract_seasonality_additive
+    extract_seasonality_additive,
+    extract_seasonality_multiplicative
 )
+from src.monitoring.timing import timed
+from src.visualization.downsample import plot_series
 
 # --------------------------------------------------------
 # 1. Décomposition additive
 # --------------------------------------------------------
 
-def decomposition_additive(series, p):
+@timed("decomposition.additive")
+def decomposition_additive(series, p, trend=None):
     """
     Décomposition additive :
     Y = T + S + R
+    trend : tendance déjà calculée (ex : par le graphe d'analyse), sinon MM(p)
     """
     # Tendance
-    trend = extract_trend(series, p)
+    if trend is None:
+        trend = extract_trend(series, p)
 
     # Saison
     season = extract_seasonality_additive(series, trend, p)
@@ -30,26 +34,18 @@ def decomposition_additive(series, p):
 # 2. Décomposition multiplicative
 # --------------------------------------------------------
 
-def decomposition_multiplicative(series, p):
+@timed("decomposition.multiplicative")
+def decomposition_multiplicative(series, p, trend=None):
     """
     Décomposition multiplicative :
     Y = T * S * R
     (Attention : valeurs doivent être positives)
     """
-    trend = extract_trend(series, p)
+    if trend is None:
+        trend = extract_trend(series, p)
 
-    season = series / trend
-
-    # Moyenne par période
-    indices = {}
-    for i in range(p):
-        indices[i] = season[i::p].mean()
-
-    seasonal_values = []
-    for i in range(len(series)):
-        seasonal_values.append(indices[i % p])
-
-    season_serie = pd.Series(seasonal_values, index=series.index)
+    # Moyenne par période des rapports Y / T
+    season_serie = extract_seasonality_multiplicative(series, trend, p)
 
     residuals = series / (trend * season_serie)
 
@@ -60,28 +56,25 @@ def decomposition_multiplicative(series, p):
 # 3. Fonction d'affichage
 # --------------------------------------------------------
 
-def plot_decomposition(series, trend, season, residuals):
-    plt.figure(figsize=(10, 8))
-
-    plt.subplot(4,1,1)
-    plt.plot(series)
-    plt.title("Série originale")
-    plt.grid(True)
-
-    plt.subplot(4,1,2)
-    plt.plot(trend)
-    plt.title("Tendance")
-    plt.grid(True)
-
-    plt.subplot(4,1,3)
-    plt.plot(season)
-    plt.title("Saisonnalité")
-    plt.grid(True)
-
-    plt.subplot(4,1,4)
-    plt.plot(residuals)
-    plt.title("Résidus")
-    plt.grid(True)
-
-    plt.tight_layout()
-    plt.show()
+@timed("trace.decomposition")
+def plot_decomposition(series, trend, season, residuals, fig=None):
+    """
+    Série, tendance, saisonnalité et résidus sur 4 axes superposés.
+    Retourne la Figure (API objet : aucun état pyplot global).
+    """
+    from matplotlib.figure import Figure
+
+    fig = fig if fig is not None else Figure(figsize=(10, 8))
+    axs = fig.subplots(4, 1)
+
+    for ax, values, title in zip(
+        axs,
+        (series, trend, season, residuals),
+        ("Série originale", "Tendance", "Saisonnalité", "Résidus")
+    ):
+        plot_series(ax, values)
+        ax.set_title(title)
+        ax.grid(True)
+
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,170 @@
+from collections import OrderedDict
+
+from src.data.fingerprint import series_fingerprint
+from src.models.moving_average import (
+    extract_trend,
+    extract_seasonality_additive,
+    extract_seasonality_multiplicative
+)
+from src.exploration.analysis import describe_series
+from src.exploration.spectral import acf_fft, pacf_levinson, detect_periods
+from src.exploration.test_saison import (
+    seasonal_group_stats,
+    test_additive_vs_multiplicative
+)
+
+# --------------------------------------------------------
+# 1. Graphe d'analyses paresseux et mémoïsé
+# --------------------------------------------------------
+
+class AnalysisGraph:
+    """
+    Graphe d'analyses attaché à une série.
+    Chaque nœud (trend(p), seasonal(p), residuals(p), acf, period...)
+    est calculé au premier appel puis servi depuis le cache ; les nœuds
+    dépendants réutilisent les nœuds amont (ex : residuals → seasonal → trend).
+    shared : cache partagé entre sessions (src/cache/shared.py) ; un nœud
+    déjà calculé pour les mêmes données par une autre session y est repris.
+    """
+
+    def __init__(self, series, fingerprint=None, shared=None):
+        self.series = series
+        self.fingerprint = fingerprint or series_fingerprint(series)
+        self.shared = shared
+        self._cache = {}
+
+    def _shared_key(self, key):
+        return ("analyse", self.fingerprint) + key
+
+    def _node(self, key, compute):
+        if key not in self._cache:
+            if self.shared is not None:
+                self._cache[key] = self.shared.get_or_compute(self._shared_key(key), compute)
+            else:
+                self._cache[key] = compute()
+        return self._cache[key]
+
+    def cached_nodes(self):
+        return list(self._cache)
+
+    def cached_values(self):
+        """
+        {clé: valeur} des nœuds déjà calculés.
+        """
+        return dict(self._cache)
+
+    def preload(self, nodes):
+        """
+        Ajoute des nœuds calculés ailleurs (workers de précalcul) sans
+        remplacer ceux déjà présents ; le cache partagé reçoit ceux qui
+        lui manquent (jamais rangés ou évincés).
+        """
+        for key, value in nodes.items():
+            self._cache.setdefault(key, value)
+            if self.shared is not None and self._shared_key(key) not in self.shared:
+                self.shared.put(self._shared_key(key), value)
+
+    # --- Statistiques ---
+    def describe(self):
+        return self._node(("describe",), lambda: describe_series(self.series))
+
+    def stationarity(self):
+        """
+        Tests ADF et KPSS (statsmodels).
+        """
+        def compute():
+            from src.exploration.stationarity import adf_test, kpss_test
+            return adf_test(self.series), kpss_test(self.series)
+        return self._node(("stationarity",), compute)
+
+    # --- Décomposition ---
+    def trend(self, p):
+        return self._node(("trend", p), lambda: extract_trend(self.series, p))
+
+    def seasonal(self, p, model="add"):
+        def compute():
+            if model == "add":
+                return extract_seasonality_additive(self.series, self.trend(p), p)
+            return extract_seasonality_multiplicative(self.series, self.trend(p), p)
+        return self._node(("seasonal", p, model), compute)
+
+    def seasonal_index(self, p, model="add"):
+        return self._node(
+            ("seasonal_index", p, model),
+            lambda: self.seasonal(p, model).to_numpy()[:p]
+        )
+
+    def residuals(self, p, model="add"):
+        def compute():
+            if model == "add":
+                return self.series - self.trend(p) - self.seasonal(p, model)
+            return self.series / (self.trend(p) * self.seasonal(p, model))
+        return self._node(("residuals", p, model), compute)
+
+    def decomposition(self, p, model="add"):
+        """
+        (tendance, saisonnalité, résidus), comme decomposition_additive / multiplicative.
+        """
+        return self.trend(p), self.seasonal(p, model), self.residuals(p, model)
+
+    # --- Saisonnalité ---
+    def group_stats(self, p):
+        return self._node(("group_stats", p), lambda: seasonal_group_stats(self.series, p))
+
+    def seasonal_test(self, p):
+        return self._node(
+            ("seasonal_test", p),
+            lambda: test_additive_vs_multiplicative(self.series, p)
+        )
+
+    # --- Autocorrélations et période ---
+    def acf(self, nlags):
+        return self._node(("acf", nlags), lambda: acf_fft(self.series, nlags))
+
+    def pacf(self, nlags):
+        return self._node(("pacf", nlags), lambda: pacf_levinson(self.series, nlags))
+
+    def periods(self, max_periods=3):
+        return self._node(
+            ("periods", max_periods),
+            lambda: detect_periods(self.series, max_periods=max_periods)
+        )
+
+    def period(self):
+        candidates = self.periods()
+        return candidates[0]["periode"] if candidates else None
+
+
+# --------------------------------------------------------
+# 2. Accès depuis les pages (invalidation automatique)
+# --------------------------------------------------------
+
+def get_analysis_graph(series, store, key="analysis_graphs", max_graphs=4, fingerprint=None, shared=None):
+    """
+    Renvoie le graphe d'analyses de la série, conservé dans store
+    (ex : st.session_state). Le graphe est retrouvé par empreinte des données :
+    une série modifiée obtient automatiquement un nouveau graphe.
+    Seuls les max_graphs derniers graphes sont conservés.
+    fingerprint : empreinte déjà connue (SessionDataStore.fingerprint), évite
+    de hacher la série à chaque rerun.
+    shared : cache partagé entre sessions (par défaut celui du processus).
+    """
+    if key not in store:
+        store[key] = OrderedDict()
+    graphs = store[key]
+
+    fingerprint = fingerprint or series_fingerprint(series)
+    if fingerprint in graphs:
+        graphs.move_to_end(fingerprint)
+        return graphs[fingerprint]
+
+    if shared is None:
+        from src.cache.shared import get_shared_cache
+        shared = get_shared_cache()
+
+    graph = AnalysisGraph(series, fingerprint, shared)
+    graphs[fingerprint] = graph
+    while len(graphs) > max_graphs:
+        graphs.popitem(last=False)
+
+    return graph
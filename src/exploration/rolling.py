@@ -0,0 +1,204 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Taille max (en nombre de valeurs) d'un bloc de fenêtres pour médiane / MAD
+_BLOCK_VALUES = 8_000_000
+
+# Facteur de cohérence MAD → écart-type (loi normale)
+MAD_SCALE = 1.4826
+
+# --------------------------------------------------------
+# 0. Outils internes
+# --------------------------------------------------------
+
+def _as_2d(data):
+    """
+    Série ou panel → (tableau (n, k) float, index, colonnes ou None).
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.to_numpy(dtype=float), data.index, data.columns
+    if isinstance(data, pd.Series):
+        return data.to_numpy(dtype=float)[:, None], data.index, None
+    values = np.asarray(data, dtype=float)
+    if values.ndim == 1:
+        return values[:, None], pd.RangeIndex(len(values)), None
+    return values, pd.RangeIndex(len(values)), pd.RangeIndex(values.shape[1])
+
+
+def _window_sums(values, window):
+    """
+    Sommes glissantes (fenêtre finissant en t) par sommes cumulées, NaN avant t = w - 1.
+    """
+    n = values.shape[0]
+    cs = np.cumsum(values, axis=0)
+    out = np.full(values.shape, np.nan)
+    if window <= n:
+        out[window - 1] = cs[window - 1]
+        out[window:] = cs[window:] - cs[:-window]
+    return out
+
+
+def _rolling_median_mad(values, window):
+    """
+    Médiane glissante et MAD glissante (fenêtre finissant en t), par blocs
+    de fenêtres triées (tri vectorisé, plus rapide que np.median sur une vue
+    à pas) pour borner la mémoire. Une fenêtre contenant un NaN donne NaN.
+    """
+    n, k = values.shape
+    med = np.full(values.shape, np.nan)
+    mad = np.full(values.shape, np.nan)
+    if window > n:
+        return med, mad
+
+    lo, hi = (window - 1) // 2, window // 2
+    windows = sliding_window_view(values, window, axis=0)   # (n - w + 1, k, w)
+    block = max(1, _BLOCK_VALUES // (window * k))
+
+    for start in range(0, len(windows), block):
+        w = np.sort(windows[start:start + block], axis=-1)
+        m = 0.5 * (w[..., lo] + w[..., hi])
+        dev = np.sort(np.abs(w - m[..., None]), axis=-1)
+
+        rows = slice(window - 1 + start, window - 1 + start + len(w))
+        med[rows] = m
+        mad[rows] = 0.5 * (dev[..., lo] + dev[..., hi])
+
+    has_nan = _window_sums(np.isnan(values).astype(float), window) > 0
+    med[has_nan] = np.nan
+    mad[has_nan] = np.nan
+
+    return med, mad
+
+
+def _center(values, window):
+    """
+    Recentre un résultat de fenêtre « finissant en t » (convention pandas center=True).
+    """
+    shift = (window - 1) // 2
+    out = np.full(values.shape, np.nan)
+    if shift < len(values):
+        out[: len(values) - shift] = values[shift:]
+    return out
+
+
+# --------------------------------------------------------
+# 1. Statistiques glissantes multi-fenêtres
+# --------------------------------------------------------
+
+ROLLING_STATS = ("mean", "std", "min", "max", "mad")
+
+
+def rolling_statistics(data, windows=(7, 30), stats=ROLLING_STATS, center=False):
+    """
+    Statistiques glissantes (moyenne, écart-type, min, max, MAD) pour
+    plusieurs tailles de fenêtre, calculées de façon vectorisée :
+    - moyenne / écart-type par sommes cumulées (O(n)),
+    - min / max par filtres de van Herk (scipy.ndimage, O(n)),
+    - MAD par blocs de fenêtres glissantes triées.
+    Une fenêtre contenant un NaN donne NaN.
+
+    data : Series (une série) ou DataFrame (panel, une série par colonne).
+    Retourne un DataFrame aligné sur l'index, colonnes "mean_7", "std_30"...
+    (pour un panel : MultiIndex (statistique, série)).
+    """
+    values, index, columns = _as_2d(data)
+    n = values.shape[0]
+
+    isnan = np.isnan(values)
+    filled = np.where(isnan, 0.0, values)
+    # Décalage par la moyenne : limite les erreurs d'arrondi des sommes cumulées
+    offset = np.nanmean(values, axis=0) if n else 0.0
+    offset = np.where(np.isnan(offset), 0.0, offset)
+    shifted = np.where(isnan, 0.0, values - offset)
+
+    results = {}
+    for w in windows:
+        w = int(w)
+        has_nan = _window_sums(isnan.astype(float), w) > 0
+
+        if "mean" in stats or "std" in stats:
+            s1 = _window_sums(shifted, w)
+            mean_shifted = s1 / w
+            if "mean" in stats:
+                results[f"mean_{w}"] = mean_shifted + offset
+            if "std" in stats:
+                s2 = _window_sums(shifted ** 2, w)
+                var = (s2 - w * mean_shifted ** 2) / (w - 1) if w > 1 else np.full(values.shape, np.nan)
+                results[f"std_{w}"] = np.sqrt(np.maximum(var, 0.0))
+
+        if "min" in stats or "max" in stats:
+            from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+            origin = (w - 1) // 2   # fenêtre [t - w + 1, t]
+            if "min" in stats:
+                mn = minimum_filter1d(np.where(isnan, np.inf, filled), w, axis=0, origin=origin)
+                mn[: w - 1] = np.nan
+                results[f"min_{w}"] = mn
+            if "max" in stats:
+                mx = maximum_filter1d(np.where(isnan, -np.inf, filled), w, axis=0, origin=origin)
+                mx[: w - 1] = np.nan
+                results[f"max_{w}"] = mx
+
+        if "mad" in stats:
+            results[f"mad_{w}"] = _rolling_median_mad(values, w)[1]
+
+        for name in [f"{s}_{w}" for s in stats]:
+            if name in results:
+                results[name] = np.where(has_nan, np.nan, results[name])
+                if center:
+                    results[name] = _center(results[name], w)
+
+    names = list(results)
+    if columns is None:
+        return pd.DataFrame({name: results[name][:, 0] for name in names}, index=index)
+
+    stacked = np.concatenate([results[name] for name in names], axis=1)
+    return pd.DataFrame(
+        stacked,
+        index=index,
+        columns=pd.MultiIndex.from_product([names, columns])
+    )
+
+
+# --------------------------------------------------------
+# 2. Valeurs aberrantes (Hampel / MAD glissante)
+# --------------------------------------------------------
+
+def hampel_filter(data, window=7, n_sigmas=3.0, center=True):
+    """
+    Filtre de Hampel : une observation est aberrante si
+    |x - médiane glissante| > n_sigmas × 1.4826 × MAD glissante.
+    center=True : fenêtre centrée (Hampel classique) ;
+    center=False : fenêtre passée uniquement (MAD glissante, utilisable en ligne).
+
+    Retourne (drapeaux, médiane, échelle) au format de data
+    (Series ou DataFrame).
+    """
+    values, index, columns = _as_2d(data)
+    med, mad = _rolling_median_mad(values, int(window))
+    if center:
+        med, mad = _center(med, window), _center(mad, window)
+
+    scale = MAD_SCALE * mad
+    with np.errstate(invalid="ignore"):
+        flags = np.abs(values - med) > n_sigmas * scale
+
+    if columns is None:
+        return (
+            pd.Series(flags[:, 0], index=index),
+            pd.Series(med[:, 0], index=index),
+            pd.Series(scale[:, 0], index=index)
+        )
+    return (
+        pd.DataFrame(flags, index=index, columns=columns),
+        pd.DataFrame(med, index=index, columns=columns),
+        pd.DataFrame(scale, index=index, columns=columns)
+    )
+
+
+def outlier_flags(data, window=7, n_sigmas=3.0, center=True):
+    """
+    Drapeaux booléens des valeurs aberrantes (voir hampel_filter).
+    """
+    return hampel_filter(data, window, n_sigmas, center)[0]
@@ -0,0 +1,280 @@
+import numpy as np
+
+# --------------------------------------------------------
+# 0. Outils internes
+# --------------------------------------------------------
+
+def _as_array(series):
+    """
+    Convertit la série en tableau float sans valeurs manquantes.
+    """
+    x = np.asarray(series, dtype=float)
+    return x[~np.isnan(x)]
+
+
+def _fft_size(n):
+    """
+    Plus petite puissance de 2 ≥ n (taille FFT rapide, sans repliement).
+    """
+    return 1 << int(np.ceil(np.log2(max(n, 1))))
+
+
+# --------------------------------------------------------
+# 1. ACF par FFT (O(n log n))
+# --------------------------------------------------------
+
+def acf_fft(series, nlags=None):
+    """
+    Autocorrélation empirique calculée par FFT (théorème de Wiener-Khintchine).
+    Même estimateur que statsmodels.tsa.stattools.acf : ρ(k) = γ(k) / γ(0).
+    nlags = nombre de retards (par défaut n - 1).
+    """
+    x = _as_array(series)
+    n = len(x)
+
+    if n < 2:
+        raise ValueError("La série doit contenir au moins 2 observations.")
+
+    if nlags is None:
+        nlags = n - 1
+    nlags = int(min(nlags, n - 1))
+
+    x = x - x.mean()
+
+    # Zéro-padding à 2n pour obtenir l'autocorrélation linéaire (et non circulaire)
+    nfft = _fft_size(2 * n - 1)
+    spectrum = np.fft.rfft(x, nfft)
+    acov = np.fft.irfft(spectrum * np.conj(spectrum), nfft)[: nlags + 1]
+
+    if acov[0] <= 0:
+        # Série constante : autocorrélation non définie au-delà du retard 0
+        acf = np.zeros(nlags + 1)
+        acf[0] = 1.0
+        return acf
+
+    return acov / acov[0]
+
+
+# --------------------------------------------------------
+# 2. PACF par Levinson-Durbin
+# --------------------------------------------------------
+
+def pacf_levinson(series, nlags=None):
+    """
+    Autocorrélation partielle par récursion de Levinson-Durbin sur l'ACF FFT.
+    Équivalent à statsmodels pacf(method="ldb"), en O(nlags²).
+    """
+    x = _as_array(series)
+    n = len(x)
+
+    if nlags is None:
+        nlags = min(int(10 * np.log10(max(n, 10))), n // 2 - 1)
+    nlags = int(max(min(nlags, n - 1), 1))
+
+    r = acf_fft(x, nlags)
+
+    pacf = np.zeros(nlags + 1)
+    pacf[0] = 1.0
+
+    phi = np.zeros(nlags + 1)
+    sigma = 1.0
+
+    for k in range(1, nlags + 1):
+        if sigma <= 0:
+            break
+
+        # Coefficient de réflexion
+        num = r[k] - np.dot(phi[1:k], r[k - 1:0:-1])
+        phi_kk = num / sigma
+
+        # Mise à jour des coefficients AR(k)
+        phi[1:k] = phi[1:k] - phi_kk * phi[k - 1:0:-1]
+        phi[k] = phi_kk
+
+        sigma *= (1 - phi_kk ** 2)
+        pacf[k] = phi_kk
+
+    return pacf
+
+
+# --------------------------------------------------------
+# 3. Périodogramme
+# --------------------------------------------------------
+
+def periodogram(series, detrend=True):
+    """
+    Périodogramme de la série (puissance par fréquence, cycles / observation).
+    Une tendance linéaire est retirée par défaut pour ne pas écraser
+    les basses fréquences.
+    Retourne (frequences, puissances) sans la fréquence nulle.
+    """
+    x = _as_array(series)
+    n = len(x)
+
+    if detrend:
+        t = np.arange(n)
+        coeffs = np.polyfit(t, x, 1)
+        x = x - (coeffs[0] * t + coeffs[1])
+    else:
+        x = x - x.mean()
+
+    power = np.abs(np.fft.rfft(x)) ** 2 / n
+    freqs = np.fft.rfftfreq(n)
+
+    return freqs[1:], power[1:]
+
+
+def _power_at(x, periods):
+    """
+    Puissance du périodogramme aux fréquences 1 / période (hors grille FFT).
+    Pour une période entière L, la somme de Fourier se ramène aux sommes
+    par saison (t mod L) : O(n) sans trigonométrie sur toute la série.
+    """
+    n = len(x)
+    power = []
+    for p in periods:
+        cycles = n // p
+        sums = x[:cycles * p].reshape(cycles, p).sum(axis=0)
+        sums[:n - cycles * p] += x[cycles * p:]
+        power.append(np.abs(np.sum(sums * np.exp(-2j * np.pi * np.arange(p) / p))) ** 2 / n)
+    return np.array(power)
+
+
+def _remove_profile(x, p):
+    """
+    Retire à x la moyenne de chaque saison (t mod p).
+    """
+    season = np.arange(len(x)) % p
+    means = np.bincount(season, weights=x, minlength=p) / np.bincount(season, minlength=p)
+    return x - means[season]
+
+
+def _full_cycle(r, lag, threshold):
+    """
+    L'ACF r décrit un cycle complet au retard : au-dessus du seuil et de
+    sa valeur un demi-cycle plus tôt.
+    """
+    return r[lag] > threshold and r[lag] > r[lag - lag // 2]
+
+
+# --------------------------------------------------------
+# 4. Détection des périodes saisonnières
+# --------------------------------------------------------
+
+def detect_periods(series, max_periods=3, min_period=2, max_period=None,
+                   acf_threshold=0.2, power_ratio=10.0):
+    """
+    Classe les périodes saisonnières candidates (saisonnalités multiples incluses).
+
+    1. Les pics locaux du périodogramme dépassant power_ratio × la puissance
+       médiane (niveau du bruit) donnent des périodes candidates,
+       classées par puissance spectrale.
+    2. La période entière est lue sur le spectre : fréquence du pic affinée
+       par interpolation parabolique (log-puissance sur les 3 raies), puis
+       retard entier voisin de plus forte puissance exacte. L'ACF ne
+       déplace jamais la période.
+    3. L'ACF de la série sans tendance sert de contrôle : au retard, elle
+       doit dépasser acf_threshold et sa valeur un demi-cycle plus tôt.
+       Le contrôle est aussi fait sur le reste de la série, une fois retiré
+       le profil saisonnier des périodes déjà retenues : deux saisonnalités
+       non harmoniques qui se brouillent dans l'ACF y sont séparées.
+    4. Les doublons (retards à ±1 d'une période déjà retenue) sont écartés.
+
+    Retourne une liste de dictionnaires {"periode", "puissance", "acf"},
+    du plus fort au plus faible.
+    """
+    x = _as_array(series)
+    n = len(x)
+
+    if n < 2 * min_period + 1:
+        return []
+
+    if max_period is None:
+        max_period = n // 2
+    max_period = int(min(max_period, n // 2))
+
+    freqs, power = periodogram(x)
+    periods = 1.0 / freqs
+
+    # --- Pics locaux du spectre dans la plage de périodes admissible ---
+    is_peak = np.zeros(len(power), dtype=bool)
+    is_peak[1:-1] = (power[1:-1] > power[:-2]) & (power[1:-1] >= power[2:])
+    in_range = (periods >= min_period - 0.5) & (periods <= max_period + 0.5)
+    strong = power > power_ratio * np.median(power)
+    peak_idx = np.flatnonzero(is_peak & in_range & strong)
+
+    if len(peak_idx) == 0:
+        return []
+
+    # Seuls les pics les plus puissants sont examinés
+    peak_idx = peak_idx[np.argsort(power[peak_idx])[::-1]][: 10 * max_periods]
+
+    # ACF de la série sans tendance linéaire (sinon toutes les ACF sont élevées)
+    t = np.arange(n)
+    coeffs = np.polyfit(t, x, 1)
+    detrended = x - (coeffs[0] * t + coeffs[1])
+    r = acf_fft(detrended, max_period + 1)
+
+    log_power = np.log(np.maximum(power, np.finfo(float).tiny))
+    df = 1.0 / n                # pas de la grille de fréquences
+
+    candidates = []
+    r_residual = None       # ACF du reste, calculée seulement si besoin
+    for i in peak_idx:
+        # Résolution fréquentielle limitée → sommet de la parabole sur 3 raies
+        lo, mid, hi = log_power[i - 1], log_power[i], log_power[i + 1]
+        denom = lo - 2 * mid + hi
+        shift = 0.5 * (lo - hi) / denom if denom < 0 else 0.0
+        freq = freqs[i] + float(np.clip(shift, -0.5, 0.5)) * df
+
+        # Période entière : retard voisin de plus forte puissance spectrale exacte
+        center = int(round(1.0 / freq))
+        lags = np.arange(max(center - 1, min_period), min(center + 1, max_period) + 1)
+        if len(lags) == 0 or any(abs(center - c["periode"]) <= 1 for c in candidates):
+            continue
+        lag = int(lags[np.argmax(_power_at(detrended, lags))])
+
+        if any(abs(lag - c["periode"]) <= 1 for c in candidates):
+            continue
+
+        # Contrôle par l'ACF, sur la série ou à défaut sur le reste
+        acf = r
+        if not _full_cycle(acf, lag, acf_threshold) and candidates:
+            if r_residual is None:
+                # Profils saisonniers (puis tendance) des périodes retenues retirés
+                residual = detrended
+                for c in candidates:
+                    residual = _remove_profile(residual, c["periode"])
+                coeffs = np.polyfit(t, residual, 1)
+                r_residual = acf_fft(residual - (coeffs[0] * t + coeffs[1]), max_period + 1)
+            acf = r_residual
+        if not _full_cycle(acf, lag, acf_threshold):
+            continue
+
+        candidates.append({
+            "periode": lag,
+            "puissance": float(power[i]),
+            "acf": float(acf[lag])
+        })
+        r_residual = None
+
+        if len(candidates) >= max_periods:
+            break
+
+    return candidates
+
+
+def detect_seasonal_period(series, min_period=2, max_period=None,
+                           acf_threshold=0.2, power_ratio=10.0):
+    """
+    Période saisonnière dominante (ou None si aucune n'est détectée).
+    """
+    candidates = detect_periods(
+        series,
+        max_periods=1,
+        min_period=min_period,
+        max_period=max_period,
+        acf_threshold=acf_threshold,
+        power_ratio=power_ratio
+    )
+    return candidates[0]["periode"] if candidates else None
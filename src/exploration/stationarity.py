@@ -1,13 +1,20 @@
-from statsmodels.tsa.stattools import adfuller, kpss
+from src.monitoring.timing import timed
 
+
+@timed("stationnarite.adf")
 def adf_test(series):
+    from statsmodels.tsa.stattools import adfuller
+
     result = adfuller(series, autolag='AIC')
     return {
         "ADF Statistic": result[0],
         "p-value": result[1]
     }
 
+@timed("stationnarite.kpss")
 def kpss_test(series):
+    from statsmodels.tsa.stattools import kpss
+
     result = kpss(series, nlags="auto")
     return {
         "KPSS Statistic": result[0],
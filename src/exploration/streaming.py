@@ -0,0 +1,262 @@
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------------
+# 1. Sketch de quantiles fusionnable (type KLL)
+# --------------------------------------------------------
+
+class QuantileSketch:
+    """
+    Sketch de quantiles approximatifs en mémoire bornée (compacteurs KLL).
+    Chaque niveau h contient des valeurs de poids 2^h ; un niveau plein est
+    trié puis une valeur sur deux (décalage aléatoire) monte au niveau suivant.
+    Erreur de rang typique ≈ 1 / k.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = int(k)
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def _capacity(self, h):
+        depth = len(self.levels) - 1 - h
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                level = np.sort(level)
+                # Nombre impair : la dernière valeur reste à ce niveau
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                pairs = level[: len(level) - len(keep)]
+
+                offset = self.rng.integers(2)
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], pairs[offset::2]])
+                self.levels[h] = keep
+            h += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne un autre sketch (ex : résultat partiel d'un autre worker).
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Quantile(s) approximatif(s), q dans [0, 1] (scalaire ou liste).
+        """
+        if self.n == 0:
+            return np.nan if np.ndim(q) == 0 else np.full(len(q), np.nan)
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+
+        order = np.argsort(values)
+        values = values[order]
+        cum = np.cumsum(weights[order])
+
+        targets = np.asarray(q, dtype=float) * cum[-1]
+        idx = np.searchsorted(cum, targets, side="left")
+        return values[np.minimum(idx, len(values) - 1)]
+
+
+# --------------------------------------------------------
+# 2. Accumulateur de statistiques en une passe
+# --------------------------------------------------------
+
+class StreamingStats:
+    """
+    Statistiques descriptives en une seule passe sur un flux de blocs
+    (chunks CSV, colonnes de panel...).
+    Moments exacts (formules de Welford / Chan / Pébay, fusionnables),
+    min / max exacts, quantiles approximatifs via QuantileSketch.
+    sketch_size=None désactive les quantiles.
+    """
+
+    def __init__(self, sketch_size=200, seed=None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(sketch_size, seed) if sketch_size else None
+
+    # --- Combinaison de deux jeux de moments ---
+    def _combine(self, n_b, mean_b, m2_b, m3_b, m4_b):
+        n_a = self.count
+        if n_a == 0:
+            self.count, self.mean = n_b, mean_b
+            self.m2, self.m3, self.m4 = m2_b, m3_b, m4_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        m2_a, m3_a, m4_a = self.m2, self.m3, self.m4
+
+        self.m4 = (
+            m4_a + m4_b
+            + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+            + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) / n ** 2
+            + 4 * delta * (n_a * m3_b - n_b * m3_a) / n
+        )
+        self.m3 = (
+            m3_a + m3_b
+            + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+            + 3 * delta * (n_a * m2_b - n_b * m2_a) / n
+        )
+        self.m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.count = n
+
+    def update(self, values):
+        """
+        Ajoute un bloc de valeurs (les NaN sont ignorés, comme pandas).
+        """
+        x = np.asarray(values, dtype=float).ravel()
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return self
+
+        mean_b = x.mean()
+        dev = x - mean_b
+        dev2 = dev * dev
+
+        self._combine(len(x), mean_b, dev2.sum(), (dev2 * dev).sum(), (dev2 * dev2).sum())
+        self.min = min(self.min, x.min())
+        self.max = max(self.max, x.max())
+
+        if self.sketch is not None:
+            self.sketch.update(x)
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne l'accumulateur d'un autre worker.
+        """
+        if other.count == 0:
+            return self
+
+        self._combine(other.count, other.mean, other.m2, other.m3, other.m4)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    # --- Résultats ---
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    @property
+    def skewness(self):
+        """
+        Asymétrie corrigée du biais (même formule que pandas.Series.skew).
+        """
+        n = self.count
+        if n < 3 or self.m2 == 0:
+            return np.nan
+        g1 = np.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return np.sqrt(n * (n - 1)) / (n - 2) * g1
+
+    @property
+    def kurtosis(self):
+        """
+        Kurtosis en excès corrigée du biais (même formule que pandas.Series.kurt).
+        """
+        n = self.count
+        if n < 4 or self.m2 == 0:
+            return np.nan
+        num = (n + 1) * n * (n - 1) * self.m4
+        den = (n - 2) * (n - 3) * self.m2 ** 2
+        return num / den - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+
+    def quantile(self, q):
+        if self.sketch is None:
+            raise ValueError("Quantiles indisponibles : sketch désactivé (sketch_size=None).")
+        return self.sketch.quantile(q)
+
+    def describe(self):
+        stats = {
+            "count": self.count,
+            "mean": self.mean if self.count else np.nan,
+            "std": self.std,
+            "min": self.min if self.count else np.nan,
+            "max": self.max if self.count else np.nan
+        }
+        if self.sketch is not None:
+            q25, q50, q75 = self.quantile([0.25, 0.5, 0.75])
+            stats.update({"25%": q25, "50%": q50, "75%": q75})
+        return stats
+
+
+# --------------------------------------------------------
+# 3. Sources : fichiers CSV par blocs, panels
+# --------------------------------------------------------
+
+def stream_csv_stats(path, value_col, chunksize=1_000_000, sketch_size=200, **read_csv_kwargs):
+    """
+    Statistiques d'une colonne d'un fichier CSV lu par blocs
+    (fichiers plus gros que la RAM). Les virgules décimales sont converties.
+    """
+    acc = StreamingStats(sketch_size)
+
+    reader = pd.read_csv(path, usecols=[value_col], chunksize=chunksize, **read_csv_kwargs)
+    for chunk in reader:
+        col = chunk[value_col]
+        if not pd.api.types.is_numeric_dtype(col):
+            col = pd.to_numeric(col.astype(str).str.replace(',', '.'), errors="coerce")
+        acc.update(col.to_numpy(dtype=float))
+
+    return acc
+
+
+def panel_stats(panel, sketch_size=200):
+    """
+    Un accumulateur par colonne d'un panel (DataFrame : une série par colonne).
+    """
+    panel = pd.DataFrame(panel)
+    return {
+        col: StreamingStats(sketch_size).update(panel[col].to_numpy(dtype=float))
+        for col in panel.columns
+    }
+
+
+def describe_panel(panel, sketch_size=200):
+    """
+    Tableau des statistiques descriptives de chaque série du panel.
+    """
+    accs = panel_stats(panel, sketch_size)
+    return pd.DataFrame({col: acc.describe() for col, acc in accs.items()}).T
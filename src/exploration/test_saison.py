@@ -1,42 +1,147 @@
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 
-def test_additive_vs_multiplicative(series, p):
+# --------------------------------------------------------
+# 1. Statistiques par saison (reshape cycles × p)
+# --------------------------------------------------------
+
+def _to_cycles(values, p):
     """
-    Test saisonnier additif vs multiplicatif basé sur la régression σ = a·x̄ + b.
-    p = périodicité (ex : 4 pour trimestriel, 12 pour mensuel)
+    Remet les observations en tableau (..., cycles, p).
+    Le dernier cycle incomplet est complété par des NaN, de sorte que la
+    colonne i contient exactement series[i::p].
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    n_cycles = -(-n // p)
+
+    pad = n_cycles * p - n
+    if pad:
+        widths = [(0, 0)] * (values.ndim - 1) + [(0, pad)]
+        values = np.pad(values, widths, constant_values=np.nan)
+
+    return values.reshape(values.shape[:-1] + (n_cycles, p))
+
+
+def seasonal_group_stats(values, p):
+    """
+    Moyennes et écarts-types (ddof=1) de chaque saison.
+    values : tableau (n,) ou (k, n) pour k séries de même longueur.
+    Retourne (moyennes, ecarts_type) de forme (p,) ou (k, p).
+    """
+    cycles = _to_cycles(values, p)
+
+    counts = np.sum(~np.isnan(cycles), axis=-2)
+    means = np.nansum(cycles, axis=-2) / np.where(counts > 0, counts, np.nan)
+
+    dev = cycles - np.expand_dims(means, -2)
+    ss = np.nansum(dev ** 2, axis=-2)
+    stds = np.sqrt(ss / np.where(counts > 1, counts - 1, np.nan))
+
+    return means, stds
+
+
+# --------------------------------------------------------
+# 2. Régression σ = a·x̄ + b (forme fermée, vectorisée)
+# --------------------------------------------------------
+
+def _slope_test(means, stds):
+    """
+    Moindres carrés de σ sur x̄, ligne par ligne, avec test de Student sur a.
+    Retourne (a, b, p_value) de forme (k,).
     """
+    valid = ~(np.isnan(means) | np.isnan(stds))
+    m = valid.sum(axis=-1)
 
-    # --- Regroupement par saison ---
-    groups = []
-    for i in range(p):
-        groups.append(series[i::p])
+    x = np.where(valid, means, 0.0)
+    y = np.where(valid, stds, 0.0)
 
-    # Calcul des moyennes et écarts-types
-    means = np.array([g.mean() for g in groups])
-    stds = np.array([g.std() for g in groups])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_bar = x.sum(axis=-1) / m
+        y_bar = y.sum(axis=-1) / m
 
-    # --- Régression linéaire ---
-    X = means.reshape(-1, 1)
-    y = stds
+        dx = np.where(valid, x - x_bar[..., None], 0.0)
+        dy = np.where(valid, y - y_bar[..., None], 0.0)
 
-    model = LinearRegression()
-    model.fit(X, y)
+        sxx = np.sum(dx ** 2, axis=-1)
+        sxy = np.sum(dx * dy, axis=-1)
 
-    a = model.coef_[0]
-    b = model.intercept_
+        a = sxy / sxx
+        b = y_bar - a * x_bar
 
-    # Décision automatique
-    if abs(a) < 1e-6:
-        nature = "Additif (σ ≈ constant)"
-    else:
-        nature = "Multiplicatif (σ dépend de la moyenne)"
+        # Significativité de la pente (H0 : a = 0), m - 2 degrés de liberté
+        resid = np.where(valid, dy - a[..., None] * dx, 0.0)
+        dof = m - 2
+        s2 = np.sum(resid ** 2, axis=-1) / dof
+        se = np.sqrt(s2 / sxx)
+        t_stat = a / se
+
+    # Loi de Student via scipy.special (import bien plus léger que scipy.stats)
+    from scipy.special import stdtr
+    p_value = 2 * stdtr(np.where(dof > 0, dof, np.nan), -np.abs(t_stat))
+
+    return a, b, p_value
+
+
+def _nature(a, p_value, alpha):
+    """
+    Décision automatique (repli sur |a| < 1e-6 si le test est impossible, p ≤ 2).
+    """
+    if np.isnan(p_value):
+        if np.isnan(a) or abs(a) < 1e-6:
+            return "Additif (σ ≈ constant)"
+        return "Multiplicatif (σ dépend de la moyenne)"
+    if p_value < alpha and a > 0:
+        return "Multiplicatif (σ dépend de la moyenne)"
+    return "Additif (σ ≈ constant)"
+
+
+# --------------------------------------------------------
+# 3. Test pour une série
+# --------------------------------------------------------
+
+def test_additive_vs_multiplicative(series, p, alpha=0.05):
+    """
+    Test saisonnier additif vs multiplicatif basé sur la régression σ = a·x̄ + b.
+    p = périodicité (ex : 4 pour trimestriel, 12 pour mensuel)
+    Le modèle est multiplicatif si la pente a est positive et significative
+    au seuil alpha (test de Student).
+    """
+    means, stds = seasonal_group_stats(series, p)
+    a, b, p_value = _slope_test(means[None, :], stds[None, :])
+
+    a, b, p_value = float(a[0]), float(b[0]), float(p_value[0])
 
     return {
         "moyennes": means,
         "ecarts_type": stds,
         "a": a,
         "b": b,
-        "nature": nature
+        "p_value": p_value,
+        "nature": _nature(a, p_value, alpha)
     }
+
+
+# --------------------------------------------------------
+# 4. Test sur un panel de séries
+# --------------------------------------------------------
+
+def additive_vs_multiplicative_panel(panel, p, alpha=0.05):
+    """
+    Même test appliqué en une seule passe à toutes les colonnes d'un panel
+    (DataFrame : une série par colonne, index temporel commun).
+    Retourne un DataFrame indexé par série : a, b, p_value, nature.
+    """
+    panel = pd.DataFrame(panel)
+
+    means, stds = seasonal_group_stats(panel.to_numpy(dtype=float).T, p)
+    a, b, p_value = _slope_test(means, stds)
+
+    nature = [_nature(ai, pi, alpha) for ai, pi in zip(a, p_value)]
+
+    return pd.DataFrame({
+        "a": a,
+        "b": b,
+        "p_value": p_value,
+        "nature": nature
+    }, index=panel.columns)
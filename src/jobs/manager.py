@@ -0,0 +1,297 @@
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.service.tasks import warm_worker
+
+# Gestionnaire de tâches en arrière-plan : un calcul long (grid search,
+# validation croisée...) est découpé en lots exécutés par un pool de
+# processus partagé par toutes les sessions. Le script Streamlit n'est
+# plus bloqué : la page interroge l'avancement, affiche les meilleurs
+# résultats partiels, peut annuler, et retrouve le résultat au retour
+# de l'utilisateur (la tâche survit au changement de page).
+
+DEFAULT_MAX_JOBS = 32            # tâches terminées conservées (les plus anciennes sont oubliées)
+
+PENDING = "en_cours"
+DONE = "termine"
+CANCELLED = "annule"
+FAILED = "erreur"
+
+
+# --------------------------------------------------------
+# 1. Tâche
+# --------------------------------------------------------
+
+class Job:
+    """
+    Tâche découpée en lots. Le réducteur (add / partial / result) agrège
+    les lots à mesure qu'ils se terminent, dans le thread de rappel du pool.
+    """
+
+    def __init__(self, job_id, label, total, reducer, key=None):
+        self.id = job_id
+        self.label = label
+        self.key = key
+        self.total = total
+        self.done = 0
+        self.status = PENDING if total else DONE
+        self.error = None
+        self.started = time.time()
+        self.finished = None if total else self.started
+        self._reducer = reducer
+        self._futures = []
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        # Sessions qui attendent le résultat (tâches de même clé partagées)
+        self.subscribers = 1
+        if not total:
+            self._event.set()
+
+    @property
+    def running(self):
+        return self.status == PENDING
+
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def elapsed(self):
+        return (self.finished or time.time()) - self.started
+
+    def partial(self):
+        """
+        Résultat agrégé sur les lots déjà terminés.
+        """
+        with self._lock:
+            return self._reducer.partial()
+
+    def result(self, timeout=None):
+        """
+        Résultat final (attend la fin si timeout est donné).
+        Lève RuntimeError si la tâche a échoué ou a été annulée.
+        """
+        if timeout is not None:
+            self._event.wait(timeout)
+        if self.status == FAILED:
+            raise RuntimeError(f"Tâche « {self.label} » en échec : {self.error}")
+        if self.status == CANCELLED:
+            raise RuntimeError(f"Tâche « {self.label} » annulée.")
+        if self.status != DONE:
+            raise RuntimeError(f"Tâche « {self.label} » en cours ({self.done}/{self.total} lots).")
+        with self._lock:
+            return self._reducer.result()
+
+    def wait(self, timeout=None):
+        return self._event.wait(timeout)
+
+    def add_done_callback(self, fn):
+        """
+        fn(job) à la fin de la tâche (terminée, annulée ou en échec),
+        immédiatement si elle l'est déjà.
+        """
+        with self._lock:
+            if self.status == PENDING:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def cancel(self):
+        """
+        Annule les lots pas encore démarrés ; ceux en cours se terminent
+        mais leurs résultats sont ignorés.
+        """
+        with self._lock:
+            if self.status != PENDING:
+                return False
+            self._finish(CANCELLED)
+        for future in self._futures:
+            future.cancel()
+        self._run_callbacks()
+        return True
+
+    def release(self):
+        """
+        Une session renonce au résultat : la tâche n'est annulée que si
+        plus aucune session ne l'attend. Retourne True si elle a été annulée.
+        """
+        with self._lock:
+            self.subscribers -= 1
+            if self.subscribers > 0:
+                return False
+        return self.cancel()
+
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.finished = time.time()
+        self._event.set()
+
+    def _run_callbacks(self):
+        callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def _chunk_done(self, future):
+        with self._lock:
+            if self.status != PENDING:
+                return
+            try:
+                self._reducer.add(future.result())
+            except CancelledError:
+                return
+            except Exception as e:
+                self._finish(FAILED, f"{type(e).__name__}: {e}")
+            else:
+                self.done += 1
+                if self.done < self.total:
+                    return
+                self._finish(DONE)
+        if self.status == FAILED:
+            # Un lot en échec : inutile de calculer les suivants
+            for f in self._futures:
+                f.cancel()
+        self._run_callbacks()
+
+    def summary(self):
+        return {
+            "id": self.id, "tache": self.label, "statut": self.status,
+            "lots": f"{self.done}/{self.total}", "duree_s": round(self.elapsed(), 2),
+            "erreur": self.error
+        }
+
+
+# --------------------------------------------------------
+# 2. Gestionnaire (pool de processus partagé)
+# --------------------------------------------------------
+
+class JobManager:
+
+    def __init__(self, workers=None, max_jobs=DEFAULT_MAX_JOBS):
+        # Un cœur laissé au serveur Streamlit
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_jobs = max_jobs
+        self._pool = None
+        self._jobs = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        return self._pool
+
+    def submit(self, label, func, chunks, reducer, key=None):
+        """
+        Lance func(*chunk) pour chaque lot et renvoie la Job.
+        key : identifiant du calcul (ex : empreinte série + paramètres) ;
+        une tâche de même clé en cours ou terminée est renvoyée telle quelle
+        (un seul calcul pour toutes les sessions qui la demandent).
+        """
+        with self._lock:
+            if key is not None:
+                existing = next((j for j in self._jobs.values()
+                                 if j.key == key and j.status in (PENDING, DONE)), None)
+                if existing is not None:
+                    with existing._lock:
+                        existing.subscribers += 1
+                    return existing
+
+            job = Job(f"job-{next(self._ids)}", label, len(chunks), reducer, key)
+            try:
+                job._futures = [self._executor().submit(func, *chunk) for chunk in chunks]
+            except BrokenProcessPool:
+                # Worker tué (mémoire, arrêt brutal) : nouveau pool
+                self._pool = None
+                job._futures = [self._executor().submit(func, *chunk) for chunk in chunks]
+
+            self._jobs[job.id] = job
+            self._forget_old()
+
+        for future in job._futures:
+            future.add_done_callback(job._chunk_done)
+        return job
+
+    def submit_cached(self, label, key, build, cache=None):
+        """
+        Comme submit, avec le cache partagé (src/cache/shared.py) : un
+        résultat déjà calculé pour key (par n'importe quelle session, ou
+        sur disque) donne une tâche terminée sans calcul ; sinon la tâche
+        est lancée (ou rejointe) et son résultat est mis en cache.
+        build() → (fonction, lots, réducteur).
+        """
+        if cache is None:
+            from src.cache.shared import get_shared_cache
+            cache = get_shared_cache()
+
+        missing = object()
+        value = cache.get(key, missing)
+        if value is not missing:
+            job = Job(f"job-{next(self._ids)}", label, 0, _Cached(value), key)
+            with self._lock:
+                self._jobs[job.id] = job
+                self._forget_old()
+            return job
+
+        job = self.submit(label, *build(), key=key)
+        job.add_done_callback(lambda j: j.status == DONE and cache.put(key, j.result()))
+        return job
+
+    def _forget_old(self):
+        finished = [j for j in self._jobs.values() if not j.running]
+        for job in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        return job.cancel() if job is not None else False
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self):
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+class _Cached:
+    """
+    Réducteur d'une tâche servie depuis le cache.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def partial(self):
+        return self.value
+
+    def result(self):
+        return self.value
+
+
+_MANAGER = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_job_manager():
+    """
+    Gestionnaire unique du processus (partagé par les sessions Streamlit).
+    """
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = JobManager()
+        return _MANAGER
@@ -0,0 +1,118 @@
+from src.exploration.graph import AnalysisGraph, get_analysis_graph
+from src.jobs.manager import DONE, get_job_manager
+from src.jobs.tasks import grid_search_job, grid_search_key, rolling_origin_job, rolling_origin_key
+
+# Précalcul à l'import : dès que la série est chargée (page 1), les analyses
+# que les pages 2 à 6 demandent avec leurs réglages par défaut sont lancées
+# dans le pool du gestionnaire de tâches. Les résultats remplissent le graphe
+# d'analyses de la session et les tâches que les pages 5 et 6 récupèrent :
+# à l'ouverture, la page lit le cache au lieu de calculer.
+
+DEFAULT_PERIOD = 4      # période par défaut des pages 3 et 5
+
+
+# --------------------------------------------------------
+# 1. Nœuds du graphe d'analyses (workers)
+# --------------------------------------------------------
+
+def default_nodes(n_obs, p=DEFAULT_PERIOD):
+    """
+    Lots d'appels (méthode, arguments) du graphe, tels que la page 3 les
+    fait avec ses réglages par défaut. "group_stats" sans argument : sur la
+    période détectée par periods() dans le même lot.
+    """
+    nlags = int(min(max(40, 2 * p), n_obs // 2 - 1))
+    return [
+        [("stationarity", ())],
+        [("decomposition", (p, "add")), ("seasonal_test", (p,))],
+        [("acf", (nlags,)), ("pacf", (nlags,)), ("describe", ())],
+        [("periods", (3,)), ("acf", (n_obs // 2,)), ("group_stats", None)],
+    ]
+
+
+def graph_chunk(series, calls, fingerprint):
+    """
+    Calcule les nœuds demandés sur un graphe local et renvoie son cache
+    {clé de nœud: valeur} (nœuds intermédiaires compris). Un nœud en échec
+    est ignoré : la page le recalculera et affichera l'erreur.
+    fingerprint : empreinte déjà calculée par la session (pas de re-hachage
+    de la série dans chaque worker).
+    """
+    graph = AnalysisGraph(series, fingerprint=fingerprint)
+    for method, args in calls:
+        try:
+            if method == "group_stats":
+                period = graph.period()
+                if period and period < len(series) // 2:
+                    graph.group_stats(period)
+            else:
+                getattr(graph, method)(*args)
+        except Exception:
+            pass
+    return graph.cached_values()
+
+
+class GraphReducer:
+    """
+    Rassemble les nœuds des lots ({clé de nœud: valeur}) dans un graphe
+    propre à la tâche, qui les publie au fil de l'eau dans le cache partagé :
+    une page ouverte pendant le précalcul y trouve déjà les premiers nœuds.
+    Le résultat (les valeurs elles-mêmes) est versé à la fin dans le graphe
+    de chaque session qui a demandé le précalcul.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def add(self, nodes):
+        self.graph.preload(nodes)
+
+    def partial(self):
+        return self.graph.cached_nodes()
+
+    def result(self):
+        return self.graph.cached_values()
+
+
+# --------------------------------------------------------
+# 2. Lancement depuis la page d'import
+# --------------------------------------------------------
+
+def start_precompute(data_store, state, seasonal_periods=DEFAULT_PERIOD, manager=None):
+    """
+    Lance en arrière-plan le graphe d'analyses (page 3), le grid search
+    (page 5) et la validation rolling-origin (page 6) de la série de la
+    session. Les identifiants des tâches sont rangés dans state sous les
+    clés que lisent les pages. Retourne les tâches.
+    """
+    manager = manager or get_job_manager()
+    series = data_store.series()
+
+    fingerprint = data_store.fingerprint()
+
+    # Série déjà précalculée (cache partagé) : la tâche est terminée d'emblée
+    # et ses nœuds sont versés tout de suite dans le graphe de la session
+    graph = get_analysis_graph(series, state, fingerprint=fingerprint)
+    chunks = [(series, calls, fingerprint) for calls in default_nodes(len(series.dropna()), seasonal_periods)]
+    graph_job = manager.submit_cached(
+        "Précalcul des analyses",
+        ("precalcul", fingerprint, int(seasonal_periods)),
+        lambda: (graph_chunk, chunks, GraphReducer(AnalysisGraph(series, fingerprint, graph.shared)))
+    )
+    graph_job.add_done_callback(lambda job: job.status == DONE and graph.preload(job.result()))
+
+    grid_job = manager.submit_cached(
+        "Grid Search (précalcul)",
+        grid_search_key(data_store.fingerprint(form="sorted"), seasonal_periods),
+        lambda: grid_search_job(data_store.sorted(), seasonal_periods=seasonal_periods)
+    )
+    state["grid_job"] = grid_job.id
+
+    ro_job = manager.submit_cached("Rolling-Origin (précalcul)",
+                                   rolling_origin_key(data_store.fingerprint(form="dropna")),
+                                   lambda: rolling_origin_job(data_store.dropna()))
+    state["rolling_origin_job"] = ro_job.id
+
+    jobs = [graph_job, grid_job, ro_job]
+    state["precompute_jobs"] = [job.id for job in jobs]
+    return jobs
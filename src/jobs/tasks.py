@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from src.models.evaluation import compute_aicc
+from src.models.grid_search import DEFAULT_GRID, _param_grid
+from src.models.smoothing_manual import DEFAULT_ENGINE, MODEL_N_PARAMS, MODEL_SPECS, fit_smoothing
+
+# Calculs longs découpés en lots pour le gestionnaire de tâches (manager.py) :
+# une fonction par lot (niveau module : transmise aux processus) et un
+# réducteur qui agrège les lots au fil de l'eau (résultats partiels).
+
+
+# --------------------------------------------------------
+# 1. Grid search des modèles de lissage
+# --------------------------------------------------------
+
+def grid_search_chunk(series, combos, seasonal_periods=4, engine=DEFAULT_ENGINE):
+    """
+    Ajuste chaque combinaison (ordre, modèle, α, β, γ) du lot.
+    Retourne [(ordre, modèle, α, β, γ, MSE, AIC, BIC)] ; les ajustements
+    en échec sont ignorés, comme dans la boucle de la page 5.
+    """
+    rows = []
+    for order, model, a, b, g in combos:
+        try:
+            m = fit_smoothing(series, model, a, b, g, seasonal_periods, engine)
+            mse = float(np.mean((series - m.fittedvalues) ** 2))
+            rows.append((order, model, a, b, g, mse, float(m.aic), float(m.bic)))
+        except Exception:
+            pass
+    return rows
+
+
+class GridSearchReducer:
+    """
+    Meilleur ajustement (plus petit MSE) par modèle. À MSE égal, la première
+    combinaison de la grille l'emporte : le résultat ne dépend pas de l'ordre
+    d'arrivée des lots.
+    """
+
+    def __init__(self, n_obs, models):
+        self.n_obs = n_obs
+        self.models = list(models)
+        self.best = {}
+        self.fits = 0
+
+    def add(self, rows):
+        self.fits += len(rows)
+        for row in rows:
+            order, model, mse = row[0], row[1], row[5]
+            current = self.best.get(model)
+            if current is None or (mse, order) < (current[5], current[0]):
+                self.best[model] = row
+
+    def partial(self):
+        rows = []
+        for model in self.models:
+            if model in self.best:
+                _, _, a, b, g, mse, aic, bic = self.best[model]
+                aicc = compute_aicc(aic, self.n_obs, MODEL_N_PARAMS[model])
+                rows.append([model, a, b, g, mse, aic, np.nan if aicc is None else aicc, bic])
+        return pd.DataFrame(rows, columns=["Modèle", "alpha", "beta", "gamma", "MSE", "AIC", "AICc", "BIC"])
+
+    def result(self):
+        return self.partial()
+
+
+def grid_search_key(fingerprint, seasonal_periods=4, engine=DEFAULT_ENGINE):
+    """
+    Clé (cache partagé, tâches) du grid search par défaut d'une série.
+    """
+    return ("grid_search", fingerprint, int(seasonal_periods), engine)
+
+
+def grid_search_job(series, seasonal_periods=4, models=tuple(MODEL_SPECS), alphas=DEFAULT_GRID,
+                    betas=DEFAULT_GRID, gammas=DEFAULT_GRID, engine=DEFAULT_ENGINE, chunk_size=50):
+    """
+    (fonction, lots, réducteur) du grid search, même grille et même critère
+    que grid_search_smoothing.
+    """
+    combos = [
+        (order, model, a, b, g)
+        for order, (model, (a, b, g)) in enumerate(
+            (model, params) for model in models for params in _param_grid(model, alphas, betas, gammas)
+        )
+    ]
+    chunks = [(series, combos[i:i + chunk_size], seasonal_periods, engine)
+              for i in range(0, len(combos), chunk_size)]
+    return grid_search_chunk, chunks, GridSearchReducer(len(series), models)
+
+
+# --------------------------------------------------------
+# 2. Validation rolling-origin (SES optimisé, un pas)
+# --------------------------------------------------------
+
+def rolling_origin_chunk(series, origins):
+    """
+    Pour chaque origine i : SES optimisé sur series[:i], prévision à un pas.
+    Retourne [(i, erreur absolue en %)] (origines en échec ou valeur nulle ignorées).
+    """
+    from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+
+    values = np.asarray(series, dtype=float)
+    rows = []
+    for i in origins:
+        true = values[i]
+        try:
+            pred = float(np.asarray(SimpleExpSmoothing(series.iloc[:i], initialization_method="estimated").fit().forecast(1))[0])
+        except Exception:
+            continue
+        if true != 0:
+            rows.append((i, abs((true - pred) / true) * 100))
+    return rows
+
+
+class RollingOriginReducer:
+    """
+    MAPE moyen des origines déjà évaluées.
+    """
+
+    def __init__(self):
+        self.errors = {}
+
+    def add(self, rows):
+        self.errors.update(rows)
+
+    def partial(self):
+        return float(np.mean(list(self.errors.values()))) if self.errors else np.nan
+
+    def result(self):
+        return self.partial()
+
+
+def rolling_origin_key(fingerprint, first_origin=3):
+    return ("rolling_origin", fingerprint, int(first_origin))
+
+
+def rolling_origin_job(series, first_origin=3, chunk_size=10):
+    """
+    (fonction, lots, réducteur) de la validation rolling-origin de la page 6.
+    """
+    origins = list(range(first_origin, len(series) - 1))
+    chunks = [(series, origins[i:i + chunk_size]) for i in range(0, len(origins), chunk_size)]
+    return rolling_origin_chunk, chunks, RollingOriginReducer()
@@ -1,7 +1,10 @@
 import numpy as np
 import pandas as pd
 
+from src.monitoring.timing import timed
 
+
+@timed("bootstrap.prevision")
 def bootstrap_forecast(series, model_func, n_forecast, B=300):
     """
     Intervalle de confiance à 95% via bootstrap des résidus.
@@ -1,5 +1,12 @@
+import itertools
 import numpy as np
+import pandas as pd
 
+from src.models.evaluation import compute_aicc
+from src.models.smoothing_manual import DEFAULT_ENGINE, MODEL_SPECS, MODEL_N_PARAMS, fit_smoothing
+from src.monitoring.timing import timed
+
+@timed("grid_search.holt")
 def grid_search_holt(series, alphas, betas, horizon, holt_func):
     """
     Recherche par grille simple pour Holt ou Holt-Winters (paramètres α, β).
@@ -31,3 +38,49 @@ def grid_search_holt(series, alphas, betas, horizon, holt_func):
                 pass
 
     return best_params, best_score
+
+
+DEFAULT_GRID = np.linspace(0.1, 0.9, 9)
+
+
+def _param_grid(model, alphas, betas, gammas):
+    spec = MODEL_SPECS[model]
+    return itertools.product(
+        alphas,
+        betas if spec["trend"] else [None],
+        gammas if spec["seasonal"] else [None]
+    )
+
+
+@timed("grid_search.lissage")
+def grid_search_smoothing(series, seasonal_periods=4, models=tuple(MODEL_SPECS),
+                          alphas=DEFAULT_GRID, betas=DEFAULT_GRID, gammas=DEFAULT_GRID,
+                          engine=DEFAULT_ENGINE):
+    """
+    Grid search (α, β, γ) des modèles de lissage, comme la page 5 :
+    pour chaque modèle on retient les paramètres de plus petit MSE in-sample,
+    puis on calcule AIC, AICc et BIC.
+    engine : moteur d'ajustement (voir smoothing_manual.ENGINES).
+    Retourne un DataFrame : Modèle, alpha, beta, gamma, MSE, AIC, AICc, BIC.
+    """
+    n = len(series)
+    rows = []
+
+    for model in models:
+        best_fit, best_params, best_mse = None, None, float("inf")
+
+        for a, b, g in _param_grid(model, alphas, betas, gammas):
+            try:
+                m = fit_smoothing(series, model, a, b, g, seasonal_periods, engine)
+                mse = np.mean((series - m.fittedvalues) ** 2)
+                if mse < best_mse:
+                    best_fit, best_params, best_mse = m, (a, b, g), mse
+            except Exception:
+                pass
+
+        if best_fit is not None:
+            k = MODEL_N_PARAMS[model]
+            rows.append([model, *best_params, best_mse, best_fit.aic,
+                         compute_aicc(best_fit.aic, n, k), best_fit.bic])
+
+    return pd.DataFrame(rows, columns=["Modèle", "alpha", "beta", "gamma", "MSE", "AIC", "AICc", "BIC"])
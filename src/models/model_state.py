@@ -0,0 +1,313 @@
+import json
+import struct
+
+import numpy as np
+import pandas as pd
+
+from src.models.smoothing_manual import MODEL_SPECS
+
+# État compact d'un modèle de lissage exponentiel : spécification, paramètres,
+# états initiaux et finaux (niveau, tendance, saisons). Quelques centaines
+# d'octets au lieu d'un HoltWintersResults complet (données, résidus...).
+
+_MAGIC = b"SMS1"
+
+
+class SmoothingState:
+    """
+    Modèle ajusté réduit à son état :
+    - forecast(h) : prévisions à partir de l'état final,
+    - update(obs) : intègre de nouvelles observations (récurrences),
+    - fitted_values(y) : valeurs ajustées recalculées depuis l'état initial,
+    - to_bytes / from_bytes, save / load : persistance.
+
+    season[j] est le facteur saisonnier du pas n + 1 + j (mod m). Comme
+    statsmodels (et NativeFit), les prévisions à h ≡ 0 (mod m) réutilisent le
+    facteur employé au dernier pas observé, avant sa mise à jour (last_season).
+    """
+
+    __slots__ = (
+        "model", "alpha", "beta", "gamma", "seasonal_periods",
+        "initial_level", "initial_trend", "initial_season",
+        "level", "trend", "season", "last_season",
+        "n_obs", "sse", "last_index", "freq"
+    )
+
+    def __init__(self, model, alpha, beta=None, gamma=None, seasonal_periods=None,
+                 initial_level=0.0, initial_trend=0.0, initial_season=None,
+                 n_obs=0, sse=0.0, last_index=None, freq=None):
+        if model not in MODEL_SPECS:
+            raise ValueError(f"Modèle inconnu : {model}")
+        spec = MODEL_SPECS[model]
+
+        self.model = model
+        self.alpha = float(alpha)
+        self.beta = float(beta) if spec["trend"] else None
+        self.gamma = float(gamma) if spec["seasonal"] else None
+        self.seasonal_periods = int(seasonal_periods) if spec["seasonal"] else None
+
+        self.initial_level = float(initial_level)
+        self.initial_trend = float(initial_trend) if spec["trend"] else 0.0
+        self.initial_season = (
+            np.asarray(initial_season, dtype=float).copy() if spec["seasonal"] else np.empty(0)
+        )
+
+        # État courant = état initial tant que rien n'est intégré
+        self.level = self.initial_level
+        self.trend = self.initial_trend
+        self.season = self.initial_season.copy()
+        # Facteur saisonnier employé au dernier pas intégré (None : aucun pas)
+        self.last_season = None
+
+        self.n_obs = int(n_obs)
+        self.sse = float(sse)
+        self.last_index = last_index
+        self.freq = freq
+
+    # --------------------------------------------------------
+    # 1. Construction
+    # --------------------------------------------------------
+
+    @classmethod
+    def from_statsmodels(cls, result, model, series=None):
+        """
+        Réduit un HoltWintersResults à son état. series (optionnelle) fournit
+        la dernière date et la fréquence pour indexer les prévisions.
+        """
+        params = result.params
+        spec = MODEL_SPECS[model]
+        m = result.model.seasonal_periods if spec["seasonal"] else None
+
+        state = cls(
+            model,
+            params["smoothing_level"],
+            params.get("smoothing_trend"),
+            params.get("smoothing_seasonal"),
+            m,
+            initial_level=params["initial_level"],
+            initial_trend=params.get("initial_trend") or 0.0,
+            initial_season=params.get("initial_seasons")
+        )
+        state.level = float(np.asarray(result.level)[-1])
+        if spec["trend"]:
+            state.trend = float(np.asarray(result.trend)[-1])
+        if spec["seasonal"]:
+            state.season = np.asarray(result.season, dtype=float)[-m:].copy()
+            # Facteur du pas n : s(n - m), pris dans les saisons initiales si n ≤ m
+            history = np.r_[state.initial_season, np.asarray(result.season, dtype=float)]
+            state.last_season = float(history[int(result.model.nobs) - 1])
+        state.n_obs = int(result.model.nobs)
+        state.sse = float(result.sse)
+
+        if series is not None:
+            state._set_index(series.index)
+        return state
+
+    @classmethod
+    def fit(cls, series, model, alpha, beta=None, gamma=None, seasonal_periods=4):
+        """
+        Ajuste avec statsmodels (paramètres fixés) et ne garde que l'état.
+        """
+        from src.models.smoothing_manual import fit_smoothing
+
+        result = fit_smoothing(series, model, alpha, beta, gamma, seasonal_periods)
+        return cls.from_statsmodels(result, model, series)
+
+    def _set_index(self, index):
+        if len(index) == 0:
+            return
+        self.last_index = index[-1]
+        if isinstance(index, pd.DatetimeIndex):
+            freq = index.freqstr or (pd.infer_freq(index) if len(index) >= 3 else None)
+            self.freq = freq or self.freq
+
+    # --------------------------------------------------------
+    # 2. Récurrences (formulation statsmodels)
+    # --------------------------------------------------------
+
+    def _run(self, y, level, trend, season):
+        """
+        Applique les récurrences sur y depuis (level, trend, season).
+        Retourne (prévisions à un pas, level, trend, season, facteur saisonnier
+        employé au dernier pas ou None).
+        """
+        spec = MODEL_SPECS[self.model]
+        a, b, g = self.alpha, self.beta, self.gamma
+        season = season.copy()
+        m = len(season)
+        fitted = np.empty(len(y))
+        s = None
+
+        for t, obs in enumerate(y):
+            s = season[t % m] if m else 0.0
+            base = level + trend
+            if spec["seasonal"] == "mul":
+                fitted[t] = base * s
+                new_level = a * obs / s + (1 - a) * base
+                season[t % m] = g * obs / base + (1 - g) * s
+            elif spec["seasonal"] == "add":
+                fitted[t] = base + s
+                new_level = a * (obs - s) + (1 - a) * base
+                season[t % m] = g * (obs - base) + (1 - g) * s
+            else:
+                fitted[t] = base
+                new_level = a * obs + (1 - a) * base
+            if spec["trend"]:
+                trend = b * (new_level - level) + (1 - b) * trend
+            level = new_level
+
+        # Remet season[0] sur le pas suivant
+        if m:
+            season = np.roll(season, -(len(y) % m))
+        return fitted, level, trend, season, s if m else None
+
+    def fitted_values(self, y):
+        """
+        Valeurs ajustées (prévisions à un pas) de y depuis l'état initial.
+        """
+        values = np.asarray(y, dtype=float)
+        fitted = self._run(values, self.initial_level, self.initial_trend, self.initial_season)[0]
+        return pd.Series(fitted, index=y.index) if isinstance(y, pd.Series) else fitted
+
+    def residuals(self, y):
+        return y - self.fitted_values(y)
+
+    def update(self, new_obs):
+        """
+        Intègre de nouvelles observations : état final, SSE et dernière date
+        mis à jour (sans réestimer les paramètres).
+        """
+        values = np.asarray(new_obs, dtype=float).ravel()
+        fitted, self.level, self.trend, self.season, last = self._run(values, self.level, self.trend, self.season)
+        if last is not None:
+            self.last_season = float(last)
+        self.sse += float(np.sum((values - fitted) ** 2))
+        self.n_obs += len(values)
+
+        if isinstance(new_obs, pd.Series) and len(new_obs):
+            self._set_index(new_obs.index)
+        elif self.last_index is not None and len(values):
+            self.last_index = self._future_index(len(values))[-1]
+        return self
+
+    # --------------------------------------------------------
+    # 3. Prévision
+    # --------------------------------------------------------
+
+    def _future_index(self, h):
+        if isinstance(self.last_index, pd.Timestamp) and self.freq:
+            return pd.date_range(self.last_index, periods=h + 1, freq=self.freq)[1:]
+        start = int(self.last_index) + 1 if self.last_index is not None else self.n_obs
+        return pd.RangeIndex(start, start + h)
+
+    def forecast(self, h=1):
+        """
+        Prévisions à h pas depuis l'état final (Series indexée par les dates futures).
+        """
+        spec = MODEL_SPECS[self.model]
+        steps = np.arange(1, h + 1)
+        values = self.level + steps * self.trend
+
+        if spec["seasonal"]:
+            m = len(self.season)
+            s = self.season[(steps - 1) % m]
+            if self.last_season is not None:
+                s = np.where(steps % m == 0, self.last_season, s)
+            values = values * s if spec["seasonal"] == "mul" else values + s
+
+        return pd.Series(values, index=self._future_index(h))
+
+    # --------------------------------------------------------
+    # 4. Métriques
+    # --------------------------------------------------------
+
+    @property
+    def n_params(self):
+        spec = MODEL_SPECS[self.model]
+        return 1 + bool(spec["trend"]) + bool(spec["seasonal"])
+
+    @property
+    def mse(self):
+        return self.sse / self.n_obs if self.n_obs else np.nan
+
+    # --------------------------------------------------------
+    # 5. Persistance
+    # --------------------------------------------------------
+
+    def to_bytes(self):
+        """
+        En-tête JSON (spécification, scalaires) + saisons en float64 brut.
+        """
+        header = {
+            "model": self.model,
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "gamma": self.gamma,
+            "seasonal_periods": self.seasonal_periods,
+            "initial_level": self.initial_level,
+            "initial_trend": self.initial_trend,
+            "level": self.level,
+            "trend": self.trend,
+            "last_season": self.last_season,
+            "n_obs": self.n_obs,
+            "sse": self.sse,
+            "last_index": None if self.last_index is None else str(self.last_index),
+            "datetime_index": isinstance(self.last_index, pd.Timestamp),
+            "freq": self.freq
+        }
+        encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        arrays = np.concatenate([self.initial_season, self.season]).astype("<f8")
+        return _MAGIC + struct.pack("<I", len(encoded)) + encoded + arrays.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != _MAGIC:
+            raise ValueError("Format d'état de modèle inconnu.")
+        size = struct.unpack("<I", data[4:8])[0]
+        header = json.loads(data[8:8 + size].decode("utf-8"))
+        arrays = np.frombuffer(data[8 + size:], dtype="<f8")
+        m = len(arrays) // 2
+
+        state = cls(
+            header["model"], header["alpha"], header["beta"], header["gamma"],
+            header["seasonal_periods"],
+            initial_level=header["initial_level"],
+            initial_trend=header["initial_trend"],
+            initial_season=arrays[:m],
+            n_obs=header["n_obs"],
+            sse=header["sse"],
+            freq=header["freq"]
+        )
+        state.level = header["level"]
+        state.trend = header["trend"]
+        state.season = arrays[m:].copy()
+        state.last_season = header.get("last_season")
+        if header["last_index"] is not None:
+            state.last_index = (
+                pd.Timestamp(header["last_index"]) if header["datetime_index"] else int(header["last_index"])
+            )
+        return state
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __getstate__(self):
+        return self.to_bytes()
+
+    def __setstate__(self, data):
+        other = SmoothingState.from_bytes(data)
+        for name in self.__slots__:
+            setattr(self, name, getattr(other, name))
+
+    def __repr__(self):
+        params = ", ".join(
+            f"{k}={getattr(self, k):.3g}" for k in ("alpha", "beta", "gamma") if getattr(self, k) is not None
+        )
+        return f"SmoothingState({self.model}, {params}, n_obs={self.n_obs})"
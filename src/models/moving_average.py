@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def moving_average_odd(series, k):
@@ -37,16 +38,21 @@ def moving_average_p(series, p):
 def extract_trend(series, p):
     return moving_average_p(series, p)
 
+def seasonal_indices(detrended, p):
+    """
+    Indice saisonnier : moyenne de chaque saison i (observations i, i+p, ...).
+    """
+    return np.array([detrended[i::p].mean() for i in range(p)])
+
 def extract_seasonality_additive(series, trend, p):
     detrended = series - trend
-    season = {}
+    season = seasonal_indices(detrended, p)
 
-    for i in range(p):
-        season[i] = detrended[i::p].mean()
+    # Reconstruire une série de même longueur (répétition de l'indice)
+    return pd.Series(np.resize(season, len(series)), index=series.index)
 
-    # Reconstruire une série de même longueur
-    seasonal_values = []
-    for i in range(len(series)):
-        seasonal_values.append(season[i % p])
+def extract_seasonality_multiplicative(series, trend, p):
+    ratios = series / trend
+    season = seasonal_indices(ratios, p)
 
-    return pd.Series(seasonal_values, index=series.index)
+    return pd.Series(np.resize(season, len(series)), index=series.index)
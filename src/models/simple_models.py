@@ -1,11 +1,12 @@
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 import numpy as np
 
 def moving_average(series, window=3):
     return series.rolling(window=window).mean()
 
 def linear_regression_forecast(series, steps=3):
+    from sklearn.linear_model import LinearRegression
+
     X = np.arange(len(series)).reshape(-1, 1)
     y = series.values
 
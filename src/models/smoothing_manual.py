@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.holtwinters import SimpleExpSmoothing, ExponentialSmoothing
+
+# statsmodels (~1,5 s à l'import) est chargé dans les fonctions d'ajustement :
+# importer ce module (MODEL_SPECS...) reste immédiat.
 
 # --------------------------------------------------------
 # 1. Lissage exponentiel simple (SES)
@@ -10,6 +12,8 @@ def ses_forecast(series, alpha, steps=3):
     Lissage exponentiel simple (SES)
     Retourne uniquement les prévisions.
     """
+    from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+
     model = SimpleExpSmoothing(series, initialization_method="estimated")
     fit_model = model.fit(smoothing_level=alpha, optimized=False)
     forecast = fit_model.forecast(steps).astype(float)
@@ -24,6 +28,8 @@ def holt_forecast(series, alpha, beta, steps=3):
     Holt (niveau + tendance)
     Retourne uniquement les prévisions.
     """
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
     model = ExponentialSmoothing(
         series,
         trend="add",
@@ -45,6 +51,8 @@ def holt_winters_additive_forecast(series, alpha, beta, gamma, seasonal_periods=
     """
     Holt-Winters Additif : Y = Trend + Saison
     """
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
     model = ExponentialSmoothing(
         series,
         trend="add",
@@ -69,6 +77,8 @@ def holt_winters_multiplicative_forecast(series, alpha, beta, gamma, seasonal_pe
     """
     Holt-Winters Multiplicatif : Y = Trend * Saison
     """
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
     model = ExponentialSmoothing(
         series,
         trend="add",
@@ -84,3 +94,62 @@ def holt_winters_multiplicative_forecast(series, alpha, beta, gamma, seasonal_pe
     )
     forecast = fit_model.forecast(steps).astype(float)
     return forecast
+
+
+# --------------------------------------------------------
+# 5. Ajustement générique (grid search, bootstrap, batch)
+# --------------------------------------------------------
+MODEL_SPECS = {
+    "SES": {"trend": None, "seasonal": None},
+    "Holt": {"trend": "add", "seasonal": None},
+    "HW Additif": {"trend": "add", "seasonal": "add"},
+    "HW Multiplicatif": {"trend": "add", "seasonal": "mul"}
+}
+
+# Nombre de paramètres de lissage (k) utilisé pour AIC / AICc / BIC
+MODEL_N_PARAMS = {"SES": 1, "Holt": 2, "HW Additif": 3, "HW Multiplicatif": 3}
+
+# statsmodels : référence ; native : src/models/smoothing_native.py (mêmes résultats,
+# vérifiés par benchmarks/parity.py, sans le coût de construction du modèle)
+ENGINES = ("statsmodels", "native")
+DEFAULT_ENGINE = "statsmodels"
+
+
+def fit_smoothing(series, model, alpha, beta=None, gamma=None, seasonal_periods=4, engine=DEFAULT_ENGINE):
+    """
+    Ajuste un des modèles de MODEL_SPECS avec des paramètres fixés.
+    Retourne le résultat statsmodels (fittedvalues, resid, forecast, aic...),
+    ou son équivalent natif si engine="native".
+    """
+    if engine == "native":
+        from src.models.smoothing_native import fit_native
+        return fit_native(series, model, alpha, beta, gamma, seasonal_periods)
+    if engine != "statsmodels":
+        raise ValueError(f"Moteur inconnu : {engine}")
+
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    spec = MODEL_SPECS[model]
+
+    model_es = ExponentialSmoothing(
+        series,
+        trend=spec["trend"],
+        seasonal=spec["seasonal"],
+        seasonal_periods=seasonal_periods if spec["seasonal"] else None,
+        initialization_method="estimated"
+    )
+    return model_es.fit(
+        smoothing_level=alpha,
+        smoothing_trend=beta if spec["trend"] else None,
+        smoothing_seasonal=gamma if spec["seasonal"] else None,
+        optimized=False
+    )
+
+
+def smoothing_fit_forecast(series, steps, model, alpha, beta=None, gamma=None, seasonal_periods=4,
+                           engine=DEFAULT_ENGINE):
+    """
+    (valeurs ajustées, prévisions) : format attendu par bootstrap_forecast.
+    """
+    fit_model = fit_smoothing(series, model, alpha, beta, gamma, seasonal_periods, engine)
+    return fit_model.fittedvalues, fit_model.forecast(steps).astype(float)
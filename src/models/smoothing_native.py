@@ -0,0 +1,213 @@
+import numpy as np
+import pandas as pd
+
+from src.models.smoothing_manual import MODEL_SPECS, MODEL_N_PARAMS
+
+# Moteur de lissage exponentiel sans statsmodels, pour les paramètres fixés
+# (optimized=False) utilisés par le grid search, le bootstrap et le batch.
+# Reproduit ExponentialSmoothing(initialization_method="estimated") :
+# - initialisation « simple » (n < 10 + 2·(m // 2)) ou « heuristique »
+#   (moyenne mobile centrée sur 5 cycles au plus, régression sur 10 points),
+# - mêmes récurrences, même SSE / AIC / AICc / BIC, mêmes prévisions.
+# Les récurrences tournent sur des floats Python (pas d'indexation numpy
+# élément par élément) et sans construction du modèle statsmodels.
+# benchmarks/parity.py compare les deux moteurs (écarts et accélération).
+
+
+# --------------------------------------------------------
+# 1. Valeurs initiales
+# --------------------------------------------------------
+
+def _initial_simple(y, trend, seasonal, m):
+    if not seasonal:
+        level = y[0]
+        return level, (y[1] - y[0]) if trend else None, None
+
+    if len(y) < 2 * m:
+        raise ValueError("Au moins deux cycles saisonniers complets sont nécessaires.")
+    level = np.mean(y[:m])
+    slope = np.mean((y[m:2 * m] - y[:m]) / m) if trend else None
+    season = y[:m] - level if seasonal == "add" else y[:m] / level
+    return level, slope, season
+
+
+def _initial_heuristic(y, trend, seasonal, m):
+    n = len(y)
+    if n < 10:
+        raise ValueError("Au moins 10 observations sont nécessaires.")
+
+    season = None
+    if seasonal:
+        if n < 2 * m:
+            raise ValueError("Au moins deux cycles saisonniers complets sont nécessaires.")
+        min_obs = 10 + 2 * (m // 2)
+        k_cycles = max(min(5, n // m), int(np.ceil(min_obs / m)))
+
+        # Moyenne mobile centrée (2×m si m est pair), comme statsmodels : pandas
+        # est gardé ici, une autre sommation (np.convolve) décale les saisons
+        # initiales de 1e-14, écart que les paramètres instables amplifient
+        head = pd.Series(y[:m * k_cycles])
+        smooth = head.rolling(m, center=True).mean()
+        if m % 2 == 0:
+            smooth = smooth.shift(-1).rolling(2).mean()
+
+        detrended = head - smooth if seasonal == "add" else head / smooth
+        cycles = np.full(k_cycles * m, np.nan)
+        cycles[:len(detrended)] = detrended.to_numpy()
+        season = np.nanmean(cycles.reshape(k_cycles, m), axis=0)
+        season = season - season.mean() if seasonal == "add" else season / season.mean()
+
+        y = smooth.dropna().to_numpy()
+
+    exog = np.c_[np.ones(10), np.arange(10) + 1]
+    coef = np.linalg.pinv(exog) @ y[:10]
+    return coef[0], coef[1] if trend else None, season
+
+
+def initial_values(y, model, seasonal_periods=None):
+    """
+    (niveau, tendance, saisons) initiaux, comme initialization_method="estimated"
+    de statsmodels sans optimisation.
+    """
+    spec = MODEL_SPECS[model]
+    m = seasonal_periods if spec["seasonal"] else 1
+    y = np.asarray(y, dtype=float)
+    if len(y) < 10 + 2 * (m // 2):
+        return _initial_simple(y, spec["trend"], spec["seasonal"], m)
+    return _initial_heuristic(y, spec["trend"], spec["seasonal"], m)
+
+
+# --------------------------------------------------------
+# 2. Récurrences
+# --------------------------------------------------------
+
+def _recursions(y, spec, alpha, beta, gamma, level, trend, season):
+    """
+    Valeurs ajustées (prévisions à un pas) et état final.
+    Retourne (fitted, level, trend, saisons du dernier cycle, facteur
+    saisonnier utilisé au dernier pas).
+    """
+    has_trend = bool(spec["trend"])
+    seasonal = spec["seasonal"]
+    trend = trend if has_trend else 0.0
+    season = [float(s) for s in season] if seasonal else [0.0]
+    m = len(season)
+    a, ac = alpha, 1 - alpha
+    b, bc = (beta, 1 - beta) if has_trend else (0.0, 1.0)
+    g, gc = (gamma, 1 - gamma) if seasonal else (0.0, 1.0)
+
+    # Opérations dans l'ordre de statsmodels : résultats identiques au bit près,
+    # y compris pour les paramètres instables qui amplifient les arrondis
+    fitted = []
+    append = fitted.append
+    used = season[-1]
+    for t, obs in enumerate(y.tolist()):
+        j = t % m
+        s = season[j]
+        base = level + trend
+        if seasonal == "mul":
+            append(base * s)
+            new_level = a * obs / s + ac * base
+            season[j] = g * obs / base + gc * s
+        elif seasonal == "add":
+            append(base + s)
+            new_level = a * obs - a * s + ac * base
+            season[j] = g * obs - g * base + gc * s
+        else:
+            append(base)
+            new_level = a * obs + ac * base
+        if has_trend:
+            trend = b * (new_level - level) + bc * trend
+        level = new_level
+        used = s
+
+    n = len(y)
+    last_cycle = [season[(n + k) % m] for k in range(m)] if seasonal else []
+    return np.array(fitted), level, trend, np.array(last_cycle), used
+
+
+# --------------------------------------------------------
+# 3. Résultat (interface d'un HoltWintersResults)
+# --------------------------------------------------------
+
+def _future_index(index, h):
+    if isinstance(index, pd.DatetimeIndex) and len(index):
+        freq = index.freq or (pd.infer_freq(index) if len(index) >= 3 else None)
+        if freq is not None:
+            return pd.date_range(index[-1], periods=h + 1, freq=freq)[1:]
+    n = len(index)
+    return pd.RangeIndex(n, n + h)
+
+
+class NativeFit:
+    """
+    Ajustement à paramètres fixés : mêmes attributs que le résultat
+    statsmodels utilisé dans le projet (fittedvalues, resid, sse, aic,
+    aicc, bic, params, forecast).
+    """
+
+    def __init__(self, series, model, alpha, beta=None, gamma=None, seasonal_periods=4):
+        spec = MODEL_SPECS[model]
+        series = pd.Series(series)
+        y = series.to_numpy(dtype=float)
+        m = int(seasonal_periods) if spec["seasonal"] else 1
+
+        self.model_name = model
+        self.index = series.index
+        self.nobs = len(y)
+        self.seasonal_periods = m if spec["seasonal"] else None
+
+        level0, trend0, season0 = initial_values(y, model, m)
+        fitted, self.level, self.trend, self.season, used = _recursions(
+            y, spec, float(alpha), beta, gamma, float(level0), trend0, season0
+        )
+
+        self.fittedvalues = pd.Series(fitted, index=series.index)
+        self._y = y
+        err = y - fitted
+        self.sse = float(err @ err)
+
+        # Même décompte que statsmodels : α, l0 (+ β, b0) (+ γ, s0...)
+        k = m * bool(spec["seasonal"]) + 2 * bool(spec["trend"]) + 2
+        n = self.nobs
+        self.aic = n * np.log(self.sse / n) + 2 * k
+        dof = n - k - 3
+        self.aicc = self.aic + (2 * (k + 2) * (k + 3) / dof if dof > 0 else np.inf)
+        self.bic = n * np.log(self.sse / n) + k * np.log(n)
+
+        self.params = {
+            "smoothing_level": float(alpha),
+            "smoothing_trend": float(beta) if spec["trend"] else np.nan,
+            "smoothing_seasonal": float(gamma) if spec["seasonal"] else np.nan,
+            "initial_level": float(level0),
+            "initial_trend": float(trend0) if spec["trend"] else np.nan,
+            "initial_seasons": np.asarray(season0, dtype=float) if spec["seasonal"] else np.array([])
+        }
+        self._spec = spec
+        # statsmodels réutilise, au pas h ≡ 0 (mod m), le facteur du dernier pas
+        # observé (avant sa mise à jour) : même convention ici
+        self._forecast_season = np.r_[used, self.season[:-1]] if spec["seasonal"] else None
+
+    @property
+    def resid(self):
+        return pd.Series(self._y - self.fittedvalues.to_numpy(), index=self.index)
+
+    @property
+    def n_params(self):
+        return MODEL_N_PARAMS[self.model_name]
+
+    def forecast(self, steps=1):
+        steps_ahead = np.arange(1, steps + 1)
+        values = self.level + steps_ahead * self.trend
+        if self._spec["seasonal"]:
+            m = len(self._forecast_season)
+            s = self._forecast_season[steps_ahead % m]
+            values = values * s if self._spec["seasonal"] == "mul" else values + s
+        return pd.Series(values, index=_future_index(self.index, steps))
+
+
+def fit_native(series, model, alpha, beta=None, gamma=None, seasonal_periods=4):
+    """
+    Équivalent de fit_smoothing (statsmodels) avec le moteur natif.
+    """
+    return NativeFit(series, model, alpha, beta, gamma, seasonal_periods)
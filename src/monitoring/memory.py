@@ -0,0 +1,350 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Comptabilité mémoire d'une session : taille profonde des objets de
+# st.session_state, tampons numpy partagés ou recopiés à l'identique, et
+# instantanés tracemalloc autour des calculs lourds (import...).
+# Sert à dimensionner le serveur pour plusieurs utilisateurs simultanés.
+
+DUPLICATE_MIN_BYTES = 4096       # tampons plus petits ignorés pour les doublons
+MAX_REPORTS = 20
+
+_ENABLED = False
+_LOCK = threading.Lock()
+_REPORTS = deque(maxlen=MAX_REPORTS)
+
+
+# --------------------------------------------------------
+# 1. Taille profonde
+# --------------------------------------------------------
+
+def _root_buffer(arr):
+    """
+    Objet propriétaire de la mémoire d'un tableau (remonte les vues).
+    """
+    base = arr
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    return base
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Taille (octets) de obj et de tout ce qu'il référence, chaque objet
+    et chaque tampon numpy n'étant compté qu'une fois (vues comprises).
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        root = _root_buffer(obj)
+        size = sys.getsizeof(obj) - (obj.nbytes if obj.base is None else 0)
+        if id(root) in seen and root is not obj:
+            return size
+        seen.add(id(root))
+        buffer = root.nbytes if isinstance(root, np.ndarray) else sys.getsizeof(root)
+        if obj.dtype == object:
+            buffer += sum(deep_sizeof(v, seen) for v in obj.ravel())
+        return size + buffer
+
+    # sys.getsizeof d'un objet pandas inclut déjà ses données (memory_usage) :
+    # seule l'enveloppe est comptée ici, les tampons le sont une fois via seen
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return object.__sizeof__(obj) + deep_sizeof(obj.to_numpy(), seen) + (
+            deep_sizeof(obj.index, seen) if isinstance(obj, pd.Series) else 0
+        )
+    if isinstance(obj, pd.DataFrame):
+        return (object.__sizeof__(obj) + deep_sizeof(obj.index, seen) + deep_sizeof(obj.columns, seen)
+                + sum(deep_sizeof(obj[col].to_numpy(), seen) for col in obj.columns))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_sizeof(v, seen) for v in obj)
+    elif isinstance(obj, (str, bytes, bytearray, int, float, complex, bool, type(None))):
+        pass
+    else:
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), seen)
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += deep_sizeof(getattr(obj, slot), seen)
+    return size
+
+
+# --------------------------------------------------------
+# 2. Session : tailles, tampons partagés et doublons
+# --------------------------------------------------------
+
+def _arrays(obj, path, depth=0):
+    """
+    (chemin, tableau) des tampons numpy atteignables (Series, DataFrame,
+    dict, list, attributs d'objets).
+    """
+    if depth > 4:
+        return
+    if isinstance(obj, np.ndarray):
+        if obj.dtype != object:
+            yield path, obj
+    elif isinstance(obj, pd.Series):
+        yield path, obj.to_numpy()
+        yield from _arrays(obj.index, f"{path}.index", depth + 1)
+    elif isinstance(obj, pd.Index):
+        values = obj.to_numpy()
+        if values.dtype != object:
+            yield path, values
+    elif isinstance(obj, pd.DataFrame):
+        for col in obj.columns:
+            yield from _arrays(obj[col], f"{path}[{col!r}]", depth + 1)
+        yield from _arrays(obj.index, f"{path}.index", depth + 1)
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            yield from _arrays(v, f"{path}[{k!r}]", depth + 1)
+    elif isinstance(obj, (list, tuple)):
+        for i, v in enumerate(obj):
+            yield from _arrays(v, f"{path}[{i}]", depth + 1)
+    elif hasattr(obj, "__dict__") or hasattr(type(obj), "__slots__"):
+        attrs = dict(vars(obj)) if hasattr(obj, "__dict__") else {}
+        attrs.update({s: getattr(obj, s) for s in getattr(type(obj), "__slots__", ()) if hasattr(obj, s)})
+        for k, v in attrs.items():
+            yield from _arrays(v, f"{path}.{k}", depth + 1)
+
+
+def session_sizes(state):
+    """
+    Tableau par clé : type, taille profonde de la clé seule et taille
+    supplémentaire une fois les clés précédentes comptées (les tampons
+    partagés ne sont comptés qu'une fois au total).
+    """
+    rows, seen = [], set()
+    for key in sorted(state.keys(), key=str):
+        value = state[key]
+        alone = deep_sizeof(value)
+        added = deep_sizeof(value, seen)
+        rows.append({"cle": str(key), "type": type(value).__name__,
+                     "taille_mo": alone / 2**20, "supplementaire_mo": added / 2**20})
+    df = pd.DataFrame(rows, columns=["cle", "type", "taille_mo", "supplementaire_mo"])
+    return df.sort_values("taille_mo", ascending=False).reset_index(drop=True)
+
+
+def session_total(state):
+    """
+    Empreinte totale de la session (octets), tampons partagés comptés une fois.
+    """
+    seen = set()
+    return sum(deep_sizeof(state[k], seen) for k in list(state.keys()))
+
+
+def _digest(arr):
+    data = np.ascontiguousarray(arr)
+    return hashlib.blake2b(data.view(np.uint8).ravel(), digest_size=16).hexdigest()
+
+
+def duplicate_buffers(state, min_bytes=DUPLICATE_MIN_BYTES):
+    """
+    Tampons numpy de la session regroupés par contenu.
+    statut « copie » : contenus identiques dans des tampons distincts
+    (gaspillage = (copies - 1) × taille) ; « partagé » : même tampon
+    référencé par plusieurs chemins (vues, aucune copie).
+    """
+    groups = {}
+    for key in list(state.keys()):
+        for path, arr in _arrays(state[key], str(key)):
+            if arr.nbytes < min_bytes:
+                continue
+            signature = (arr.dtype.str, arr.shape, _digest(arr))
+            owner = id(_root_buffer(arr))
+            groups.setdefault(signature, {}).setdefault(owner, []).append(path)
+
+    rows = []
+    for (dtype, shape, _), owners in groups.items():
+        paths = [p for ps in owners.values() for p in ps]
+        if len(paths) < 2:
+            continue
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        copies = len(owners)
+        rows.append({
+            "statut": "copie" if copies > 1 else "partagé",
+            "dtype": np.dtype(dtype).name,
+            "taille_mo": nbytes / 2**20,
+            "tampons": copies,
+            "references": len(paths),
+            "gaspillage_mo": (copies - 1) * nbytes / 2**20,
+            "chemins": ", ".join(paths)
+        })
+    df = pd.DataFrame(rows, columns=["statut", "dtype", "taille_mo", "tampons", "references",
+                                     "gaspillage_mo", "chemins"])
+    return df.sort_values("gaspillage_mo", ascending=False).reset_index(drop=True)
+
+
+def process_memory_mb():
+    """
+    Mémoire résidente du processus (Mo) : psutil si disponible, sinon /proc (Linux).
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open(f"/proc/{os.getpid()}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def available_memory_mb():
+    """
+    Mémoire disponible sur la machine (Mo) : psutil si disponible, sinon
+    /proc/meminfo (Linux). None si inconnue.
+    """
+    try:
+        import psutil
+        return psutil.virtual_memory().available / 2**20
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+# --------------------------------------------------------
+# 3. Instantanés tracemalloc autour des calculs lourds
+# --------------------------------------------------------
+
+def enable():
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable():
+    global _ENABLED
+    _ENABLED = False
+
+
+def is_enabled():
+    return _ENABLED
+
+
+def _filtered(snapshot):
+    return snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+
+class track:
+    """
+    Gestionnaire de contexte : instantanés avant / après une opération,
+    principales lignes allocatrices (écart conservé) et pic atteint.
+    Ne fait rien tant que le suivi n'est pas activé (enable()).
+
+        with track("page1.chargement"):
+            ...
+    """
+
+    def __init__(self, label, top=15):
+        self.label = label
+        self.top = top
+        self._active = False
+
+    def __enter__(self):
+        if not _ENABLED:
+            return self
+        self._active = True
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(10)
+        tracemalloc.reset_peak()
+        self._before = _filtered(tracemalloc.take_snapshot())
+        self._current = tracemalloc.get_traced_memory()[0]
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if not self._active:
+            return False
+        duration = time.perf_counter() - self._t0
+        current, peak = tracemalloc.get_traced_memory()
+        after = _filtered(tracemalloc.take_snapshot())
+        if self._started:
+            tracemalloc.stop()
+
+        stats = after.compare_to(self._before, "lineno")
+        top = [{
+            "fichier": _short(stat.traceback[0].filename),
+            "ligne": stat.traceback[0].lineno,
+            "ecart_ko": stat.size_diff / 1024,
+            "taille_ko": stat.size / 1024,
+            "blocs": stat.count_diff
+        } for stat in stats[:self.top]]
+
+        with _LOCK:
+            _REPORTS.append({
+                "operation": self.label,
+                "date": time.strftime("%H:%M:%S"),
+                "duree_s": duration,
+                "conserve_mo": (current - self._current) / 2**20,
+                "pic_mo": (peak - self._current) / 2**20,
+                "top": top
+            })
+        return False
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _short(filename):
+    """
+    Chemin lisible : relatif au projet ou à site-packages.
+    """
+    marker = os.sep + "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    if filename.startswith(_ROOT + os.sep):
+        return os.path.relpath(filename, _ROOT)
+    return filename
+
+
+def reports():
+    """
+    Instantanés enregistrés (du plus récent au plus ancien).
+    """
+    with _LOCK:
+        return list(reversed(_REPORTS))
+
+
+def reports_table():
+    rows = [{k: r[k] for k in ("operation", "date", "duree_s", "conserve_mo", "pic_mo")} for r in reports()]
+    return pd.DataFrame(rows, columns=["operation", "date", "duree_s", "conserve_mo", "pic_mo"])
+
+
+def top_allocators(report):
+    return pd.DataFrame(report["top"], columns=["fichier", "ligne", "ecart_ko", "taille_ko", "blocs"])
+
+
+def clear_reports():
+    with _LOCK:
+        _REPORTS.clear()
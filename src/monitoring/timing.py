@@ -0,0 +1,233 @@
+import functools
+import threading
+import time
+import tracemalloc
+
+# Instrumentation des chemins chauds (import, grid search, bootstrap,
+# décomposition, tests, tracés) : nombre d'appels, temps mur et CPU, pic
+# mémoire (si tracemalloc est activé) et piles repliées (format flamegraph).
+# Désactivée par défaut : une fonction décorée ne coûte alors qu'un test de booléen.
+
+_ENABLED = False
+_MEMORY = False
+
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+_STATS = {}      # nom → {"appels", "mur_s", "cpu_s", "max_s", "pic_octets"}
+_FOLDED = {}     # "parent;enfant" → temps propre (s)
+
+
+# --------------------------------------------------------
+# 1. Activation
+# --------------------------------------------------------
+
+def enable(memory=False):
+    """
+    Active l'enregistrement. memory=True démarre tracemalloc pour mesurer
+    le pic mémoire de chaque section (surcoût notable : à réserver au diagnostic).
+    """
+    global _ENABLED, _MEMORY
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if not memory and _MEMORY and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _MEMORY = memory
+    _ENABLED = True
+
+
+def disable():
+    global _ENABLED, _MEMORY
+    if _MEMORY and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _ENABLED = False
+    _MEMORY = False
+
+
+def is_enabled():
+    return _ENABLED
+
+
+def memory_enabled():
+    return _ENABLED and _MEMORY
+
+
+def reset():
+    with _LOCK:
+        _STATS.clear()
+        _FOLDED.clear()
+
+
+# --------------------------------------------------------
+# 2. Mesure
+# --------------------------------------------------------
+
+def _stack():
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+class _Frame:
+    __slots__ = ("name", "path", "wall", "cpu", "children", "mem_start", "child_peak")
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.path = f"{parent.path};{name}" if parent is not None else name
+        self.children = 0.0
+        self.child_peak = 0
+        self.mem_start = None
+        if _MEMORY and tracemalloc.is_tracing():
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.mem_start = current
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+
+
+def _record(frame, parent):
+    wall = time.perf_counter() - frame.wall
+    cpu = time.thread_time() - frame.cpu
+
+    peak = None
+    if frame.mem_start is not None and tracemalloc.is_tracing():
+        # Le pic a été remis à zéro par les sections imbriquées : on garde le leur
+        peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+        if parent is not None:
+            parent.child_peak = max(parent.child_peak, peak)
+        peak -= frame.mem_start
+
+    if parent is not None:
+        parent.children += wall
+
+    with _LOCK:
+        s = _STATS.get(frame.name)
+        if s is None:
+            s = _STATS[frame.name] = {"appels": 0, "mur_s": 0.0, "cpu_s": 0.0, "max_s": 0.0, "pic_octets": None}
+        s["appels"] += 1
+        s["mur_s"] += wall
+        s["cpu_s"] += cpu
+        s["max_s"] = max(s["max_s"], wall)
+        if peak is not None:
+            s["pic_octets"] = max(s["pic_octets"] or 0, peak)
+        _FOLDED[frame.path] = _FOLDED.get(frame.path, 0.0) + max(wall - frame.children, 0.0)
+
+
+class timed:
+    """
+    Section chronométrée, en décorateur ou en gestionnaire de contexte :
+
+        @timed("grid_search")
+        def grid_search_smoothing(...): ...
+
+        with timed("page5.grid_search"):
+            ...
+
+    Sans nom, le décorateur utilise module.fonction. Les sections imbriquées
+    (dans un même thread) forment les piles repliées.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+
+    def __call__(self, func):
+        name = self.name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            with timed(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self):
+        if _ENABLED:
+            stack = _stack()
+            stack.append(_Frame(self.name, stack[-1] if stack else None))
+        return self
+
+    def __exit__(self, *exc):
+        stack = getattr(_LOCAL, "stack", None)
+        # La section a pu être ouverte avant l'activation : rien à fermer
+        if stack and stack[-1].name == self.name:
+            frame = stack.pop()
+            _record(frame, stack[-1] if stack else None)
+        return False
+
+
+# --------------------------------------------------------
+# 3. Résultats
+# --------------------------------------------------------
+
+def stats():
+    """
+    Tableau par section : appels, temps mur / CPU (total, moyen, max),
+    pic mémoire, trié par temps mur décroissant.
+    """
+    import pandas as pd
+
+    with _LOCK:
+        rows = [dict(section=name, **s) for name, s in _STATS.items()]
+    columns = ["section", "appels", "mur_s", "cpu_s", "moyenne_ms", "max_s", "pic_mo"]
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame(rows)
+    df["moyenne_ms"] = df["mur_s"] / df["appels"] * 1000
+    df["pic_mo"] = df["pic_octets"].astype(float) / 2**20
+    return df[columns].sort_values("mur_s", ascending=False).reset_index(drop=True)
+
+
+def folded_stacks(unit=1e6):
+    """
+    Piles repliées « a;b;c valeur » (temps propre, en microsecondes par défaut),
+    lisibles par flamegraph.pl, speedscope ou inferno.
+    """
+    with _LOCK:
+        items = sorted(_FOLDED.items())
+    return "\n".join(f"{path} {int(round(seconds * unit))}" for path, seconds in items if seconds > 0)
+
+
+def flame_summary():
+    """
+    Piles repliées en tableau : profondeur, temps propre et temps inclusif
+    (propre + descendants) par chemin, dans l'ordre de l'arbre d'appel.
+    """
+    import pandas as pd
+
+    with _LOCK:
+        folded = dict(_FOLDED)
+
+    inclusive = {}
+    for path, seconds in folded.items():
+        parts = path.split(";")
+        for depth in range(1, len(parts) + 1):
+            prefix = ";".join(parts[:depth])
+            inclusive[prefix] = inclusive.get(prefix, 0.0) + seconds
+
+    rows = [{
+        "chemin": path,
+        "section": path.rsplit(";", 1)[-1],
+        "profondeur": path.count(";"),
+        "inclusif_s": total,
+        "propre_s": folded.get(path, 0.0)
+    } for path, total in sorted(inclusive.items())]
+    return pd.DataFrame(rows, columns=["chemin", "section", "profondeur", "inclusif_s", "propre_s"])
+
+
+def export_json():
+    """
+    Instantané (sections + piles repliées) pour archivage ou comparaison.
+    """
+    import json
+
+    with _LOCK:
+        payload = {
+            "sections": {name: dict(s) for name, s in _STATS.items()},
+            "piles": {path: seconds for path, seconds in _FOLDED.items()},
+            "memoire": _MEMORY
+        }
+    return json.dumps(payload, indent=2, ensure_ascii=False)
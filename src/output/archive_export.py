@@ -1,16 +1,308 @@
+import hashlib
+import io
+import json
 import os
+import struct
+import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def create_results_zip(base_dir="."):
+import pandas as pd
+
+# Archive des résultats construite en mémoire : sérialisation des objets,
+# compression des membres en parallèle (zlib libère le GIL), écriture ZIP
+# en flux, sans fichier temporaire.
+
+MANIFEST_NAME = "manifest.json"
+
+# Méthodes de compression ZIP (APPNOTE 4.4.5)
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_ZSTD = 93
+
+# Formats déjà compacts : stockés tels quels
+COMPACT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".zst",
+                      ".parquet", ".feather", ".pdf", ".xlsx")
+
+
+# --------------------------------------------------------
+# 1. Sérialisation des objets en mémoire
+# --------------------------------------------------------
+
+def serialize_member(name, obj):
+    """
+    Objet → octets selon son type (et l'extension du nom) :
+    DataFrame / Series → CSV (Parquet / Feather selon l'extension), dict / list
+    → JSON, figure matplotlib → PNG, str → UTF-8, bytes inchangés.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj)
+    if isinstance(obj, str):
+        return obj.encode("utf-8")
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        if name.lower().endswith(".json"):
+            return obj.to_json(orient="table", date_format="iso", force_ascii=False).encode("utf-8")
+        if name.lower().endswith((".parquet", ".feather")):
+            from src.output.columnar_export import format_from_path, table_to_bytes
+            frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+            return table_to_bytes(frame, format_from_path(name))
+        return obj.to_csv().encode("utf-8")
+    if isinstance(obj, (dict, list, tuple)):
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+    if hasattr(obj, "savefig"):
+        buffer = io.BytesIO()
+        obj.savefig(buffer, format="png", bbox_inches="tight")
+        return buffer.getvalue()
+    raise TypeError(f"Type non exportable pour {name} : {type(obj).__name__}")
+
+
+def _zstd_module():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _resolve_method(name, compression):
+    """
+    compression : "deflate", "zstd", "store" ou "auto"
+    (auto : deflate, sauf formats déjà compacts stockés tels quels).
+    """
+    if compression == "auto":
+        return ZIP_STORED if name.lower().endswith(COMPACT_EXTENSIONS) else ZIP_DEFLATED
+    if compression == "zstd":
+        if _zstd_module() is None:
+            raise ImportError("La compression zstd nécessite le paquet « zstandard ».")
+        return ZIP_ZSTD
+    if compression == "store":
+        return ZIP_STORED
+    if compression == "deflate":
+        return ZIP_DEFLATED
+    raise ValueError(f"Compression inconnue : {compression}")
+
+
+def _compress(data, method, level):
+    """
+    Exécuté dans un thread : CRC et compression du membre.
+    """
+    crc = zlib.crc32(data)
+    if method == ZIP_DEFLATED:
+        compressor = zlib.compressobj(level if level is not None else 6, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    elif method == ZIP_ZSTD:
+        payload = _zstd_module().ZstdCompressor(level=level if level is not None else 3).compress(data)
+    else:
+        payload = data
+    # Compression inutile (données aléatoires, déjà compressées) : stockage
+    if method != ZIP_STORED and len(payload) >= len(data):
+        return crc, ZIP_STORED, data
+    return crc, method, payload
+
+
+# --------------------------------------------------------
+# 2. Écriture ZIP en flux
+# --------------------------------------------------------
+
+def _dos_datetime(timestamp):
+    t = time.localtime(timestamp)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = (max(t.tm_year, 1980) - 1980) << 9 | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+class ZipStreamWriter:
+    """
+    Écrivain ZIP minimal : chaque membre, déjà compressé, est écrit dès qu'il
+    est prêt (en-tête local + données) ; le répertoire central est écrit
+    à la fermeture. Fonctionne sur tout flux binaire inscriptible.
+    Les enregistrements ZIP64 sont ajoutés au-delà de 4 Gio / 65535 membres.
+    """
+
+    # Seuils de passage en ZIP64 (les champs débordés valent 0xFFFF / 0xFFFFFFFF)
+    LIMIT = 0xFFFFFFFF
+    MAX_ENTRIES = 0xFFFF
+    _VERSION = {ZIP_STORED: 10, ZIP_DEFLATED: 20, ZIP_ZSTD: 63}
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.offset = 0
+        self.entries = []
+        self.dos_time, self.dos_date = _dos_datetime(time.time())
+
+    def _write(self, *chunks):
+        for chunk in chunks:
+            self.stream.write(chunk)
+            self.offset += len(chunk)
+
+    def add(self, name, crc, method, payload, size):
+        encoded = name.encode("utf-8")
+        offset = self.offset
+        zip64 = max(len(payload), size, offset) >= self.LIMIT
+        version = max(self._VERSION[method], 45) if zip64 else self._VERSION[method]
+
+        if zip64:
+            extra = struct.pack("<HHQQ", 0x0001, 16, size, len(payload))
+            sizes = (0xFFFFFFFF, 0xFFFFFFFF)
+        else:
+            extra = b""
+            sizes = (len(payload), size)
+
+        header = struct.pack(
+            "<IHHHHHIIIHH", 0x04034B50, version, 0x0800, method,
+            self.dos_time, self.dos_date, crc, *sizes, len(encoded), len(extra)
+        )
+        self._write(header, encoded, extra, payload)
+        self.entries.append((encoded, version, method, crc, len(payload), size, offset, zip64))
+
+    def close(self):
+        start = self.offset
+        for encoded, version, method, crc, csize, usize, offset, zip64 in self.entries:
+            if zip64:
+                extra = struct.pack("<HHQQQ", 0x0001, 24, usize, csize, offset)
+                csize = usize = offset = 0xFFFFFFFF
+            else:
+                extra = b""
+            record = struct.pack(
+                "<IHHHHHHIIIHHHHHII", 0x02014B50, version, version, 0x0800, method,
+                self.dos_time, self.dos_date, crc, csize, usize, len(encoded),
+                len(extra), 0, 0, 0, 0, offset
+            )
+            self._write(record, encoded, extra)
+
+        count, size = len(self.entries), self.offset - start
+        if count >= self.MAX_ENTRIES or max(start, size) >= self.LIMIT:
+            end64 = self.offset
+            self._write(
+                struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0, count, count, size, start),
+                struct.pack("<IIQI", 0x07064B50, 0, end64, 1)
+            )
+            count, size, start = 0xFFFF, 0xFFFFFFFF, 0xFFFFFFFF
+
+        self._write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, size, start, 0))
+
+
+# --------------------------------------------------------
+# 3. Manifeste (membres inchangés)
+# --------------------------------------------------------
+
+def read_manifest(source):
+    """
+    Manifeste d'une archive précédente (chemin de l'archive ou dict).
+    Retourne {} si absent.
+    """
+    if source is None:
+        return {}
+    if isinstance(source, dict):
+        return source
+    try:
+        with zipfile.ZipFile(source) as z:
+            return json.loads(z.read(MANIFEST_NAME).decode("utf-8"))
+    except (OSError, KeyError, zipfile.BadZipFile, ValueError):
+        return {}
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _prepare_member(name, obj, method, level, previous_entry):
+    """
+    Exécuté dans un thread : sérialisation, empreinte et compression d'un
+    membre. Retourne None si le membre est identique à l'archive précédente.
+    """
+    data = serialize_member(name, obj)
+    digest = _digest(data)
+    if previous_entry and previous_entry.get("empreinte") == digest:
+        return None
+    return (digest, len(data)) + _compress(data, method, level)
+
+
+# --------------------------------------------------------
+# 4. Construction de l'archive
+# --------------------------------------------------------
+
+def build_results_archive(members, target=None, compression="auto", level=None,
+                          workers=None, previous=None, archive_name=None):
+    """
+    Construit une archive ZIP à partir d'objets en mémoire.
+
+    members     : dict {nom dans l'archive : objet} (voir serialize_member)
+    target      : chemin, flux binaire, ou None (retourne les octets)
+    compression : "auto", "deflate", "zstd" ou "store"
+    previous    : archive précédente (chemin) ou son manifeste ; les membres
+                  inchangés (même empreinte) ne sont pas réécrits, le manifeste
+                  indique l'archive qui les contient.
+    workers     : threads de sérialisation / compression (défaut : nombre de CPU)
+
+    Retourne (octets de l'archive ou target, manifeste).
+    """
+    previous_manifest = read_manifest(previous).get("membres", {})
+    archive_name = archive_name or (os.path.basename(target) if isinstance(target, str) else None)
+    manifest = {"cree_le": datetime.now().isoformat(timespec="seconds"), "membres": {}}
+
+    if isinstance(target, str):
+        with open(target, "wb") as stream:
+            _stream_members(stream, members, compression, level, workers,
+                            previous_manifest, archive_name, manifest)
+        return target, manifest
+
+    stream = target if target is not None else io.BytesIO()
+    _stream_members(stream, members, compression, level, workers,
+                    previous_manifest, archive_name, manifest)
+    return (stream.getvalue() if target is None else target), manifest
+
+
+def _stream_members(stream, members, compression, level, workers,
+                    previous_manifest, archive_name, manifest):
+    writer = ZipStreamWriter(stream)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [
+            (name, pool.submit(_prepare_member, name, obj, _resolve_method(name, compression),
+                               level, previous_manifest.get(name)))
+            for name, obj in members.items()
+        ]
+        # Membres écrits dans l'ordre, dès que chacun est prêt
+        for name, future in futures:
+            result = future.result()
+            if result is None:
+                manifest["membres"][name] = dict(previous_manifest[name])
+                continue
+            digest, size, crc, method, payload = result
+            writer.add(name, crc, method, payload, size)
+            manifest["membres"][name] = {"empreinte": digest, "taille": size, "archive": archive_name}
+
+    data = serialize_member(MANIFEST_NAME, manifest)
+    writer.add(MANIFEST_NAME, *_compress(data, ZIP_DEFLATED, level), len(data))
+    writer.close()
+
+
+# --------------------------------------------------------
+# 5. Export des fichiers du dossier de travail
+# --------------------------------------------------------
+
+def _latest_archive(archive_dir):
+    archives = sorted(
+        f for f in os.listdir(archive_dir)
+        if f.startswith("resultats_prevision_") and f.endswith(".zip")
+    )
+    return os.path.join(archive_dir, archives[-1]) if archives else None
+
+
+def create_results_zip(base_dir=".", members=None, compression="auto", incremental=False):
     """
     Crée une archive ZIP contenant tous les résultats CSV/JSON
-    et la place dans le dossier output/archives/
+    (et les objets en mémoire de members) et la place dans le dossier output/archives/
+    incremental=True : seuls les membres modifiés depuis la dernière archive sont écrits.
     """
 
     # Dossier de sortie organisé
     archive_dir = os.path.join(base_dir, "output", "archives")
     os.makedirs(archive_dir, exist_ok=True)
+    previous = _latest_archive(archive_dir) if incremental else None
 
     # Horodatage
     timestamp = datetime.now().strftime("%Y-%m-%d_%Hh%Mmin%Ss")
@@ -18,14 +310,12 @@ def create_results_zip(base_dir="."):
     zip_path = os.path.join(archive_dir, zip_name)
 
     # On cherche les fichiers CSV et JSON dans le dossier principal
-    for_export = [
-        f for f in os.listdir(base_dir)
-        if f.endswith(".csv") or f.endswith(".json")
-    ]
-
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
-        for f in for_export:
-            full_path = os.path.join(base_dir, f)
-            z.write(full_path, arcname=f)
+    for_export = {}
+    for f in sorted(os.listdir(base_dir)):
+        if f.endswith(".csv") or f.endswith(".json"):
+            with open(os.path.join(base_dir, f), "rb") as fh:
+                for_export[f] = fh.read()
+    for_export.update(members or {})
 
+    build_results_archive(for_export, zip_path, compression=compression, previous=previous)
     return zip_path
@@ -0,0 +1,210 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+# Export des tables de résultats (prévisions, intervalles, métriques, grid search)
+# en Parquet / Feather (pyarrow, optionnel) ou en CSV écrit par blocs.
+
+FORMATS = {".parquet": "parquet", ".feather": "feather", ".csv": "csv"}
+
+# Nombre minimal de lignes par row group Parquet (les séries ne sont jamais coupées)
+ROW_GROUP_ROWS = 65_536
+CSV_CHUNK_ROWS = 100_000
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("L'export Parquet / Feather nécessite le paquet « pyarrow ».") from None
+    return pyarrow
+
+
+def available_formats():
+    """
+    Formats utilisables dans l'environnement courant.
+    """
+    try:
+        _pyarrow()
+    except ImportError:
+        return ["csv"]
+    return ["parquet", "feather", "csv"]
+
+
+def format_from_path(path, default="csv"):
+    ext = os.path.splitext(str(path))[1].lower()
+    return FORMATS.get(ext, default)
+
+
+# --------------------------------------------------------
+# 1. Typage des colonnes
+# --------------------------------------------------------
+
+def prepare_table(df, series_col=None, float32=False, categories=None):
+    """
+    Colonnes typées pour l'export :
+    - index nommé (dates, séries) remis en colonne,
+    - colonnes texte répétitives (série, modèle) en catégories,
+    - float32 optionnel (divise la taille par deux, ~7 chiffres significatifs).
+    Si series_col est donné, les lignes sont regroupées par série (tri stable).
+    """
+    df = df.reset_index() if _has_named_index(df) else df.copy()
+
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_float_dtype(values) and float32:
+            df[col] = values.astype(np.float32)
+        elif not pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_datetime64_any_dtype(values):
+            if col == series_col or (categories and col in categories) or _is_repetitive(values):
+                df[col] = values.astype("category")
+
+    if series_col is not None:
+        df = df.sort_values(series_col, kind="stable").reset_index(drop=True)
+    return df
+
+
+def _has_named_index(df):
+    return any(name is not None for name in df.index.names)
+
+
+def _is_repetitive(values):
+    n = len(values)
+    return n > 0 and values.nunique(dropna=True) <= max(1, n // 2)
+
+
+def _series_bounds(df, series_col):
+    """
+    Bornes [début, fin) des blocs de lignes de chaque série (table triée par série).
+    """
+    codes = df[series_col].cat.codes.to_numpy() if isinstance(df[series_col].dtype, pd.CategoricalDtype) \
+        else pd.factorize(df[series_col])[0]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    return np.r_[starts, len(df)]
+
+
+# --------------------------------------------------------
+# 2. Écriture
+# --------------------------------------------------------
+
+def write_table(df, target, fmt=None, series_col=None, float32=False,
+                compression="zstd", row_group_rows=ROW_GROUP_ROWS, chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Écrit une table de résultats.
+
+    target     : chemin ou flux binaire
+    fmt        : "parquet", "feather" ou "csv" (défaut : d'après l'extension)
+    series_col : colonne identifiant la série ; en Parquet, chaque row group
+                 contient des séries entières (lecture sélective par série)
+    float32    : réduit les colonnes flottantes en float32
+    compression: codec Parquet / Feather ("zstd", "lz4", "snappy", None)
+    """
+    fmt = fmt or format_from_path(target)
+    table = prepare_table(df, series_col=series_col, float32=float32)
+
+    if fmt == "csv":
+        _write_csv(table, target, chunk_rows)
+    elif fmt == "parquet":
+        _write_parquet(table, target, series_col, compression, row_group_rows)
+    elif fmt == "feather":
+        pa = _pyarrow()
+        import pyarrow.feather as feather
+        feather.write_feather(
+            pa.Table.from_pandas(table, preserve_index=False), target,
+            compression=compression if compression in ("zstd", "lz4") else "uncompressed"
+        )
+    else:
+        raise ValueError(f"Format inconnu : {fmt}")
+    return target
+
+
+def _write_csv(table, target, chunk_rows):
+    """
+    CSV écrit par blocs de lignes (mémoire bornée pour les grandes tables).
+    """
+    own = isinstance(target, (str, os.PathLike))
+    stream = open(target, "w", encoding="utf-8", newline="") if own else io.TextIOWrapper(
+        target, encoding="utf-8", newline="", write_through=True
+    )
+    try:
+        for start in range(0, max(len(table), 1), chunk_rows):
+            table.iloc[start:start + chunk_rows].to_csv(stream, index=False, header=start == 0)
+    finally:
+        if own:
+            stream.close()
+        else:
+            stream.detach()
+
+
+def _write_parquet(table, target, series_col, compression, row_group_rows):
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    arrow = pa.Table.from_pandas(table, preserve_index=False)
+    if series_col is None:
+        pq.write_table(arrow, target, compression=compression, row_group_size=row_group_rows)
+        return
+
+    bounds = _series_bounds(table, series_col)
+    with pq.ParquetWriter(target, arrow.schema, compression=compression) as writer:
+        group_start = 0
+        for end in bounds[1:]:
+            if end - group_start >= row_group_rows or end == len(table):
+                writer.write_table(arrow.slice(group_start, end - group_start),
+                                   row_group_size=end - group_start)
+                group_start = end
+
+
+def table_to_bytes(df, fmt, **kwargs):
+    """
+    Table sérialisée en mémoire (téléchargement, archive ZIP).
+    """
+    buffer = io.BytesIO()
+    write_table(df, buffer, fmt=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+# --------------------------------------------------------
+# 3. Lecture
+# --------------------------------------------------------
+
+def read_table(source, fmt=None, series=None, series_col="serie", columns=None):
+    """
+    Relit une table exportée. En Parquet, series (liste) ne lit que les
+    row groups contenant ces séries.
+    """
+    fmt = fmt or format_from_path(source)
+    if fmt == "csv":
+        df = pd.read_csv(source, usecols=columns)
+        return df[df[series_col].isin(series)] if series is not None else df
+
+    _pyarrow()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        filters = [(series_col, "in", list(series))] if series is not None else None
+        return pq.read_table(source, columns=columns, filters=filters).to_pandas()
+    if fmt == "feather":
+        import pyarrow.feather as feather
+        df = feather.read_table(source, columns=columns).to_pandas()
+        return df[df[series_col].isin(series)] if series is not None else df
+    raise ValueError(f"Format inconnu : {fmt}")
+
+
+# --------------------------------------------------------
+# 4. Tables de résultats au format long (panel)
+# --------------------------------------------------------
+
+def stack_results(tables, series_col="serie"):
+    """
+    {nom de série : DataFrame} → une table longue avec une colonne série
+    (prévisions × horizon, grid search, métriques...).
+    """
+    frames = []
+    for name, df in tables.items():
+        df = df.reset_index() if _has_named_index(df) else df
+        frames.append(df.assign(**{series_col: name}))
+    if not frames:
+        return pd.DataFrame(columns=[series_col])
+    stacked = pd.concat(frames, ignore_index=True)
+    return stacked[[series_col] + [c for c in stacked.columns if c != series_col]]
@@ -0,0 +1,309 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Historique local des exécutions (SQLite) : runs, séries, paramètres retenus,
+# métriques et prévisions, avec index pour les requêtes d'historique.
+
+DEFAULT_PATH = os.path.join("output", "runs.sqlite")
+
+METRICS = ("MSE", "AIC", "AICc", "BIC")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY,
+    created_at  TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    config      TEXT
+);
+CREATE TABLE IF NOT EXISTS series (
+    series_id   INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    fingerprint TEXT NOT NULL DEFAULT '',
+    n_obs       INTEGER,
+    UNIQUE (name, fingerprint)
+);
+CREATE TABLE IF NOT EXISTS parameters (
+    run_id           INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    series_id        INTEGER NOT NULL REFERENCES series(series_id),
+    model            TEXT NOT NULL,
+    alpha            REAL,
+    beta             REAL,
+    gamma            REAL,
+    seasonal_periods INTEGER,
+    PRIMARY KEY (run_id, series_id, model)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id      INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    series_id   INTEGER NOT NULL REFERENCES series(series_id),
+    model       TEXT NOT NULL,
+    metric      TEXT NOT NULL,
+    value       REAL,
+    PRIMARY KEY (run_id, series_id, model, metric)
+);
+CREATE TABLE IF NOT EXISTS forecasts (
+    run_id      INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    series_id   INTEGER NOT NULL REFERENCES series(series_id),
+    model       TEXT NOT NULL,
+    horizon     INTEGER NOT NULL,
+    date        TEXT,
+    forecast    REAL,
+    lower       REAL,
+    upper       REAL,
+    PRIMARY KEY (run_id, series_id, model, horizon)
+);
+CREATE INDEX IF NOT EXISTS idx_series_name ON series(name);
+CREATE INDEX IF NOT EXISTS idx_metrics_lookup ON metrics(metric, series_id, run_id, value);
+CREATE INDEX IF NOT EXISTS idx_forecasts_series ON forecasts(series_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+"""
+
+
+def _column(df, name):
+    """
+    Colonne → liste Python (NaN / absente → None), pour executemany.
+    """
+    if name not in df:
+        return [None] * len(df)
+    values = pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def _date_column(df, name):
+    if name not in df:
+        return [None] * len(df)
+    values = df[name]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d").astype(object).where(values.notna(), None).tolist()
+    return values.astype(object).where(values.notna(), None).map(
+        lambda x: x if x is None else str(x)
+    ).tolist()
+
+
+class RunStore:
+    """
+    Stockage SQLite des résultats. Une connexion par instance, protégée par
+    un verrou (Streamlit exécute les pages dans plusieurs threads).
+    Les insertions d'un run se font en une transaction (executemany).
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --------------------------------------------------------
+    # 1. Écriture
+    # --------------------------------------------------------
+
+    def start_run(self, source="app", config=None):
+        with self._lock, self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (created_at, source, config) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), source,
+                 json.dumps(config, default=str) if config is not None else None)
+            )
+            return cur.lastrowid
+
+    def _series_id(self, name, fingerprint, n_obs):
+        fingerprint = fingerprint or ""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO series (name, fingerprint, n_obs) VALUES (?, ?, ?)",
+            (name, fingerprint, n_obs)
+        )
+        return self.conn.execute(
+            "SELECT series_id FROM series WHERE name = ? AND fingerprint = ?", (name, fingerprint)
+        ).fetchone()[0]
+
+    def add_results(self, run_id, name, grid=None, forecast=None, model=None,
+                    fingerprint=None, n_obs=None, seasonal_periods=None):
+        """
+        Enregistre les résultats d'une série pour un run :
+        grid     : tableau du grid search (Modèle, alpha, beta, gamma, MSE, AIC, AICc, BIC ;
+                   colonnes absentes → NULL)
+        forecast : prévisions (Date, Prévision, bornes) du modèle `model`
+        """
+        self.add_batch(run_id, [{
+            "name": name, "grid": grid, "forecast": forecast, "model": model,
+            "fingerprint": fingerprint, "n_obs": n_obs, "seasonal_periods": seasonal_periods
+        }])
+
+    def add_batch(self, run_id, results):
+        """
+        Insertion groupée : results = [{"name", "grid", "forecast", "model",
+        "fingerprint", "n_obs", "seasonal_periods"}, ...].
+        Les tables de toutes les séries sont concaténées puis converties
+        colonne par colonne : un executemany par table, une transaction.
+        """
+        grids, grid_keys, forecasts, forecast_keys = [], [], [], []
+        with self._lock, self.conn:
+            for r in results:
+                series_id = self._series_id(r["name"], r.get("fingerprint"), r.get("n_obs"))
+                grid, forecast = r.get("grid"), r.get("forecast")
+                if grid is not None and len(grid):
+                    grids.append(grid)
+                    grid_keys.append((series_id, r.get("seasonal_periods"), len(grid)))
+                if forecast is not None and len(forecast):
+                    if isinstance(forecast, pd.Series):
+                        forecast = pd.DataFrame({"Date": forecast.index, "Prévision": forecast.to_numpy()})
+                    forecasts.append(forecast)
+                    forecast_keys.append((series_id, r.get("model") or "", len(forecast)))
+
+            if grids:
+                self._insert_grid(run_id, pd.concat(grids, ignore_index=True), grid_keys)
+            if forecasts:
+                self._insert_forecast(run_id, pd.concat(forecasts, ignore_index=True), forecast_keys)
+
+    def _insert_grid(self, run_id, grid, keys):
+        series_ids, periods, lengths = zip(*keys)
+        n = len(grid)
+        run = [run_id] * n
+        series_ids = np.repeat(series_ids, lengths).tolist()
+        periods = [p for p, k in zip(periods, lengths) for _ in range(k)]
+        models = grid["Modèle"].astype(str).tolist()
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO parameters VALUES (?, ?, ?, ?, ?, ?, ?)",
+            zip(run, series_ids, models, _column(grid, "alpha"), _column(grid, "beta"),
+                _column(grid, "gamma"), periods)
+        )
+        for metric in METRICS:
+            if metric in grid:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?, ?)",
+                    zip(run, series_ids, models, [metric] * n, _column(grid, metric))
+                )
+
+    def _insert_forecast(self, run_id, forecast, keys):
+        series_ids, models, lengths = zip(*keys)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO forecasts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            zip(
+                [run_id] * len(forecast),
+                np.repeat(series_ids, lengths).tolist(),
+                [m for m, k in zip(models, lengths) for _ in range(k)],
+                [h for k in lengths for h in range(1, k + 1)],
+                _date_column(forecast, "Date"),
+                _column(forecast, "Prévision"),
+                _column(forecast, "Borne inférieure (95%)"),
+                _column(forecast, "Borne supérieure (95%)")
+            )
+        )
+
+    # --------------------------------------------------------
+    # 2. Requêtes d'historique
+    # --------------------------------------------------------
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def runs(self, limit=30):
+        return self._query(
+            """
+            SELECT r.run_id, r.created_at, r.source, COUNT(DISTINCT m.series_id) AS n_series
+            FROM runs r LEFT JOIN metrics m ON m.run_id = r.run_id
+            GROUP BY r.run_id ORDER BY r.run_id DESC LIMIT ?
+            """,
+            (limit,)
+        )
+
+    def best_model_per_series(self, metric="AICc", last_runs=30):
+        """
+        Meilleur modèle (plus petite valeur de metric) de chaque série
+        sur les last_runs derniers runs.
+        MIN() agrégé par série (SQLite renvoie les colonnes de la ligne du
+        minimum) : un seul parcours de l'index (metric, series_id, run_id, value).
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Métrique inconnue : {metric}")
+        df = self._query(
+            """
+            WITH best AS (
+                SELECT m.series_id, m.model, MIN(m.value) AS valeur, m.run_id
+                FROM metrics m
+                WHERE m.metric = ? AND m.value IS NOT NULL
+                  AND m.run_id >= (SELECT MIN(run_id) FROM
+                                   (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?))
+                GROUP BY m.series_id
+            )
+            SELECT s.name AS serie, s.fingerprint AS empreinte, b.model AS modele, b.valeur,
+                   p.alpha, p.beta, p.gamma,
+                   p.seasonal_periods AS periode, b.run_id, r.created_at
+            FROM best b
+            JOIN series s ON s.series_id = b.series_id
+            JOIN runs r ON r.run_id = b.run_id
+            LEFT JOIN parameters p
+                   ON p.run_id = b.run_id AND p.series_id = b.series_id AND p.model = b.model
+            """,
+            (metric, last_runs)
+        )
+        # Une ligne par série (nom + empreinte) : deux fichiers dont la colonne
+        # porte le même nom, ou deux versions des données, restent distincts
+        df = df.sort_values(["serie", "valeur"]).drop_duplicates(["serie", "empreinte"])
+        return df.rename(columns={"valeur": metric}).reset_index(drop=True)
+
+    def forecasts(self, name, run_id=None, fingerprint=None):
+        """
+        Prévisions enregistrées d'une série (dernier run par défaut).
+        fingerprint : restreint à une version des données (même nom, autre fichier).
+        """
+        where = "s.name = ?" + (" AND s.fingerprint = ?" if fingerprint is not None else "")
+        args = (name,) if fingerprint is None else (name, fingerprint)
+        if run_id is None:
+            with self._lock:
+                run_id = self.conn.execute(
+                    f"""
+                    SELECT MAX(f.run_id) FROM forecasts f
+                    JOIN series s ON s.series_id = f.series_id WHERE {where}
+                    """,
+                    args
+                ).fetchone()[0]
+        return self._query(
+            f"""
+            SELECT f.run_id, f.model AS modele, f.horizon, f.date, f.forecast AS prevision,
+                   f.lower AS borne_inf, f.upper AS borne_sup
+            FROM forecasts f JOIN series s ON s.series_id = f.series_id
+            WHERE {where} AND f.run_id = ?
+            ORDER BY f.horizon
+            """,
+            args + (run_id,)
+        )
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_run_store(path=DEFAULT_PATH):
+    """
+    Instance partagée par processus (une connexion par fichier).
+    """
+    key = os.path.abspath(path)
+    with _STORES_LOCK:
+        if key not in _STORES:
+            _STORES[key] = RunStore(path)
+        return _STORES[key]
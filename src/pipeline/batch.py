@@ -0,0 +1,318 @@
+import json
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from src.data.fingerprint import series_fingerprint
+from src.data.loader import load_time_series
+from src.exploration.spectral import detect_seasonal_period
+from src.exploration.test_saison import test_additive_vs_multiplicative
+from src.models.bootstrap import bootstrap_forecast
+from src.models.grid_search import grid_search_smoothing
+from src.models.smoothing_manual import MODEL_SPECS, smoothing_fit_forecast
+from src.monitoring.timing import timed
+from src.output.columnar_export import available_formats, stack_results, write_table
+from src.output.run_store import RunStore
+
+# Chaîne complète sans interface : import → nettoyage → période → grid search
+# → prévision avec IC bootstrap → export. Aucun import Streamlit / matplotlib.
+
+DEFAULT_CONFIG = {
+    "date_col": None,              # None : première colonne
+    "value_col": None,             # None : deuxième colonne
+    "horizon": 6,
+    "period": None,                # None : détection automatique (périodogramme)
+    "models": list(MODEL_SPECS),
+    "auto_seasonal_nature": True,  # garde HW additif OU multiplicatif selon le test σ = a·x̄ + b
+    "alphas": [round(x, 1) for x in np.linspace(0.1, 0.9, 9)],
+    "betas": [round(x, 1) for x in np.linspace(0.1, 0.9, 9)],
+    "gammas": [round(x, 1) for x in np.linspace(0.1, 0.9, 9)],
+    "criterion": "AICc",
+    "engine": "statsmodels",       # native : moteur sans statsmodels (benchmarks/parity.py)
+    "bootstrap": 300,
+    "seed": 0,
+    "freq": None,                  # None : fréquence inférée, sinon "MS"
+    "output_dir": os.path.join("output", "batch"),
+    "output_format": "csv",        # csv : un dossier par série ; parquet / feather : tables panel
+    "float32": False,              # tables panel en float32
+    "run_store": None              # chemin SQLite : historique des runs (voir RunStore)
+}
+
+INPUT_EXTENSIONS = (".csv", ".xlsx", ".xls")
+
+
+# --------------------------------------------------------
+# 1. Configuration et fichiers d'entrée
+# --------------------------------------------------------
+
+def load_config(path=None, **overrides):
+    """
+    Configuration par défaut, complétée par un fichier JSON puis par overrides
+    (les valeurs None des overrides sont ignorées).
+    """
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            config.update(json.load(f))
+    config.update({k: v for k, v in overrides.items() if v is not None})
+    return config
+
+
+def collect_files(paths):
+    """
+    Liste des fichiers à traiter : fichiers donnés + contenu des dossiers.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(
+                    os.path.join(root, name) for name in sorted(names)
+                    if name.lower().endswith(INPUT_EXTENSIONS)
+                )
+        else:
+            files.append(path)
+    return files
+
+
+def _output_names(files):
+    """
+    Nom de sortie unique par fichier (nom sans extension, suffixé si doublon).
+    """
+    names, seen = [], {}
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        names.append(stem if seen[stem] == 1 else f"{stem}_{seen[stem]}")
+    return names
+
+
+# --------------------------------------------------------
+# 2. Traitement d'une série
+# --------------------------------------------------------
+
+def _select_models(series, period, config):
+    """
+    Modèles candidats : sans période (ou moins de 2 cycles) pas de Holt-Winters ;
+    HW multiplicatif seulement pour une série strictement positive.
+    """
+    models = list(config["models"])
+    seasonal = [m for m in models if MODEL_SPECS[m]["seasonal"]]
+
+    if period is None or len(series) < 2 * period:
+        return [m for m in models if m not in seasonal]
+
+    if (series <= 0).any():
+        models = [m for m in models if MODEL_SPECS[m]["seasonal"] != "mul"]
+    elif config["auto_seasonal_nature"] and len(seasonal) > 1:
+        nature = test_additive_vs_multiplicative(series, period)["nature"]
+        drop = "add" if nature.startswith("Multiplicatif") else "mul"
+        models = [m for m in models if MODEL_SPECS[m]["seasonal"] != drop]
+
+    return models
+
+
+def _none_if_nan(x):
+    return None if x is None or pd.isna(x) else float(x)
+
+
+@timed("batch.serie")
+def forecast_series(series, config):
+    """
+    Période, grid search et prévision avec IC bootstrap pour une série.
+    Retourne (résumé, tableau du grid search, tableau des prévisions).
+    """
+    if len(series) < 5:
+        raise ValueError(f"Série trop courte ({len(series)} observations).")
+
+    period = config["period"] or detect_seasonal_period(series)
+    models = _select_models(series, period, config)
+
+    grid = grid_search_smoothing(
+        series,
+        seasonal_periods=period or 1,
+        models=models,
+        alphas=config["alphas"],
+        betas=config["betas"],
+        gammas=config["gammas"],
+        engine=config.get("engine", "statsmodels")
+    )
+    if grid.empty:
+        raise ValueError("Aucun modèle n'a pu être ajusté.")
+
+    best = grid.sort_values(config["criterion"]).iloc[0]
+    params = {
+        "model": best["Modèle"],
+        "alpha": _none_if_nan(best["alpha"]),
+        "beta": _none_if_nan(best["beta"]),
+        "gamma": _none_if_nan(best["gamma"]),
+        "seasonal_periods": period or 1,
+        "engine": config.get("engine", "statsmodels")
+    }
+
+    np.random.seed(config["seed"])
+    forecast, lower, upper = bootstrap_forecast(
+        series,
+        partial(smoothing_fit_forecast, **params),
+        config["horizon"],
+        B=config["bootstrap"]
+    )
+
+    freq = config["freq"] or pd.infer_freq(series.index) or "MS"
+    future_dates = pd.date_range(series.index[-1], periods=config["horizon"] + 1, freq=freq)[1:]
+
+    df_forecast = pd.DataFrame({
+        "Date": future_dates,
+        "Prévision": forecast,
+        "Borne inférieure (95%)": lower,
+        "Borne supérieure (95%)": upper
+    })
+
+    summary = {
+        "n_obs": len(series),
+        "periode": period,
+        "modele": params["model"],
+        "alpha": params["alpha"],
+        "beta": params["beta"],
+        "gamma": params["gamma"],
+        config["criterion"]: float(best[config["criterion"]])
+    }
+    return summary, grid, df_forecast
+
+
+def process_file(path, config, name=None, return_tables=False):
+    """
+    Traite un fichier et écrit ses résultats dans output_dir/<name>/.
+    Les erreurs sont rapportées dans le résumé (statut "erreur")
+    pour ne pas interrompre le lot.
+    return_tables=True : retourne (résumé, grid, prévisions) pour l'export
+    panel et l'historique ; les CSV par série ne sont écrits qu'au format csv.
+    """
+    name = name or os.path.splitext(os.path.basename(path))[0]
+    summary = {"fichier": path, "serie": name}
+    grid = df_forecast = None
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            series = load_time_series(path, config["date_col"], config["value_col"])
+            result, grid, df_forecast = forecast_series(series, config)
+
+        summary.update(result)
+        summary["empreinte"] = series_fingerprint(series)
+        summary["statut"] = "ok"
+
+        if config["output_format"] == "csv":
+            out_dir = os.path.join(config["output_dir"], name)
+            os.makedirs(out_dir, exist_ok=True)
+            grid.to_csv(os.path.join(out_dir, "grid_search.csv"), index=False)
+            df_forecast.to_csv(os.path.join(out_dir, "previsions.csv"), index=False)
+
+    except Exception as e:
+        summary.update({"statut": "erreur", "erreur": str(e)})
+
+    return (summary, grid, df_forecast) if return_tables else summary
+
+
+def _write_panel(tables, config):
+    """
+    Tables panel (toutes les séries) en Parquet / Feather, une série par bloc.
+    """
+    ext = "." + config["output_format"]
+    for table_name, per_series in tables.items():
+        write_table(
+            stack_results(per_series),
+            os.path.join(config["output_dir"], table_name + ext),
+            fmt=config["output_format"],
+            series_col="serie",
+            float32=config["float32"]
+        )
+
+
+def _record_run(path, summaries, tables, config):
+    """
+    Enregistre le lot dans l'historique SQLite (une transaction).
+    """
+    with RunStore(path) as store:
+        run_id = store.start_run("batch", config)
+        store.add_batch(run_id, [
+            {
+                "name": s["serie"],
+                "fingerprint": s["empreinte"],
+                "n_obs": s["n_obs"],
+                "seasonal_periods": s["periode"],
+                "model": s["modele"],
+                "grid": tables["grid_search"][s["serie"]],
+                "forecast": tables["previsions"][s["serie"]]
+            }
+            for s in summaries if s["statut"] == "ok"
+        ])
+
+
+# --------------------------------------------------------
+# 3. Traitement par lot (pool de workers)
+# --------------------------------------------------------
+
+def check_output_format(fmt):
+    """
+    Vérifie avant tout calcul que le format de sortie est utilisable ici
+    (Parquet / Feather : pyarrow installé).
+    """
+    formats = available_formats()
+    if fmt not in formats:
+        raise ValueError(
+            f"Format de sortie « {fmt} » indisponible (formats utilisables : {', '.join(formats)}) ; "
+            "Parquet / Feather nécessitent le paquet « pyarrow »."
+        )
+
+
+def run_batch(paths, config, workers=1, progress=None):
+    """
+    Traite tous les fichiers (en parallèle si workers > 1) et écrit
+    output_dir/resume.csv. progress(i, total, resume) est appelé après
+    chaque fichier.
+    """
+    check_output_format(config["output_format"])
+    files = collect_files(paths)
+    names = _output_names(files)
+    os.makedirs(config["output_dir"], exist_ok=True)
+    panel = config["output_format"] != "csv"
+    store = config.get("run_store")
+    args = (files, [config] * len(files), names, [panel or bool(store)] * len(files))
+
+    summaries = []
+    tables = {"grid_search": {}, "previsions": {}}
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(process_file, *args)
+    else:
+        pool = None
+        results = map(process_file, *args)
+
+    try:
+        for i, result in enumerate(results, 1):
+            if panel or store:
+                result, grid, df_forecast = result
+                if result["statut"] == "ok":
+                    tables["grid_search"][result["serie"]] = grid
+                    tables["previsions"][result["serie"]] = df_forecast
+            summaries.append(result)
+            if progress:
+                progress(i, len(files), result)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Résumé écrit en premier : il reste disponible si l'export panel échoue
+    df_summary = pd.DataFrame(summaries)
+    df_summary.to_csv(os.path.join(config["output_dir"], "resume.csv"), index=False)
+
+    if panel:
+        _write_panel(tables, config)
+    if store:
+        _record_run(store, summaries, tables, config)
+    return df_summary
@@ -0,0 +1,262 @@
+import argparse
+import json
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.data.fingerprint import params_fingerprint
+from src.service.tasks import TASKS, ping, run_batch, warm_worker
+
+# Service HTTP/JSON local : prévision, grid search et stationnarité
+# exécutés par un pool de processus préchauffés (imports déjà faits).
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+MAX_BODY = 50 * 1024 * 1024
+
+
+# --------------------------------------------------------
+# 1. Cache des résultats (LRU, clé = empreinte de la requête)
+# --------------------------------------------------------
+
+class ResultCache:
+    """
+    Cache LRU thread-safe. Les requêtes identiques en cours de calcul
+    partagent le même Future (pas de double calcul).
+    """
+
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_submit(self, key, submit):
+        with self._lock:
+            future = self._items.get(key)
+            if future is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return future
+            self.misses += 1
+            future = submit()
+            self._items[key] = future
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+        # Les erreurs ne sont pas mises en cache
+        future.add_done_callback(lambda f: f.exception() and self._discard(key, f))
+        return future
+
+    def _discard(self, key, future):
+        with self._lock:
+            if self._items.get(key) is future:
+                del self._items[key]
+
+    def stats(self):
+        with self._lock:
+            return {"entrees": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+# --------------------------------------------------------
+# 2. Regroupement des requêtes concurrentes (micro-lots)
+# --------------------------------------------------------
+
+class MicroBatcher:
+    """
+    Les requêtes arrivant dans une même fenêtre (batch_window secondes)
+    sont envoyées aux workers par lots : un aller-retour inter-processus
+    pour plusieurs requêtes, lots répartis sur tous les workers.
+    """
+
+    def __init__(self, pool, workers, batch_window=0.005, max_batch=16):
+        self.pool = pool
+        self.workers = workers
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, route, payload):
+        future = Future()
+        self._queue.put((route, payload, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            items = [item]
+            try:
+                while len(items) < self.max_batch * self.workers:
+                    nxt = self._queue.get(timeout=self.batch_window)
+                    if nxt is None:
+                        self._queue.put(None)
+                        break
+                    items.append(nxt)
+            except queue.Empty:
+                pass
+            self._dispatch(items)
+
+    def _dispatch(self, items):
+        # Répartition en lots équilibrés sur les workers
+        n_chunks = min(self.workers, len(items))
+        for chunk in (items[i::n_chunks] for i in range(n_chunks)):
+            try:
+                pending = self.pool.submit(run_batch, [(route, payload) for route, payload, _ in chunk])
+            except Exception as e:
+                for _, _, future in chunk:
+                    future.set_exception(e)
+                continue
+            pending.add_done_callback(lambda f, chunk=chunk: self._resolve(f, chunk))
+
+    @staticmethod
+    def _resolve(pending, chunk):
+        try:
+            results = pending.result()
+        except Exception as e:
+            for _, _, future in chunk:
+                future.set_exception(e)
+            return
+        for (_, _, future), (ok, result) in zip(chunk, results):
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(ValueError(result))
+
+
+# --------------------------------------------------------
+# 3. Service (pool préchauffé + lots + cache)
+# --------------------------------------------------------
+
+class ForecastService:
+
+    def __init__(self, workers=2, cache_size=256, batch_window=0.005):
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_worker)
+        # Démarre tous les workers maintenant (le pool les crée à la demande)
+        for f in [self.pool.submit(ping) for _ in range(workers)]:
+            f.result()
+        self.batcher = MicroBatcher(self.pool, workers, batch_window=batch_window)
+        self.cache = ResultCache(cache_size)
+
+    def call(self, route, payload, timeout=None):
+        if route not in TASKS:
+            raise KeyError(route)
+        key = params_fingerprint(route, payload)
+        future = self.cache.get_or_submit(key, lambda: self.batcher.submit(route, payload))
+        return future.result(timeout=timeout)
+
+    def health(self):
+        return {"statut": "ok", "workers": self.workers, "cache": self.cache.stats()}
+
+    def close(self):
+        self.batcher.close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+# --------------------------------------------------------
+# 4. Serveur HTTP
+# --------------------------------------------------------
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health
+    POST /forecast, /grid-search, /stationarity  (corps JSON, voir README)
+    """
+
+    server_version = "AnalService/1.0"
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._send(200, self.server.service.health())
+        else:
+            self._send(404, {"erreur": f"Route inconnue : {self.path}"})
+
+    def do_POST(self):
+        route = self.path.rstrip("/")
+        if route not in TASKS:
+            self._send(404, {"erreur": f"Route inconnue : {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > MAX_BODY:
+                self._send(413, {"erreur": "Requête trop volumineuse."})
+                return
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict) or "values" not in payload:
+                raise ValueError("Le corps doit contenir « values ».")
+        except ValueError as e:
+            self._send(400, {"erreur": f"JSON invalide : {e}"})
+            return
+
+        try:
+            result = self.server.service.call(route, payload, timeout=self.server.timeout_s)
+        except TimeoutError:
+            self._send(504, {"erreur": "Délai de calcul dépassé."})
+        except ValueError as e:
+            self._send(422, {"erreur": str(e)})
+        except Exception as e:
+            self._send(500, {"erreur": f"{type(e).__name__}: {e}"})
+        else:
+            self._send(200, result)
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=2, cache_size=256,
+                  timeout=300, quiet=False):
+    """
+    Crée le serveur HTTP et son service (workers démarrés et préchauffés).
+    """
+    httpd = ThreadingHTTPServer((host, port), ServiceHandler)
+    httpd.daemon_threads = True
+    httpd.service = ForecastService(workers=workers, cache_size=cache_size)
+    httpd.timeout_s = timeout
+    httpd.quiet = quiet
+    return httpd
+
+
+def main(argv=None):
+    """
+    python -m src.service [--host] [--port] [--workers]
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.service", description="Service HTTP/JSON de prévision.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=2, help="Processus préchauffés (défaut : 2)")
+    parser.add_argument("--cache-size", dest="cache_size", type=int, default=256, help="Résultats gardés en cache")
+    parser.add_argument("--timeout", type=float, default=300, help="Délai max d'une requête (s)")
+    parser.add_argument("--quiet", action="store_true", help="Pas de journal des requêtes")
+    args = parser.parse_args(argv)
+
+    httpd = create_server(args.host, args.port, args.workers, args.cache_size, args.timeout, args.quiet)
+    print(f"✅ Service prêt sur http://{args.host}:{args.port} ({args.workers} workers)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        httpd.service.close()
+    return 0
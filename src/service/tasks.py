@@ -0,0 +1,124 @@
+import math
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Tâches exécutées dans les workers du service HTTP.
+# Les fonctions sont au niveau module pour être transmises aux processus.
+
+# --------------------------------------------------------
+# 1. Préchauffage des workers
+# --------------------------------------------------------
+
+def warm_worker():
+    """
+    Initialiseur des workers : charge une fois pour toutes les modules lourds
+    (statsmodels, scipy) pour que les requêtes ne paient pas leur import.
+    """
+    warnings.simplefilter("ignore")
+    import statsmodels.tsa.holtwinters  # noqa: F401
+    import statsmodels.tsa.stattools  # noqa: F401
+    import src.pipeline.batch  # noqa: F401
+
+
+def ping():
+    return "pong"
+
+
+# --------------------------------------------------------
+# 2. Conversions JSON
+# --------------------------------------------------------
+
+def series_from_payload(payload):
+    """
+    {"values": [...], "dates": [...] (optionnel)} → pd.Series.
+    """
+    values = pd.Series(payload["values"], dtype=float)
+    if payload.get("dates"):
+        values.index = pd.to_datetime(payload["dates"])
+    else:
+        values.index = pd.date_range("2000-01-01", periods=len(values), freq="MS")
+    return values.dropna()
+
+
+def to_jsonable(obj):
+    """
+    Convertit récursivement numpy / pandas / NaN en types JSON standards.
+    """
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(v) for v in obj]
+    if isinstance(obj, pd.DataFrame):
+        return to_jsonable(obj.to_dict(orient="records"))
+    if isinstance(obj, (pd.Series, np.ndarray)):
+        return to_jsonable(list(obj))
+    if isinstance(obj, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(obj).isoformat()
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+# --------------------------------------------------------
+# 3. Tâches exposées
+# --------------------------------------------------------
+
+def run_forecast(payload):
+    """
+    Chaîne complète (période, grid search, prévision + IC bootstrap).
+    payload["config"] surcharge la configuration du traitement par lot.
+    """
+    from src.pipeline.batch import forecast_series, load_config
+
+    config = load_config(None, **payload.get("config", {}))
+    summary, grid, df_forecast = forecast_series(series_from_payload(payload), config)
+    return {"resume": summary, "grid_search": grid, "previsions": df_forecast}
+
+
+def run_grid_search(payload):
+    from src.models.grid_search import DEFAULT_GRID, grid_search_smoothing
+    from src.models.smoothing_manual import MODEL_SPECS
+
+    grid = grid_search_smoothing(
+        series_from_payload(payload),
+        seasonal_periods=payload.get("seasonal_periods", 4),
+        models=payload.get("models", list(MODEL_SPECS)),
+        alphas=payload.get("alphas", DEFAULT_GRID),
+        betas=payload.get("betas", DEFAULT_GRID),
+        gammas=payload.get("gammas", DEFAULT_GRID)
+    )
+    return {"grid_search": grid}
+
+
+def run_stationarity(payload):
+    from src.exploration.stationarity import adf_test, kpss_test
+
+    series = series_from_payload(payload)
+    return {"adf": adf_test(series), "kpss": kpss_test(series)}
+
+
+TASKS = {
+    "/forecast": run_forecast,
+    "/grid-search": run_grid_search,
+    "/stationarity": run_stationarity
+}
+
+
+def run_batch(items):
+    """
+    Exécute un lot de requêtes [(route, payload), ...] dans un seul aller-retour
+    vers le worker. Retourne [(ok, résultat ou message d'erreur), ...].
+    """
+    results = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for route, payload in items:
+            try:
+                results.append((True, to_jsonable(TASKS[route](payload))))
+            except Exception as e:
+                results.append((False, f"{type(e).__name__}: {e}"))
+    return results
@@ -0,0 +1,225 @@
+import numpy as np
+import pandas as pd
+
+# Réduction du nombre de points tracés à la résolution de l'écran :
+# - min-max : min et max de chaque colonne de pixels (pics conservés exactement),
+# - LTTB (Largest Triangle Three Buckets) : forme visuelle, 1 point par bucket.
+# Les séries courtes (ou une fenêtre de zoom étroite) sont tracées en pleine résolution.
+
+DEFAULT_METHOD = "minmax"
+
+
+# --------------------------------------------------------
+# 0. Outils internes
+# --------------------------------------------------------
+
+def _as_numeric(x):
+    """
+    Abscisses → float64 (dates en nanosecondes) pour les calculs de surface.
+    Dates avec fuseau : instants UTC (np.asarray les rendrait en objets).
+    """
+    if isinstance(getattr(x, "dtype", None), pd.DatetimeTZDtype):
+        return pd.DatetimeIndex(x).tz_convert(None).asi8.astype(float)
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def _xy(x, y):
+    """
+    (Series) ou (x, y) → (x, y) indexables par tableau d'indices.
+    """
+    if y is None:
+        if isinstance(x, pd.Series):
+            return x.index, x.to_numpy(dtype=float)
+        y = np.asarray(x, dtype=float)
+        return np.arange(len(y)), y
+    if isinstance(y, pd.Series):
+        y = y.to_numpy(dtype=float)
+    if not isinstance(x, pd.Index):
+        x = np.asarray(x)
+    return x, np.asarray(y, dtype=float)
+
+
+def screen_points(ax):
+    """
+    Largeur de l'axe en pixels (une colonne de pixels = un bucket).
+    """
+    fig = ax.figure
+    width = ax.get_position().width * fig.get_figwidth() * fig.dpi
+    return max(int(width), 100)
+
+
+# --------------------------------------------------------
+# 1. Algorithmes (indices des points conservés)
+# --------------------------------------------------------
+
+def minmax_indices(y, n_bins):
+    """
+    Indices du min et du max de chaque bin (ordre chronologique), plus le
+    premier et le dernier point. Un bin entièrement NaN garde un NaN
+    (la coupure de la courbe reste visible).
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= 2 * n_bins:
+        return np.arange(n)
+
+    size = int(np.ceil(n / n_bins))
+    n_rows = int(np.ceil(n / size))
+    padded = np.full(n_rows * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_rows, size)
+
+    nan = np.isnan(blocks)
+    all_nan = nan.all(axis=1)
+    lo = np.where(nan, np.inf, blocks).argmin(axis=1)
+    hi = np.where(nan, -np.inf, blocks).argmax(axis=1)
+    # Bin entièrement NaN : premier point du bin (NaN)
+    lo[all_nan] = 0
+    hi[all_nan] = 0
+
+    starts = np.arange(n_rows) * size
+    idx = np.concatenate([[0, n - 1], starts + lo, starts + hi])
+    return np.unique(np.minimum(idx, n - 1))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest Triangle Three Buckets (Steinarsson, 2013) : dans chaque bucket,
+    le point formant le plus grand triangle avec le point retenu précédent
+    et la moyenne du bucket suivant. Les NaN sont ignorés.
+    """
+    x = _as_numeric(x)
+    y = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n_out >= n or n_out < 3:
+        return valid
+
+    xv, yv = x[valid], y[valid]
+    cx = np.concatenate([[0.0], np.cumsum(xv)])
+    cy = np.concatenate([[0.0], np.cumsum(yv)])
+
+    # n_out - 2 buckets entre le premier et le dernier point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (cx[nhi] - cx[nlo]) / (nhi - nlo)
+        avg_y = (cy[nhi] - cy[nlo]) / (nhi - nlo)
+
+        area = np.abs(
+            (xv[a] - avg_x) * (yv[lo:hi] - yv[a])
+            - (xv[a] - xv[lo:hi]) * (avg_y - yv[a])
+        )
+        a = lo + int(np.argmax(area)) if hi > lo else a
+        out[i + 1] = a
+
+    return valid[np.unique(out)]
+
+
+def downsample_indices(x, y, n_points, method=DEFAULT_METHOD):
+    """
+    Indices conservés pour n_points de largeur (min-max : 2 points par bin).
+    """
+    if method == "minmax":
+        return minmax_indices(y, n_points)
+    if method == "lttb":
+        return lttb_indices(x, y, n_points)
+    raise ValueError(f"Méthode inconnue : {method}")
+
+
+# --------------------------------------------------------
+# 2. Séries
+# --------------------------------------------------------
+
+def _window(x, y, xlim):
+    """
+    Restreint (x, y) à la fenêtre de zoom xlim = (début, fin), bornes incluses,
+    avec un point de part et d'autre pour que la courbe touche les bords.
+    """
+    if xlim is None:
+        return x, y
+    xs = _as_numeric(x)
+    tz = getattr(getattr(x, "dtype", None), "tz", None)
+    if tz is not None:
+        # Bornes sans fuseau : lues dans le fuseau de l'index
+        bounds = [pd.Timestamp(v) for v in xlim]
+        bounds = [b.tz_localize(tz) if b.tzinfo is None else b for b in bounds]
+        lo_val, hi_val = _as_numeric(pd.DatetimeIndex(bounds).tz_convert(tz))
+    else:
+        is_date = np.issubdtype(np.asarray(x).dtype, np.datetime64)
+        bounds = [pd.Timestamp(v).to_datetime64() for v in xlim] if is_date else list(xlim)
+        lo_val, hi_val = _as_numeric(np.array(bounds))
+    lo = max(int(np.searchsorted(xs, lo_val, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(xs, hi_val, side="right")) + 1, len(xs))
+    return x[lo:hi], y[lo:hi]
+
+
+def downsample_series(series, n_points=2000, method=DEFAULT_METHOD, xlim=None):
+    """
+    Series réduite (même index, points conservés) ; inchangée si déjà courte.
+    """
+    x, y = series.index, series.to_numpy(dtype=float)
+    x, y = _window(x, y, xlim)
+    idx = downsample_indices(x, y, n_points, method)
+    if len(idx) == len(y):
+        return series.loc[x[0]:x[-1]] if xlim is not None and len(x) else series
+    return pd.Series(y[idx], index=x[idx], name=series.name)
+
+
+# --------------------------------------------------------
+# 3. Tracés matplotlib
+# --------------------------------------------------------
+
+def plot_series(ax, x, y=None, *args, method=DEFAULT_METHOD, max_points=None, xlim=None, **kwargs):
+    """
+    ax.plot avec réduction à la résolution de l'axe.
+    plot_series(ax, serie) ou plot_series(ax, x, y, ...), mêmes options que ax.plot.
+    xlim : fenêtre de zoom ; seuls les points visibles sont réduits, donc
+    une fenêtre étroite est tracée en pleine résolution.
+    """
+    x, y = _xy(x, y)
+    x, y = _window(x, y, xlim)
+    n_points = max_points or screen_points(ax)
+    idx = downsample_indices(x, y, n_points, method)
+
+    if len(idx) < len(y):
+        x, y = x[idx], y[idx]
+        # Trop de points pour des marqueurs lisibles
+        if len(idx) > n_points // 2:
+            kwargs.pop("marker", None)
+
+    lines = ax.plot(x, y, *args, **kwargs)
+    if xlim is not None:
+        ax.set_xlim(*xlim)
+    return lines
+
+
+def fill_between_series(ax, x, lower, upper, max_points=None, **kwargs):
+    """
+    Bande (intervalle, écart-type glissant) réduite en enveloppe :
+    min de la borne basse et max de la borne haute par bin.
+    """
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    n_points = max_points or screen_points(ax)
+    n = len(lower)
+
+    if n <= 2 * n_points:
+        return ax.fill_between(x, lower, upper, **kwargs)
+
+    size = int(np.ceil(n / n_points))
+    starts = np.arange(0, n, size)
+    with np.errstate(invalid="ignore"):
+        lo = np.fmin.reduceat(lower, starts)
+        hi = np.fmax.reduceat(upper, starts)
+    xs = np.asarray(x)[starts]
+    return ax.fill_between(xs, lo, hi, step="post", **kwargs)
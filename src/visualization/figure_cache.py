@@ -0,0 +1,145 @@
+import io
+import threading
+from collections import OrderedDict
+
+from src.data.fingerprint import params_fingerprint, series_fingerprint
+from src.monitoring.timing import timed
+
+# Cache des figures rendues (PNG), partagé par le processus Streamlit.
+# Clé : (empreinte de la série, type de graphique, empreinte des paramètres).
+# Mémoire bornée en octets : les images les moins récemment servies sont évincées.
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DPI = 100
+
+
+def figure_key(data, plot_type, **params):
+    """
+    Clé d'une figure. data : série (empreinte calculée) ou empreinte déjà connue.
+    """
+    fingerprint = data if isinstance(data, str) else series_fingerprint(data)
+    return fingerprint, plot_type, params_fingerprint(params)
+
+
+def subplots(*args, figsize=None, **kwargs):
+    """
+    Comme plt.subplots, sans pyplot : la Figure n'est pas enregistrée dans
+    l'état global (rien à fermer, utilisable depuis n'importe quel thread)
+    et matplotlib n'est importé qu'au premier tracé.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(*args, **kwargs)
+
+
+def figure_to_png(fig, dpi=DEFAULT_DPI):
+    """
+    Rend la figure en PNG ; une figure créée par pyplot est ensuite fermée.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    if getattr(fig.canvas, "manager", None) is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+class FigureCache:
+    """
+    LRU d'images PNG borné en octets (une image plus grosse que la
+    borne n'est pas conservée). Accès protégé par un verrou : Streamlit
+    exécute les sessions dans plusieurs threads.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        with self._lock:
+            png = self._items.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return png
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = png
+            self._size += len(png)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+        return png
+
+    def render(self, key, draw, dpi=DEFAULT_DPI):
+        """
+        PNG de la figure : servi depuis le cache, sinon draw() est appelé
+        (calculs et tracé compris) et le résultat est conservé.
+        """
+        png = self.get(key)
+        if png is None:
+            with timed(f"trace.{key[1]}"):
+                png = self.put(key, figure_to_png(draw(), dpi=dpi))
+        return png
+
+    def invalidate(self, fingerprint=None):
+        """
+        Supprime les images d'une série (toutes si fingerprint est None).
+        """
+        with self._lock:
+            keys = [k for k in self._items if fingerprint is None or k[0] == fingerprint]
+            for k in keys:
+                self._size -= len(self._items.pop(k))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "images": len(self._items),
+                "octets": self._size,
+                "max_octets": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_figure_cache(max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Instance partagée par processus.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = FigureCache(max_bytes)
+        return _CACHE
+
+
+def cached_figure(data, plot_type, draw, params=None, cache=None, dpi=DEFAULT_DPI):
+    """
+    Raccourci pour les pages : PNG de draw() pour (série, type, paramètres).
+    """
+    if cache is None:
+        cache = get_figure_cache()
+    return cache.render(figure_key(data, plot_type, **(params or {})), draw, dpi=dpi)
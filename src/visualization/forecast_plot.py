@@ -1,30 +1,44 @@
-import matplotlib.pyplot as plt
 import pandas as pd
 
-def plot_forecast(series, forecast, title="Prévision"):
+from src.monitoring.timing import timed
+from src.visualization.downsample import plot_series
+
+
+@timed("trace.prevision")
+def plot_forecast(series, forecast, title="Prévision", ax=None, lower=None, upper=None, freq="30D"):
     """
-    Affiche la série historique + les prévisions alignées.
+    Série historique + prévisions alignées (bornes de l'intervalle si fournies).
+    forecast : Series indexée par les dates futures, sinon dates régulières
+    après la dernière observation (pas freq). Retourne la Figure.
     """
+    from matplotlib.figure import Figure
 
     series = series.copy()
     series.index = pd.to_datetime(series.index)   # << FIX CRITIQUE
 
-    plt.figure(figsize=(12, 5))
+    fig = ax.figure if ax is not None else Figure(figsize=(12, 5))
+    ax = ax if ax is not None else fig.subplots()
 
     # Série historique
-    plt.plot(series.index, series.values, label="Historique", linewidth=2)
+    plot_series(ax, series, label="Historique", linewidth=2)
 
     # Construire des dates futures régulières
-    last_date = series.index[-1]
-    future_dates = pd.date_range(start=last_date, periods=len(forecast)+1, freq="30D")[1:]
+    if isinstance(forecast, pd.Series) and isinstance(forecast.index, pd.DatetimeIndex):
+        future_dates = forecast.index
+    else:
+        last_date = series.index[-1]
+        future_dates = pd.date_range(start=last_date, periods=len(forecast)+1, freq=freq)[1:]
+    values = forecast.values if isinstance(forecast, pd.Series) else forecast
 
     # Prévision
-    plt.plot(future_dates, forecast.values, label="Prévision", linestyle="--", marker="o", color="orange")
-
-    plt.title(title)
-    plt.xlabel("Date")
-    plt.ylabel("Valeur")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    ax.plot(future_dates, values, label="Prévision", linestyle="--", marker="o", color="orange")
+    if lower is not None and upper is not None:
+        ax.fill_between(future_dates, lower, upper, color="orange", alpha=0.2, label="IC 95%")
+
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Valeur")
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
+    return fig
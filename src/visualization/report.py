@@ -0,0 +1,264 @@
+import argparse
+import base64
+import html
+import io
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+# Rapport de diagnostic multi-séries (PDF ou HTML).
+# Chaque série est traitée par un worker : prévision (chaîne batch), puis
+# figures construites avec l'API objet de matplotlib (Figure + Agg, sans pyplot)
+# et rendues en PNG. Le processus principal assemble les pages dans l'ordre.
+
+REPORT_FORMATS = {".pdf": "pdf", ".html": "html", ".htm": "html"}
+REPORT_DPI = 100
+
+
+# --------------------------------------------------------
+# 1. Figures d'une série (exécuté dans les workers)
+# --------------------------------------------------------
+
+def _png(fig, dpi=REPORT_DPI):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+
+def series_figures(name, series, config):
+    """
+    Figures de diagnostic d'une série : (résumé, [(titre, Figure), ...]).
+    Série, décomposition (si une période est détectée), prévision avec IC
+    et résidus du modèle retenu.
+    """
+    from src.exploration.analysis import plot_series
+    from src.exploration.decomposition import decomposition_additive, plot_decomposition
+    from src.models.model_state import SmoothingState
+    from src.pipeline.batch import forecast_series
+    from src.visualization.forecast_plot import plot_forecast
+    from src.visualization.residual_plots import residual_plot
+
+    summary, _, df_forecast = forecast_series(series, config)
+    period = summary["periode"]
+
+    fig_series = plot_series(series)
+    fig_series.axes[0].set_title(f"{name} — série")
+    figures = [("Série", fig_series)]
+
+    if period and len(series) >= 2 * period:
+        figures.append(("Décomposition additive",
+                        plot_decomposition(series, *decomposition_additive(series, period))))
+
+    forecast = pd.Series(df_forecast["Prévision"].to_numpy(), index=pd.DatetimeIndex(df_forecast["Date"]))
+    figures.append(("Prévision", plot_forecast(
+        series, forecast, title=f"{name} — {summary['modele']}",
+        lower=df_forecast["Borne inférieure (95%)"].to_numpy(),
+        upper=df_forecast["Borne supérieure (95%)"].to_numpy()
+    )))
+
+    state = SmoothingState.fit(series, summary["modele"], summary["alpha"], summary["beta"],
+                               summary["gamma"], period or 1)
+    figures.append(("Résidus", residual_plot(series, state.fitted_values(series), summary["modele"])))
+    return summary, figures
+
+
+def render_series(name, source, config, dpi=REPORT_DPI):
+    """
+    Worker : charge la série (chemin ou Series), construit et rend ses figures.
+    Les erreurs sont rapportées dans le résultat pour ne pas interrompre le rapport.
+    """
+    from src.data.loader import load_time_series
+
+    result = {"serie": name, "statut": "ok", "figures": []}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if isinstance(source, pd.Series):
+                series = source
+            else:
+                series = load_time_series(source, config["date_col"], config["value_col"])
+            summary, figures = series_figures(name, series, config)
+            result["resume"] = summary
+            result["figures"] = [(title, _png(fig, dpi)) for title, fig in figures]
+    except Exception as e:
+        result.update({"statut": "erreur", "erreur": str(e)})
+    return result
+
+
+def _render_many(names, sources, config, dpi, workers, progress):
+    """
+    Rend les séries (pool de processus si workers > 1), dans l'ordre d'entrée.
+    """
+    n = len(names)
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(render_series, names, sources, [config] * n, [dpi] * n)
+    else:
+        pool = None
+        results = map(render_series, names, sources, [config] * n, [dpi] * n)
+
+    try:
+        for i, result in enumerate(results, 1):
+            if progress:
+                progress(i, n, result)
+            yield result
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+# --------------------------------------------------------
+# 2. Assemblage
+# --------------------------------------------------------
+
+def _write_pdf(results, target, dpi):
+    """
+    Une page par figure (image placée à sa taille d'origine) + une page
+    d'erreur par série en échec.
+    """
+    import matplotlib.image as mpimg
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    summaries = []
+    with PdfPages(target) as pdf:
+        for result in results:
+            summaries.append(_summary_row(result))
+            if result["statut"] != "ok":
+                page = Figure(figsize=(8.27, 2))
+                page.text(0.05, 0.5, f"{result['serie']} : {result['erreur']}", va="center", wrap=True)
+                pdf.savefig(page)
+                continue
+            for _, png in result["figures"]:
+                image = mpimg.imread(io.BytesIO(png), format="png")
+                height, width = image.shape[:2]
+                page = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+                page.figimage(image, resize=False)
+                pdf.savefig(page, dpi=dpi)
+
+        info = pdf.infodict()
+        info["Title"] = "Rapport de diagnostic des séries"
+        info["CreationDate"] = datetime.now()
+    return summaries
+
+
+def _write_html(results, target):
+    """
+    Page HTML autonome (images PNG en base64), sommaire en tête.
+    """
+    sections, summaries = [], []
+    for result in results:
+        summaries.append(_summary_row(result))
+        anchor = html.escape(result["serie"], quote=True)
+        title = html.escape(result["serie"])
+        if result["statut"] != "ok":
+            sections.append(f'<section id="{anchor}"><h2>{title}</h2>'
+                            f'<p class="erreur">{html.escape(result["erreur"])}</p></section>')
+            continue
+        images = "\n".join(
+            f'<figure><img alt="{html.escape(t)}" src="data:image/png;base64,'
+            f'{base64.b64encode(png).decode("ascii")}"><figcaption>{html.escape(t)}</figcaption></figure>'
+            for t, png in result["figures"]
+        )
+        sections.append(f'<section id="{anchor}"><h2>{title}</h2>\n{images}</section>')
+
+    df_summary = pd.DataFrame(summaries)
+    toc = "".join(
+        f'<li><a href="#{html.escape(s, quote=True)}">{html.escape(s)}</a></li>' for s in df_summary["serie"]
+    ) if len(df_summary) else ""
+
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(
+            "<!DOCTYPE html><html lang=\"fr\"><head><meta charset=\"utf-8\">"
+            "<title>Rapport de diagnostic des séries</title><style>"
+            "body{font-family:sans-serif;margin:2em}img{max-width:100%}"
+            "figure{margin:1em 0}.erreur{color:#b00}table{border-collapse:collapse}"
+            "td,th{border:1px solid #ccc;padding:2px 6px}</style></head><body>"
+            f"<h1>Rapport de diagnostic des séries</h1><p>Généré le {datetime.now():%Y-%m-%d %H:%M}</p>"
+            f"{df_summary.to_html(index=False, na_rep='') if len(df_summary) else ''}"
+            f"<ul>{toc}</ul>\n"
+        )
+        f.write("\n".join(sections))
+        f.write("</body></html>")
+    return summaries
+
+
+def _summary_row(result):
+    row = {"serie": result["serie"], "statut": result["statut"]}
+    row.update(result.get("resume", {}))
+    if result["statut"] != "ok":
+        row["erreur"] = result["erreur"]
+    return row
+
+
+def build_report(items, target, config=None, workers=1, fmt=None, dpi=REPORT_DPI, progress=None):
+    """
+    Rapport de diagnostic de plusieurs séries.
+
+    items    : {nom : Series ou chemin de fichier}
+    target   : chemin du rapport (.pdf ou .html)
+    config   : configuration de la chaîne batch (load_config)
+    workers  : processus de rendu (les figures sont produites en parallèle,
+               puis assemblées dans l'ordre de items)
+    progress : progress(i, total, résultat) après chaque série
+    Retourne le tableau récapitulatif (modèle, période, critère ou erreur par série).
+    """
+    from src.pipeline.batch import load_config
+
+    config = config or load_config()
+    fmt = fmt or REPORT_FORMATS.get(os.path.splitext(str(target))[1].lower())
+    if fmt not in ("pdf", "html"):
+        raise ValueError(f"Format de rapport inconnu : {target}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    names, sources = list(items), list(items.values())
+    results = _render_many(names, sources, config, dpi, workers, progress)
+
+    summaries = _write_pdf(results, target, dpi) if fmt == "pdf" else _write_html(results, target)
+    return pd.DataFrame(summaries)
+
+
+# --------------------------------------------------------
+# 3. Ligne de commande
+# --------------------------------------------------------
+
+def main(argv=None):
+    """
+    python -m src.visualization.report <fichiers ou dossiers> -o rapport.pdf [--workers N]
+    """
+    from src.pipeline.batch import _output_names, collect_files, load_config
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.visualization.report",
+        description="Rapport de diagnostic (série, décomposition, prévision, résidus) en PDF ou HTML."
+    )
+    parser.add_argument("inputs", nargs="+", help="Fichiers CSV/Excel ou dossiers")
+    parser.add_argument("-o", "--output", default=os.path.join("output", "rapport.pdf"),
+                        help="Rapport à écrire (.pdf ou .html)")
+    parser.add_argument("--config", help="Fichier de configuration JSON (chaîne batch)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Nombre de processus de rendu (défaut : nombre de CPU)")
+    parser.add_argument("--bootstrap", type=int, help="Réplications bootstrap des intervalles")
+    parser.add_argument("--dpi", type=int, default=REPORT_DPI)
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config, bootstrap=args.bootstrap)
+    files = collect_files(args.inputs)
+    items = dict(zip(_output_names(files), files))
+
+    def progress(i, total, result):
+        print(f"[{i}/{total}] {result['serie']} : {result['statut']}")
+
+    df_summary = build_report(items, args.output, config, workers=args.workers, dpi=args.dpi,
+                              progress=progress)
+    n_ok = int((df_summary["statut"] == "ok").sum()) if len(df_summary) else 0
+    print(f"✅ {n_ok}/{len(df_summary)} séries → {args.output}")
+    return 0 if n_ok == len(df_summary) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
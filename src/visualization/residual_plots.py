@@ -1,28 +1,36 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from statsmodels.graphics.tsaplots import plot_acf
 
-def residual_plot(y_true, y_pred, model_name):
-    resid = np.array(y_true) - np.array(y_pred)
+from src.monitoring.timing import timed
+from src.visualization.downsample import plot_series
+
+
+@timed("trace.residus")
+def residual_plot(y_true, y_pred, model_name, fig=None):
+    """
+    Résidus dans le temps, histogramme et ACF côte à côte. Retourne la Figure.
+    """
+    from matplotlib.figure import Figure
+    from statsmodels.graphics.tsaplots import plot_acf
+
+    resid = np.array(y_true, dtype=float) - np.array(y_pred, dtype=float)
+    resid = resid[~np.isnan(resid)]
 
     # 3 graphiques alignés
-    plt.figure(figsize=(14, 4))
+    fig = fig if fig is not None else Figure(figsize=(14, 4))
+    ax_time, ax_hist, ax_acf = fig.subplots(1, 3)
 
     # 1) Série des résidus
-    plt.subplot(1, 3, 1)
-    plt.plot(resid, marker='o')
-    plt.axhline(0, color='red', linestyle='--')
-    plt.title(f"Résidus - {model_name}")
+    plot_series(ax_time, resid, marker='o')
+    ax_time.axhline(0, color='red', linestyle='--')
+    ax_time.set_title(f"Résidus - {model_name}")
 
     # 2) Histogramme
-    plt.subplot(1, 3, 2)
-    plt.hist(resid, bins=8, edgecolor='black')
-    plt.title("Histogramme des résidus")
+    ax_hist.hist(resid, bins=8, edgecolor='black')
+    ax_hist.set_title("Histogramme des résidus")
 
     # 3) ACF des résidus
-    plt.subplot(1, 3, 3)
-    plot_acf(resid, ax=plt.gca(), lags=min(10, len(resid)-1))
-    plt.title("ACF des résidus")
+    plot_acf(resid, ax=ax_acf, lags=min(10, len(resid)-1))
+    ax_acf.set_title("ACF des résidus")
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,161 @@
+import ast
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Préchauffage du serveur Streamlit : les modules importés par les pages
+# (y compris les imports différés dans les fonctions et les branches) sont
+# chargés en arrière-plan dès le démarrage, pour que la première interaction
+# ne paie pas le coût des imports (statsmodels, scipy, sklearn, matplotlib...).
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Chargés par les fonctions d'analyse (src/) plutôt que par les pages elles-mêmes
+ANALYSIS_MODULES = (
+    "statsmodels.tsa.holtwinters",
+    "statsmodels.tsa.stattools",
+    "statsmodels.graphics.tsaplots",
+    "statsmodels.stats.diagnostic",
+    "scipy.special",
+    "scipy.ndimage",
+    "scipy.stats",
+    "sklearn.linear_model",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg"
+)
+
+# Déjà chargé par le serveur
+IGNORED = ("streamlit",)
+
+DEFAULT_WORKERS = 4
+
+_STATUS = {"etat": "inactif", "modules": {}, "erreurs": {}, "duree_s": None}
+_THREAD = None
+_LOCK = threading.Lock()
+
+
+# --------------------------------------------------------
+# 1. Modules à précharger
+# --------------------------------------------------------
+
+def script_imports(path):
+    """
+    Modules importés par un script, à tous les niveaux (module, fonctions,
+    branches) : les imports différés sont justement ceux à préchauffer.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.append(node.module)
+    return [m for m in modules if m.split(".")[0] not in IGNORED]
+
+
+def page_modules(root=ROOT):
+    """
+    Modules des pages (pages/*.py), sans doublon, dans l'ordre de découverte,
+    puis les modules d'analyse.
+    """
+    pages_dir = os.path.join(root, "pages")
+    scripts = sorted(f for f in os.listdir(pages_dir) if f.endswith(".py")) if os.path.isdir(pages_dir) else []
+
+    modules = []
+    for name in scripts:
+        modules.extend(script_imports(os.path.join(pages_dir, name)))
+    modules.extend(ANALYSIS_MODULES)
+    return list(dict.fromkeys(modules))
+
+
+# --------------------------------------------------------
+# 2. Préchargement
+# --------------------------------------------------------
+
+def _import(name):
+    start = time.perf_counter()
+    importlib.import_module(name)
+    return time.perf_counter() - start
+
+
+def _warm_matplotlib():
+    """
+    Premier rendu Agg (gestionnaire de polices, caches de texte).
+    """
+    import io
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(2, 1))
+    fig.subplots().plot([0, 1], [0, 1])
+    fig.savefig(io.BytesIO(), format="png")
+
+
+def warm_up(modules=None, workers=DEFAULT_WORKERS, root=ROOT):
+    """
+    Importe les modules dans un pool de threads (lecture des fichiers et
+    extensions C en parallèle). Un import en échec (module absent, import
+    concurrent circulaire) est retenté seul à la fin.
+    Retourne {"modules": {nom : secondes}, "erreurs": {nom : message}}.
+    """
+    modules = list(modules) if modules is not None else page_modules(root)
+    timings, errors = {}, {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool:
+        futures = {name: pool.submit(_import, name) for name in modules}
+        retry = []
+        for name, future in futures.items():
+            try:
+                timings[name] = future.result()
+            except Exception:
+                retry.append(name)
+
+    for name in retry:
+        try:
+            timings[name] = _import(name)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    try:
+        _warm_matplotlib()
+    except Exception as e:
+        errors["matplotlib (rendu)"] = f"{type(e).__name__}: {e}"
+
+    return {"modules": timings, "erreurs": errors}
+
+
+def _run(root, workers):
+    start = time.perf_counter()
+    result = warm_up(workers=workers, root=root)
+    _STATUS.update(result)
+    _STATUS["duree_s"] = round(time.perf_counter() - start, 3)
+    _STATUS["etat"] = "termine"
+
+
+def start_warmup(root=ROOT, workers=DEFAULT_WORKERS):
+    """
+    Lance le préchauffage dans un thread de fond, une seule fois par processus
+    (appelé à chaque exécution de app.py : les appels suivants ne font rien).
+    """
+    global _THREAD
+    with _LOCK:
+        if _THREAD is None:
+            _STATUS["etat"] = "en cours"
+            _THREAD = threading.Thread(target=_run, args=(root, workers), name="warmup", daemon=True)
+            _THREAD.start()
+        return _THREAD
+
+
+def warmup_status():
+    """
+    État du préchauffage : etat, duree_s, nombre de modules, erreurs.
+    """
+    return {
+        "etat": _STATUS["etat"],
+        "duree_s": _STATUS["duree_s"],
+        "modules": len(_STATUS["modules"]),
+        "erreurs": dict(_STATUS["erreurs"])
+    }
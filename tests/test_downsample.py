@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from src.visualization.downsample import downsample_series
+
+
+def test_downsample_tz_aware_index():
+    index = pd.date_range("2024-01-01", periods=20_000, freq="min", tz="Europe/Paris")
+    series = pd.Series(np.sin(np.arange(20_000) / 50), index=index)
+    naive = pd.Series(series.to_numpy(), index=index.tz_convert(None))
+
+    reduced = downsample_series(series, 500, "lttb")
+    expected = downsample_series(naive, 500, "lttb")
+    assert reduced.index.tz is not None
+    assert (reduced.index.tz_convert(None) == expected.index).all()
+
+    window = downsample_series(series, 500, "minmax", xlim=("2024-01-05", "2024-01-06"))
+    assert window.index[0] <= pd.Timestamp("2024-01-05", tz="Europe/Paris") < window.index[1]
+    assert window.index[-2] < pd.Timestamp("2024-01-06", tz="Europe/Paris") <= window.index[-1]
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.model_state import SmoothingState
+from src.models.smoothing_manual import fit_smoothing
+
+
+@pytest.mark.parametrize("model", ["HW Additif", "HW Multiplicatif"])
+def test_forecast_matches_statsmodels(model):
+    rng = np.random.default_rng(0)
+    t = np.arange(40)
+    series = pd.Series(50 + 0.5 * t + 5 * np.sin(2 * np.pi * t / 4) + rng.normal(0, 1, 40))
+    m = 4
+
+    result = fit_smoothing(series, model, 0.3, 0.1, 0.2, m)
+    state = SmoothingState.from_statsmodels(result, model, series)
+    expected = np.asarray(result.forecast(2 * m))
+
+    np.testing.assert_allclose(state.forecast(2 * m).to_numpy(), expected)
+    np.testing.assert_allclose(SmoothingState.from_bytes(state.to_bytes()).forecast(2 * m).to_numpy(), expected)
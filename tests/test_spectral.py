@@ -0,0 +1,22 @@
+import numpy as np
+
+from src.exploration.spectral import detect_periods, detect_seasonal_period
+
+
+def test_detect_periods_two_non_harmonic_seasonalities():
+    # Les saisonnalités 12 et 7 se brouillent dans l'ACF (r[12] < r[13], r[7] < 0)
+    rng = np.random.default_rng(0)
+    t = np.arange(500)
+    x = 10 + 0.05 * t + 3 * np.sin(2 * np.pi * t / 12) + 2 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 1, 500)
+
+    assert [c["periode"] for c in detect_periods(x)] == [12, 7]
+    assert detect_seasonal_period(x) == 12
+
+
+def test_detect_periods_ignores_harmonics_and_noise():
+    rng = np.random.default_rng(1)
+    t = np.arange(520)
+    sawtooth = (t % 52) / 52 + rng.normal(0, 0.05, 520)
+
+    assert [c["periode"] for c in detect_periods(sawtooth)] == [52]
+    assert detect_periods(rng.normal(size=300)) == []